@@ -0,0 +1,4 @@
+# ===============================
+# KkomDae Diagnostics 공용 모듈
+# ===============================
+# kkomdae_port*.py 스크립트들이 함께 사용하는 헬퍼 모듈을 모아둔 패키지입니다.
@@ -0,0 +1,131 @@
+# ===============================
+# 렌더링된 텍스트/아이콘 이미지 캐시
+# ===============================
+# 타이틀 텍스트 이미지와 아이콘(리사이즈 + 채도 제거)은 매 실행마다 결과가 같으므로
+# 완성된 RGBA 비트맵을 디스크에 저장해 두고, 다음 실행부터는 픽셀만 읽어옵니다.
+# 캐시 키에는 텍스트, 폰트 경로, 크기, 색상 등 렌더링 인자와 원본 파일(폰트/PNG)의
+# 해시가 포함되므로 원본이 바뀌면 자동으로 다시 렌더링됩니다.
+import hashlib
+import os
+import struct
+from collections import OrderedDict
+
+import PIL
+from PIL import Image, ImageFont
+
+from kkomdae.paths import user_cache_dir
+
+# 렌더링 방식이 바뀌면 값을 올려 기존 캐시를 무효화합니다.
+CACHE_VERSION = 1
+
+# 캐시 파일 헤더: 매직, 너비, 높이 (이후 RGBA 원시 픽셀)
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"KKAC"
+
+
+class AssetCache:
+    """
+    ImageFont 객체의 프로세스 내 LRU 와, 완성된 RGBA 비트맵의 디스크 저장소를 관리합니다.
+    """
+
+    def __init__(self, directory: str = None, max_fonts: int = 16):
+        self.directory = directory or user_cache_dir("assets")
+        self.max_fonts = max_fonts
+        self._fonts = OrderedDict()
+        self._digests = {}
+
+    # -------------------------------
+    # 폰트 LRU
+    # -------------------------------
+    def load_font(self, font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+        """
+        ImageFont.truetype 결과를 LRU 로 캐시해 반환합니다.
+        폰트를 열 수 없으면 ImageFont.truetype 과 동일하게 IOError 를 발생시킵니다.
+        """
+        key = (font_path, font_size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            return font
+        font = ImageFont.truetype(font_path, font_size)
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    # -------------------------------
+    # 원본 파일 해시
+    # -------------------------------
+    def file_digest(self, path: str) -> str:
+        """
+        원본 파일 내용의 해시를 반환합니다. (파일이 없으면 "missing")
+        같은 프로세스에서는 경로/크기/수정 시각이 같으면 다시 읽지 않습니다.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "missing"
+        stamp = (path, st.st_size, st.st_mtime_ns)
+        digest = self._digests.get(stamp)
+        if digest is None:
+            h = hashlib.sha1()
+            try:
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b""):
+                        h.update(chunk)
+            except OSError:
+                return "missing"
+            digest = h.hexdigest()
+            self._digests[stamp] = digest
+        return digest
+
+    # -------------------------------
+    # 비트맵 저장소
+    # -------------------------------
+    def get_or_render(self, kind: str, params: tuple, sources: tuple, render) -> Image.Image:
+        """
+        캐시에 저장된 RGBA 이미지를 반환하고, 없으면 render() 결과를 저장 후 반환합니다.
+        kind: 이미지 종류("text", "icon" 등), params: 렌더링 인자, sources: 원본 파일 경로들
+        """
+        key = self._make_key(kind, params, sources)
+        path = os.path.join(self.directory, key + ".rgba")
+        image = self._load(path)
+        if image is None:
+            image = render().convert("RGBA")
+            self._store(path, image)
+        return image
+
+    def _make_key(self, kind: str, params: tuple, sources: tuple) -> str:
+        digests = tuple(self.file_digest(src) for src in sources)
+        raw = repr((CACHE_VERSION, PIL.__version__, kind, params, sources, digests))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _load(path: str):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, width, height = _HEADER.unpack_from(data)
+        if magic != _MAGIC or len(data) != _HEADER.size + width * height * 4:
+            return None
+        pixels = memoryview(data)[_HEADER.size:]
+        return Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+
+    def _store(self, path: str, image: Image.Image) -> None:
+        # 캐시 쓰기 실패는 렌더링 결과에 영향을 주지 않으므로 무시합니다.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, image.width, image.height))
+                f.write(image.tobytes("raw", "RGBA"))
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,170 @@
+# ===============================
+# 카메라 처리량 벤치마크
+# ===============================
+# 카메라 상태를 사람의 인상 대신 숫자로 남깁니다. 고정된 측정 구간(window) 동안
+#   - VideoCapture 를 여는 데 걸린 시간 (open_ms)
+#   - 연 뒤 첫 프레임까지의 시간 (first_frame_ms)
+#   - 실제로 받은 FPS, 프레임 간격 분포(히스토그램, p50/p95/p99, 표준편차 = 지터)
+#   - 놓친 프레임 수: 공칭 FPS 간격의 1.5배를 넘는 빈틈으로 추정한 값(gap_dropped)과
+#     캡처는 했지만 화면에 표시되기 전에 덮어쓰인 값(ring_dropped)
+# 을 기록해 JSON 으로 내보냅니다. 프레임 공급원은 kkomdae.frame_sources 의 지정 문자열을 따르므로
+# 영상 파일이나 합성 프레임으로도 같은 벤치마크를 실행할 수 있습니다.
+#
+# 사용 예) python -m kkomdae.camera_bench --source synthetic:1280x720@30 --seconds 5 --output bench.json
+import argparse
+import json
+import time
+
+from kkomdae.camera_capture import CaptureThread
+from kkomdae.frame_sources import describe_capture, open_frame_source
+from kkomdae.lazy import cv2, np
+
+DEFAULT_WINDOW_S = 5.0
+# 프레임 간격 히스토그램 구간 경계 (ms)
+INTERVAL_EDGES_MS = (0, 8, 16, 25, 33, 42, 50, 67, 100, 200)
+# 측정 구간 동안 기록할 수 있는 최대 FPS (frame_times 배열 크기 계산용)
+MAX_FPS = 240
+FIRST_FRAME_TIMEOUT_S = 10.0
+
+
+def summarize_frame_times(times, window_s: float = None, nominal_fps: float = None) -> dict:
+    """
+    프레임 발행 시각 배열(초)로 FPS, 간격 통계, 히스토그램, 추정 누락 수를 계산합니다.
+    window_s 를 주면 첫 프레임부터 그 구간 안의 프레임만 사용합니다.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if window_s is not None and len(times):
+        times = times[times <= times[0] + window_s]
+    if len(times) < 2:
+        return {"frames": int(len(times)), "fps": None}
+    intervals = np.diff(times) * 1000.0
+    if not nominal_fps or nominal_fps <= 0:
+        nominal_fps = 1000.0 / float(np.median(intervals))
+    period_ms = 1000.0 / nominal_fps
+    gaps = intervals[intervals > period_ms * 1.5]
+    edges = np.asarray(INTERVAL_EDGES_MS + (np.inf,), dtype=np.float64)
+    counts, _ = np.histogram(intervals, bins=edges)
+    labels = [f"{low}-{high}ms" for low, high in zip(INTERVAL_EDGES_MS, INTERVAL_EDGES_MS[1:])]
+    labels.append(f"{INTERVAL_EDGES_MS[-1]}ms+")
+    p50, p95, p99 = np.percentile(intervals, (50, 95, 99))
+    return {
+        "frames": int(len(times)),
+        "duration_s": round(float(times[-1] - times[0]), 3),
+        "fps": round((len(times) - 1) / float(times[-1] - times[0]), 2),
+        "nominal_fps": round(float(nominal_fps), 2),
+        "interval_ms": {
+            "mean": round(float(intervals.mean()), 2),
+            "p50": round(float(p50), 2),
+            "p95": round(float(p95), 2),
+            "p99": round(float(p99), 2),
+            "max": round(float(intervals.max()), 2),
+            "jitter": round(float(intervals.std()), 2),
+        },
+        "histogram": dict(zip(labels, (int(c) for c in counts))),
+        "gap_dropped": int(np.round(gaps / period_ms).sum() - len(gaps)),
+    }
+
+
+class CameraBenchmark:
+    """
+    공급원 열기 시간, 첫 프레임 시간, 측정 구간의 프레임 시각을 기록합니다.
+    open() -> start() 로 CaptureThread 를 만들고, 끝나면 report() 로 결과를 얻습니다.
+    """
+
+    def __init__(self, source="0", window_s: float = DEFAULT_WINDOW_S):
+        self.source = str(source)
+        self.window_s = window_s
+        self.frame_times = np.zeros(int(window_s * MAX_FPS) + 16, dtype=np.float64)
+        self.open_s = None
+        self.opened = False
+        self.opened_at = None
+        self.nominal_fps = None
+        self.format = None
+        self.cap = None
+        self.capture = None
+
+    def open(self, backend: int = None, config=None):
+        start = time.perf_counter()
+        self.cap = open_frame_source(self.source, backend, config)
+        self.opened_at = time.perf_counter()
+        self.open_s = self.opened_at - start
+        self.opened = bool(self.cap.isOpened())
+        return self.cap
+
+    def start(self, cap=None) -> CaptureThread:
+        cap = cap or self.cap
+        # 공칭 FPS 와 협상된 형식은 release() 전에 읽어 둡니다.
+        self.nominal_fps = cap.get(cv2.CAP_PROP_FPS)
+        self.format = describe_capture(cap)
+        self.capture = CaptureThread(cap, frame_times=self.frame_times)
+        self.capture.start()
+        return self.capture
+
+    @property
+    def window_elapsed(self) -> bool:
+        first = self.capture.first_frame_at if self.capture is not None else None
+        return first is not None and time.perf_counter() - first >= self.window_s
+
+    def report(self) -> dict:
+        capture = self.capture
+        result = {
+            "source": self.source,
+            "window_s": self.window_s,
+            "opened": self.opened,
+            "open_ms": round(self.open_s * 1000.0, 1) if self.open_s is not None else None,
+            "first_frame_ms": None,
+            "format": self.format,
+        }
+        if capture is None:
+            return result
+        if capture.first_frame_at is not None:
+            result["first_frame_ms"] = round((capture.first_frame_at - self.opened_at) * 1000.0, 1)
+        recorded = min(capture.captured, len(self.frame_times))
+        summary = summarize_frame_times(self.frame_times[:recorded], self.window_s, self.nominal_fps)
+        result.update(summary)
+        result["complete"] = summary.get("duration_s") is not None and \
+            summary["duration_s"] >= self.window_s * 0.95
+        stats = capture.stats()
+        result["ring_dropped"] = stats["dropped"]
+        result["read_failures"] = stats["read_failures"]
+        result["error"] = capture.error
+        return result
+
+
+def run_benchmark(source="0", window_s: float = DEFAULT_WINDOW_S, display_interval_ms: float = 16.0,
+                  backend: int = None, config=None, first_frame_timeout_s: float = FIRST_FRAME_TIMEOUT_S) -> dict:
+    """
+    미리보기 없이 벤치마크만 실행합니다. 읽는 쪽은 카메라 테스트의 화면 갱신 주기로 최신 프레임을 가져갑니다.
+    """
+    bench = CameraBenchmark(source, window_s)
+    cap = bench.open(backend, config)
+    if not cap.isOpened():
+        return bench.report()
+    capture = bench.start()
+    try:
+        if capture.wait_ready(first_frame_timeout_s) and capture.error is None:
+            while not bench.window_elapsed and capture.running:
+                capture.latest()
+                time.sleep(display_interval_ms / 1000.0)
+    finally:
+        capture.close()
+    return bench.report()
+
+
+def write_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="카메라 처리량 벤치마크 (열기 시간, FPS, 프레임 간격, 누락)")
+    parser.add_argument("--source", default="0",
+                        help="카메라 번호, 영상 파일 경로 또는 synthetic:WxH@FPS (기본: 0)")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_WINDOW_S, help="측정 구간(초)")
+    parser.add_argument("--output", metavar="PATH", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.source, args.seconds)
+    if args.output:
+        write_report(report, args.output)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
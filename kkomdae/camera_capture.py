@@ -0,0 +1,181 @@
+# ===============================
+# 카메라 캡처 스레드 / 프레임 링 버퍼
+# ===============================
+# cap.read() 를 Tk 메인 스레드에서 호출하면 느린 카메라가 GUI 전체를 멈추게 합니다.
+# 캡처 스레드가 미리 할당한 고정 개수의 프레임 버퍼(FrameRing)에 cap.read(image=버퍼)로 읽어 넣고,
+# 화면 쪽은 화면 갱신 주기마다 가장 최근 프레임만 가져갑니다.
+# 화면에 한 번도 표시되지 못하고 덮어쓰인 프레임은 dropped 로 셉니다.
+# cap.release() 는 캡처 스레드가 끝날 때 스레드 안에서 호출합니다.
+# (cap.read() 에 묶인 스레드와 다른 스레드의 release() 가 겹치면 네이티브 백엔드가 죽을 수 있음)
+import threading
+import time
+
+from kkomdae.lazy import np
+
+DEFAULT_RING_SLOTS = 3
+# 연속으로 이만큼 읽기에 실패하면 캡처를 중단하고 오류로 처리합니다.
+MAX_READ_FAILURES = 30
+
+
+class FrameRing:
+    """
+    미리 할당한 프레임 버퍼 링입니다. (작성자 1, 읽는 쪽 1)
+    작성자는 읽는 쪽이 보고 있는 슬롯과 최신 슬롯을 피해 다음 슬롯에 쓰므로 slots 는 3 이상이어야 합니다.
+    """
+
+    def __init__(self, shape, dtype="uint8", slots: int = DEFAULT_RING_SLOTS):
+        if slots < 3:
+            raise ValueError("FrameRing 은 슬롯이 3개 이상 필요합니다.")
+        self.buffers = [np.empty(shape, dtype=dtype) for _ in range(slots)]
+        self.timestamps = [0.0] * slots
+        self._lock = threading.Lock()
+        self._latest = -1
+        self._reading = -1
+        self._next = 0
+        # 지금까지 발행(commit)된 프레임 수와 읽는 쪽이 마지막으로 가져간 번호
+        self.sequence = 0
+        self._consumed = 0
+        self.dropped = 0
+
+    def acquire(self) -> int:
+        """
+        다음에 쓸 슬롯 번호를 반환합니다.
+        """
+        with self._lock:
+            index = self._next
+            while index == self._latest or index == self._reading:
+                index = (index + 1) % len(self.buffers)
+            self._next = (index + 1) % len(self.buffers)
+            return index
+
+    def commit(self, index: int, timestamp: float) -> None:
+        """
+        슬롯에 쓴 프레임을 최신 프레임으로 발행합니다.
+        """
+        with self._lock:
+            self.timestamps[index] = timestamp
+            self._latest = index
+            self.sequence += 1
+
+    def latest(self):
+        """
+        새 프레임이 있으면 (순번, 프레임, timestamp) 를 반환하고 없으면 None.
+        반환한 프레임 버퍼는 다음 latest() 호출 전까지 덮어쓰이지 않습니다.
+        """
+        with self._lock:
+            if self.sequence == self._consumed:
+                return None
+            self.dropped += self.sequence - self._consumed - 1
+            self._consumed = self.sequence
+            self._reading = self._latest
+            return self.sequence, self.buffers[self._latest], self.timestamps[self._latest]
+
+
+class CaptureThread:
+    """
+    cv2.VideoCapture 를 별도 스레드에서 읽어 FrameRing 에 넣습니다.
+    링은 첫 프레임의 크기로 생성합니다. (카메라마다 해상도가 다르므로)
+    frame_times 에 미리 할당한 float 배열을 넘기면 프레임마다 발행 시각을 앞에서부터 채웁니다. (벤치마크용)
+    cap 은 이 객체가 소유하며, 다 쓴 뒤에는 cap.release() 대신 close() 를 호출합니다.
+    """
+
+    def __init__(self, cap, slots: int = DEFAULT_RING_SLOTS, frame_times=None):
+        self.cap = cap
+        self.slots = slots
+        self.frame_times = frame_times
+        self.ring = None
+        self.captured = 0
+        self.first_frame_at = None
+        self.read_failures = 0
+        self.error = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="kkomdae-camera", daemon=True)
+        self._started_at = None
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """
+        캡처 스레드를 멈추고, timeout 안에 끝났으면 True 를 반환합니다.
+        """
+        self._stop.set()
+        if self._started_at is not None:
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def close(self, timeout: float = 1.0) -> bool:
+        """
+        캡처 스레드를 멈추고 cap 을 해제합니다.
+        스레드가 아직 cap.read() 에서 돌아오지 않았으면 해제는 스레드가 끝날 때 스레드가 합니다.
+        """
+        exited = self.stop(timeout)
+        if self._started_at is None:
+            self.cap.release()
+        return exited
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """
+        첫 프레임을 받을 때까지(또는 실패할 때까지) 기다립니다.
+        """
+        return self._ready.wait(timeout)
+
+    def latest(self):
+        return self.ring.latest() if self.ring is not None else None
+
+    def stats(self) -> dict:
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            "captured": self.captured,
+            "dropped": self.ring.dropped if self.ring is not None else 0,
+            "read_failures": self.read_failures,
+            "capture_fps": round(self.captured / elapsed, 1) if elapsed > 0 else None,
+        }
+
+    def _run(self) -> None:
+        cap = self.cap
+        failures = 0
+        try:
+            while not self._stop.is_set():
+                ring = self.ring
+                if ring is None:
+                    ok, frame = cap.read()
+                    if ok:
+                        self.ring = ring = FrameRing(frame.shape, frame.dtype, self.slots)
+                        index = ring.acquire()
+                        np.copyto(ring.buffers[index], frame)
+                else:
+                    index = ring.acquire()
+                    slot = ring.buffers[index]
+                    ok, frame = cap.read(image=slot)
+                    if ok and frame is not slot:
+                        # 백엔드가 새 배열을 돌려준 경우 (형식이 바뀐 경우 등)
+                        if frame.shape != slot.shape:
+                            self.ring = None
+                            continue
+                        np.copyto(slot, frame)
+                if not ok:
+                    failures += 1
+                    self.read_failures += 1
+                    if failures >= MAX_READ_FAILURES:
+                        self.error = "카메라 프레임을 읽을 수 없습니다."
+                        return
+                    continue
+                failures = 0
+                now = time.perf_counter()
+                ring.commit(index, now)
+                if self.first_frame_at is None:
+                    self.first_frame_at = now
+                if self.frame_times is not None and self.captured < len(self.frame_times):
+                    self.frame_times[self.captured] = now
+                self.captured += 1
+                self._ready.set()
+        finally:
+            self._ready.set()
+            cap.release()
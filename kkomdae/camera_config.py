@@ -0,0 +1,231 @@
+# ===============================
+# 노트북 모델별 카메라 열기 설정 캐시
+# ===============================
+# 카메라를 항상 cv2.VideoCapture(0, cv2.CAP_DSHOW) 기본 해상도/형식으로 열면
+# 일부 모델은 DirectShow 열기에만 몇 초가 걸리고, 고해상도 YUY2(비압축)는 USB 대역폭과 변환 시간을 낭비합니다.
+# 처음 한 번 후보 백엔드 x FOURCC(YUY2 / MJPG) x 해상도 조합을 짧게 벤치마크해
+# 쓸 만한 설정을 모델별로 캐시 파일에 저장하고, 이후 실행은 그 설정으로 바로 엽니다.
+#
+# 후보는 선호 순서대로 측정하고, 첫 프레임을 받고 MIN_PROBE_FPS 이상이 나오는 첫 조합에서 멈춥니다.
+# 비압축(YUY2) 640x480 을 먼저 시도합니다. USB 2.0 에서도 30fps 가 나오고, 불량 화소 검사는
+# 압축(MJPG) 프레임에서는 검증할 수 없기 때문입니다. (kkomdae.camera_defects)
+# 측정 중 첫 프레임은 PROBE_FIRST_FRAME_TIMEOUT_S 까지만 기다립니다.
+# 카메라는 열리지만 MIN_PROBE_FPS 를 넘는 조합이 없으면 "기본 설정 사용"(FALLBACK)을
+# FALLBACK_TTL_S 동안 캐시해, 그 사이에는 실행할 때마다 다시 측정하지 않습니다.
+#
+# 캐시 파일 위치: KKOMDAE_CAMERA_CACHE 환경 변수(또는 --camera-cache) > 실행 파일 옆(쓸 수 있을 때)
+#                > 사용자별 캐시 디렉터리. 실행 파일 옆에 두면 같은 모델의 다른 기기는 측정 없이 바로 엽니다.
+# 여러 기기가 동시에 저장하면 한쪽 항목이 빠질 수 있지만, 그 모델은 다음 실행에서 다시 측정할 뿐입니다.
+#
+# 사용 예) python -m kkomdae.camera_config --probe      # 다시 측정해 캐시 갱신
+#          python -m kkomdae.camera_config --probe --all   # 모든 후보를 측정해 비교
+#          python -m kkomdae.camera_config --show       # 이 모델의 캐시된 설정 확인
+import argparse
+import json
+import os
+import sys
+import time
+
+from kkomdae.camera_bench import run_benchmark
+from kkomdae.frame_sources import CameraConfig
+from kkomdae.machine import machine_model
+from kkomdae.paths import app_dir, user_cache_dir
+
+# 측정 방식이나 후보가 바뀌면 값을 올려 기존 캐시를 무효화합니다.
+CACHE_VERSION = 3
+CACHE_FILE_NAME = "camera_config.json"
+CACHE_PATH_ENV = "KKOMDAE_CAMERA_CACHE"
+# 쓸 수 있는 설정이 없을 때 캐시하는 값 (기본 설정으로 열기)
+FALLBACK = "fallback"
+FALLBACK_TTL_S = 24 * 60 * 60
+
+if sys.platform == "win32":
+    CANDIDATE_BACKENDS = ("MSMF", "DSHOW")
+else:
+    CANDIDATE_BACKENDS = ("V4L2", "ANY")
+CANDIDATE_FOURCCS = ("YUY2", "MJPG")
+CANDIDATE_RESOLUTIONS = ((640, 480), (1280, 720))
+PROBE_WINDOW_S = 1.5
+PROBE_FIRST_FRAME_TIMEOUT_S = 3.0
+MIN_PROBE_FPS = 15.0
+
+
+def default_cache_path() -> str:
+    path = os.environ.get(CACHE_PATH_ENV)
+    if path:
+        return path
+    shared = app_dir(CACHE_FILE_NAME)
+    if os.access(os.path.dirname(shared), os.W_OK):
+        return shared
+    return user_cache_dir(CACHE_FILE_NAME)
+
+
+def candidate_configs(backends=CANDIDATE_BACKENDS, resolutions=CANDIDATE_RESOLUTIONS,
+                      fourccs=CANDIDATE_FOURCCS):
+    """
+    선호 순서대로 나열한 후보 설정. (백엔드 > FOURCC > 해상도)
+    """
+    return [CameraConfig(backend, width, height, fourcc)
+            for backend in backends for fourcc in fourccs for width, height in resolutions]
+
+
+def usable(report: dict) -> bool:
+    """
+    열리고 첫 프레임을 받았으며 MIN_PROBE_FPS 이상이 나온 측정 결과인지.
+    """
+    if not report.get("opened") or report.get("first_frame_ms") is None or report.get("error"):
+        return False
+    return (report.get("fps") or 0.0) >= MIN_PROBE_FPS
+
+
+def choose_config(results):
+    """
+    [(CameraConfig, 벤치마크 결과)] 에서 쓸 수 있는 설정 중 가장 빨리 첫 프레임을 받는 설정을 고릅니다.
+    쓸 수 있는 설정이 없으면 None.
+    """
+    best_key, best = None, None
+    for config, report in results:
+        if not usable(report):
+            continue
+        key = (report["open_ms"] + report["first_frame_ms"], -report["fps"])
+        if best_key is None or key < best_key:
+            best_key, best = key, config
+    return best
+
+
+def probe_camera(index: int = 0, candidates=None, window_s: float = PROBE_WINDOW_S, measure=run_benchmark,
+                 stop_early: bool = True):
+    """
+    후보 설정을 순서대로 window_s 동안 벤치마크해 (고른 설정, [(설정, 결과)]) 를 반환합니다.
+    stop_early 이면 쓸 수 있는 첫 설정에서 멈추고, 아니면 모든 후보를 측정해 가장 빠른 설정을 고릅니다.
+    """
+    results = []
+    for config in candidates or candidate_configs():
+        report = measure(str(index), window_s, config=config, first_frame_timeout_s=PROBE_FIRST_FRAME_TIMEOUT_S)
+        results.append((config, report))
+        if stop_early and usable(report):
+            break
+    return choose_config(results), results
+
+
+class CameraConfigCache:
+    """
+    {"모델|카메라 번호": {"version", "config", "probed_at", "fps", "open_ms"}} 형태의 JSON 캐시입니다.
+    쓸 수 있는 설정이 없었던 경우는 config 가 null 이고 expires_at(epoch 초)까지 유효합니다.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or default_cache_path()
+
+    @staticmethod
+    def key(model: str, index: int) -> str:
+        return f"{model or 'unknown'}|{index}"
+
+    def _load_all(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _store_all(self, data: dict) -> None:
+        # 캐시 쓰기 실패는 카메라 테스트에 영향을 주지 않으므로 무시합니다.
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, model: str, index: int = 0, now: float = None):
+        """
+        캐시된 CameraConfig, 기본 설정을 쓰라는 FALLBACK, 또는 (없거나 만료되면) None.
+        """
+        entry = self._load_all().get(self.key(model, index))
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+            return None
+        if entry.get("config") is None:
+            expires_at = entry.get("expires_at")
+            now = time.time() if now is None else now
+            return FALLBACK if isinstance(expires_at, (int, float)) and now < expires_at else None
+        try:
+            return CameraConfig(*entry["config"])
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, model: str, index: int, config: CameraConfig, report: dict = None) -> None:
+        data = self._load_all()
+        report = report or {}
+        data[self.key(model, index)] = {
+            "version": CACHE_VERSION,
+            "config": list(config),
+            "probed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "fps": report.get("fps"),
+            "open_ms": report.get("open_ms"),
+        }
+        self._store_all(data)
+
+    def put_fallback(self, model: str, index: int, ttl_s: float = FALLBACK_TTL_S) -> None:
+        data = self._load_all()
+        data[self.key(model, index)] = {
+            "version": CACHE_VERSION,
+            "config": None,
+            "probed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "expires_at": time.time() + ttl_s,
+        }
+        self._store_all(data)
+
+    def forget(self, model: str, index: int = 0) -> None:
+        data = self._load_all()
+        if data.pop(self.key(model, index), None) is not None:
+            self._store_all(data)
+
+
+def probe_and_cache(index: int = 0, cache: CameraConfigCache = None, model: str = None,
+                    stop_early: bool = True):
+    """
+    후보 설정을 측정해 가장 좋은 설정을 캐시에 저장하고 (설정, [(설정, 결과)]) 를 반환합니다.
+    카메라는 열렸지만 쓸 수 있는 설정이 없으면 FALLBACK 을 캐시합니다.
+    (아무 설정으로도 열리지 않으면 카메라가 없는 것일 수 있으므로 캐시하지 않습니다.)
+    """
+    cache = cache or CameraConfigCache()
+    model = machine_model() if model is None else model
+    best, results = probe_camera(index, stop_early=stop_early)
+    if best is not None:
+        cache.put(model, index, best, dict(results)[best])
+    elif any(report.get("opened") for _, report in results):
+        cache.put_fallback(model, index)
+    return best, results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="노트북 모델별 카메라 설정 측정 / 캐시")
+    parser.add_argument("--camera", type=int, default=0, help="카메라 번호")
+    parser.add_argument("--cache", default=None, metavar="PATH",
+                        help=f"캐시 파일 경로 (기본: {CACHE_PATH_ENV} 환경 변수 > 실행 파일 옆 > 사용자 캐시)")
+    parser.add_argument("--all", action="store_true", help="--probe 에서 쓸 수 있는 설정을 찾아도 모든 후보를 측정")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--probe", action="store_true", help="후보 설정을 측정해 캐시를 갱신")
+    group.add_argument("--show", action="store_true", help="캐시된 설정 출력")
+    group.add_argument("--forget", action="store_true", help="이 모델의 캐시 삭제")
+    args = parser.parse_args()
+
+    model = machine_model()
+    cache = CameraConfigCache(args.cache)
+    if args.probe:
+        best, results = probe_and_cache(args.camera, cache, model, stop_early=not args.all)
+        for config, report in results:
+            print(f"{'/'.join(map(str, config)):<22} opened={report.get('opened')} "
+                  f"open={report.get('open_ms')}ms first={report.get('first_frame_ms')}ms "
+                  f"fps={report.get('fps')} format={report.get('format')}")
+        print(f"선택: {best}")
+    elif args.show:
+        print(f"{model or 'unknown'}: {cache.get(model, args.camera)} ({cache.path})")
+    else:
+        cache.forget(model, args.camera)
@@ -0,0 +1,179 @@
+# ===============================
+# 카메라 미리보기 (Tk 내장 / HighGUI)
+# ===============================
+# HighGUI 창(cv2.imshow)은 Tk 와 별도의 이벤트 루프를 돌리고, 메인 창 뒤로 숨는 경우가 많습니다.
+# TkFramePresenter 는 TestApp 의 Toplevel 안에 미리보기를 그립니다.
+#   - cv2.resize / cv2.cvtColor 에 dst 버퍼를 넘겨 축소와 BGR -> RGBA 변환을 재사용 버퍼에서 처리하고
+#   - Image.frombuffer 로 그 버퍼를 복사 없이 감싸 하나의 PhotoImage 에 paste 합니다.
+#     (PIL 은 "RGB" 버퍼는 복사하고 "RGBA" 버퍼만 메모리를 공유하므로 4채널로 변환합니다.)
+# HighGuiPresenter 는 기존 방식이며, 두 방식의 FPS / 프레임당 CPU 시간을 비교할 수 있습니다.
+#
+# 사용 예) python -m kkomdae.camera_preview --seconds 5 [--camera 0]   # 두 방식 비교
+import argparse
+import time
+
+from PIL import Image, ImageTk
+
+from kkomdae.lazy import cv2, np
+
+PREVIEW_SIZE = (640, 480)
+
+
+class PresenterStats:
+    """
+    표시한 프레임 수, 표시에 든 CPU 시간(메인 스레드)과 경과 시간을 누적합니다.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.cpu_s = 0.0
+        self.started_at = time.perf_counter()
+
+    def add(self, cpu_s: float) -> None:
+        self.frames += 1
+        self.cpu_s += cpu_s
+
+    def as_dict(self) -> dict:
+        elapsed = time.perf_counter() - self.started_at
+        return {
+            "frames": self.frames,
+            "fps": round(self.frames / elapsed, 1) if elapsed > 0 else None,
+            "cpu_ms_per_frame": round(self.cpu_s / self.frames * 1000, 3) if self.frames else None,
+        }
+
+
+class TkFramePresenter:
+    """
+    Tk 위젯(Label 등)에 프레임을 표시합니다. 버퍼와 PhotoImage 는 프레임 크기가 바뀔 때만 새로 만듭니다.
+    """
+    name = "tk"
+
+    def __init__(self, widget, max_size=PREVIEW_SIZE):
+        self.widget = widget
+        self.max_size = max_size
+        self.stats = PresenterStats()
+        self._source_shape = None
+        self._small = None
+        self._rgba = None
+        self._image = None
+        self._photo = None
+
+    def _allocate(self, shape) -> None:
+        height, width = shape[:2]
+        scale = min(self.max_size[0] / width, self.max_size[1] / height, 1.0)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        self._source_shape = shape
+        self._size = size
+        self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self._rgba = np.empty((size[1], size[0], 4), dtype=np.uint8)
+        # _rgba 메모리를 그대로 보는 PIL 이미지 (복사 없음)
+        self._image = Image.frombuffer("RGBA", size, self._rgba, "raw", "RGBA", 0, 1)
+        self._photo = ImageTk.PhotoImage("RGBA", size)
+        self.widget.configure(image=self._photo)
+
+    def show(self, frame) -> None:
+        start = time.thread_time()
+        if frame.shape != self._source_shape:
+            self._allocate(frame.shape)
+        if self._size == (frame.shape[1], frame.shape[0]):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA, dst=self._rgba)
+        else:
+            cv2.resize(frame, self._size, dst=self._small, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._small, cv2.COLOR_BGR2RGBA, dst=self._rgba)
+        self._photo.paste(self._image)
+        self.stats.add(time.thread_time() - start)
+
+    def pump(self) -> bool:
+        """
+        창이 열려 있으면 True. (Tk 이벤트는 mainloop 가 처리)
+        """
+        return bool(self.widget.winfo_exists())
+
+    def close(self) -> None:
+        self._photo = None
+
+
+class HighGuiPresenter:
+    """
+    기존 방식: OpenCV HighGUI 창에 표시합니다. (cv2.waitKey 로 창 이벤트 처리)
+    """
+    name = "highgui"
+
+    def __init__(self, window_name: str = "Camera Test - X to exit"):
+        self.window_name = window_name
+        self.stats = PresenterStats()
+        cv2.namedWindow(window_name)
+
+    def show(self, frame) -> None:
+        start = time.thread_time()
+        cv2.imshow(self.window_name, frame)
+        self.stats.add(time.thread_time() - start)
+
+    def pump(self) -> bool:
+        """
+        HighGUI 이벤트를 처리하고, ESC 를 누르거나 창을 닫았으면 False 를 반환합니다.
+        """
+        key = cv2.waitKey(1) & 0xFF
+        return key != 27 and cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) >= 1
+
+    def close(self) -> None:
+        cv2.destroyWindow(self.window_name)
+
+
+# ===============================
+# 두 방식 비교
+# ===============================
+def compare(seconds: float = 5.0, camera: int = None, size=(1280, 720)) -> dict:
+    """
+    같은 프레임 공급원으로 두 방식을 차례로 seconds 동안 실행해 FPS 와 프레임당 CPU 시간을 비교합니다.
+    camera 를 지정하지 않으면 합성 프레임(무작위 노이즈)을 사용합니다.
+    """
+    import tkinter
+
+    if camera is not None:
+        cap = cv2.VideoCapture(camera)
+        read = cap.read
+    else:
+        frames = [np.random.default_rng(i).integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+                  for i in range(4)]
+        counter = iter(range(1 << 62))
+
+        def read():
+            return True, frames[next(counter) % len(frames)]
+
+    results = {}
+    root = tkinter.Tk()
+    for presenter_type in ("tk", "highgui"):
+        window = None
+        if presenter_type == "tk":
+            window = tkinter.Toplevel(root)
+            label = tkinter.Label(window)
+            label.pack()
+            presenter = TkFramePresenter(label)
+        else:
+            presenter = HighGuiPresenter("camera_preview benchmark")
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            ok, frame = read()
+            if ok:
+                presenter.show(frame)
+            presenter.pump()
+            root.update()
+        results[presenter_type] = presenter.stats.as_dict()
+        presenter.close()
+        if window is not None:
+            window.destroy()
+    root.destroy()
+    if camera is not None:
+        cap.release()
+    return results
+
+
+if __name__ == "__main__":
+    import json
+
+    parser = argparse.ArgumentParser(description="카메라 미리보기 방식 비교 (Tk 내장 / HighGUI)")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--camera", type=int, default=None, help="카메라 번호 (생략 시 합성 프레임)")
+    args = parser.parse_args()
+    print(json.dumps(compare(args.seconds, args.camera), indent=2))
@@ -0,0 +1,272 @@
+# ===============================
+# 카메라 화질 자동 판정
+# ===============================
+# 카메라 창을 닫기만 하면 통과하던 것을, 미리보기 중 일정 간격(SAMPLE_INTERVAL_S)으로 프레임을 골라
+# 아래 지표를 계산한 뒤 중앙값으로 통과/실패와 사유를 판정합니다.
+#   - 평균 밝기(luminance): 렌즈 가림 / 과노출
+#   - 대비(contrast): 밝기 표준편차. 흰 벽처럼 너무 단조로운 장면은 초점을 판정할 수 없습니다.
+#   - 초점(focus): 라플라시안 분산에서 노이즈 몫(20 * sigma^2)을 뺀 값(sharpness)을 대비^2 으로 나눈 값
+#     (초점 불량 / 렌즈 오염). 라플라시안 분산은 장면 대비의 제곱에 비례하므로, 나누지 않으면
+#     어두운 방이나 얼굴처럼 대비가 낮은 장면을 초점 불량으로 잘못 판정합니다.
+#   - 색 틀어짐(cast): 채널 평균 / 전체 평균 - 1 (gray-world 가정, B/G/R 순서)
+#   - 노이즈: 밝기 채널에서 Immerkær 3x3 커널 응답의 중앙값으로 추정한 sigma (모서리 영향이 적도록 중앙값 사용)
+# 분석은 프레임을 일정 간격으로 솎아낸(stride) 작은 격자에서 numpy 배열 연산으로만 수행합니다.
+# (평균으로 축소하면 노이즈와 선명도가 함께 뭉개지므로 화소를 그대로 골라냅니다.)
+#
+# 아래 기준값의 근거는 실제 웹캠 영상이 아니라, 책상/얼굴/벽을 흉내 낸 합성 장면에 카메라 처리
+# (광학 블러, ISP 노이즈 제거, MJPG 압축)와 어두운 방(노출 0.4~0.45배)을 시뮬레이션해 얻은 값입니다.
+#   초점이 맞은 장면(블러 sigma <= 1.5px)   focus 0.103 ~ 0.226
+#   초점이 흐린 장면(블러 sigma >= 3px)     focus 0.026 ~ 0.070
+#   흰 벽 contrast 4.9, 어두운 방의 얼굴 contrast 9.0
+# 대비가 낮은 어두운 장면은 남은 노이즈와 압축 잡음이 라플라시안을 채워 흐린 영상도 focus 가 높게 나오므로
+# (어두운 방의 흐린 얼굴 0.139) min_contrast 미만은 초점 불량이 아니라 "판정 불가"로 안내합니다.
+# 실제 웹캠으로는 아직 검증하지 않았으므로, 새 기종을 검사대에 들이기 전에 반드시 그 카메라로 초점이 맞은
+# 장면과 흐린 장면을 녹화(--record)하고 --video 로 지표를 확인해 --thresholds 로 기준을 맞춰야 합니다.
+#
+# 사용 예) python -m kkomdae.camera_quality --synthetic                    # 합성 프레임으로 판정 확인
+#          python -m kkomdae.camera_quality --record 벽.avi --seconds 5     # 카메라 0 을 녹화
+#          python -m kkomdae.camera_quality --video 벽.avi 책상.avi          # 녹화한 프레임 판정
+import argparse
+import math
+import time
+
+from kkomdae.lazy import np
+
+# 분석 격자의 최대 크기 (가로, 세로)
+ANALYSIS_SIZE = (320, 240)
+SAMPLE_INTERVAL_S = 0.25
+# 보관할 최대 표본 수 (넘으면 오래된 표본부터 덮어씀)
+MAX_SAMPLES = 64
+MIN_SAMPLES = 3
+
+METRICS = ("luminance", "contrast", "sharpness", "focus", "noise", "cast_b", "cast_g", "cast_r")
+
+QUALITY_THRESHOLDS = {
+    "min_luminance": 35.0,
+    "max_luminance": 225.0,
+    "min_contrast": 12.0,
+    "min_focus": 0.08,
+    "max_cast": 0.25,
+    "max_noise": 8.0,
+}
+
+# BGR -> 밝기 (ITU-R BT.601)
+_LUMA_WEIGHTS = (0.114, 0.587, 0.299)
+# Immerkær 커널 [[1,-2,1],[-2,4,-2],[1,-2,1]] 응답의 표준편차는 노이즈 sigma 의 6배
+_NOISE_SCALE = 1.0 / (6.0 * 0.6745)
+# 4방향 라플라시안 응답에서 백색 노이즈가 차지하는 분산은 20 * sigma^2
+_LAPLACIAN_NOISE_GAIN = 20.0
+
+
+def frame_metrics(frame, analysis_size=ANALYSIS_SIZE):
+    """
+    프레임 한 장의 지표를 METRICS 순서의 배열로 반환합니다. frame 은 BGR(또는 흑백) uint8 배열입니다.
+    """
+    height, width = frame.shape[:2]
+    step = max(1, math.ceil(max(width / analysis_size[0], height / analysis_size[1])))
+    small = np.asarray(frame[::step, ::step], dtype=np.float32)
+    if small.ndim == 2:
+        small = small[..., None]
+    channel_means = small.mean(axis=(0, 1))
+    if small.shape[2] >= 3:
+        y = small[..., :3] @ np.asarray(_LUMA_WEIGHTS, dtype=np.float32)
+        cast = channel_means[:3] / max(float(channel_means[:3].mean()), 1.0) - 1.0
+    else:
+        y = small[..., 0]
+        cast = np.zeros(3, dtype=np.float32)
+
+    center = y[1:-1, 1:-1]
+    up, down = y[:-2, 1:-1], y[2:, 1:-1]
+    left, right = y[1:-1, :-2], y[1:-1, 2:]
+    corners = y[:-2, :-2] + y[:-2, 2:] + y[2:, :-2] + y[2:, 2:]
+    edges = up + down + left + right
+    noise = float(np.median(np.abs(corners - 2.0 * edges + 4.0 * center))) * _NOISE_SCALE
+    laplacian_var = float((edges - 4.0 * center).var())
+    sharpness = max(0.0, laplacian_var - _LAPLACIAN_NOISE_GAIN * noise * noise)
+    contrast = float(y.std())
+    focus = sharpness / max(contrast * contrast, 1.0)
+
+    return np.array((y.mean(), contrast, sharpness, focus, noise, *cast), dtype=np.float32)
+
+
+class CameraQualityAnalyzer:
+    """
+    미리보기 프레임을 일정 간격으로 표본 추출해 지표를 고정 크기 배열에 모으고 verdict()로 판정합니다.
+    """
+
+    def __init__(self, sample_interval_s: float = SAMPLE_INTERVAL_S, max_samples: int = MAX_SAMPLES,
+                 analysis_size=ANALYSIS_SIZE, thresholds: dict = None):
+        self.sample_interval_s = sample_interval_s
+        self.analysis_size = analysis_size
+        self.thresholds = dict(QUALITY_THRESHOLDS, **(thresholds or {}))
+        self.samples = np.zeros((max_samples, len(METRICS)), dtype=np.float32)
+        self.count = 0
+        self._last_sample_at = None
+
+    def offer(self, frame, timestamp: float) -> bool:
+        """
+        표본 간격이 지났으면 frame 을 분석하고 True 를 반환합니다.
+        """
+        if self._last_sample_at is not None and timestamp - self._last_sample_at < self.sample_interval_s:
+            return False
+        self._last_sample_at = timestamp
+        self.add(frame)
+        return True
+
+    def add(self, frame) -> None:
+        self.samples[self.count % len(self.samples)] = frame_metrics(frame, self.analysis_size)
+        self.count += 1
+
+    def metrics(self) -> dict:
+        """
+        표본들의 지표 중앙값. 표본이 없으면 빈 dict.
+        """
+        used = min(self.count, len(self.samples))
+        if not used:
+            return {}
+        medians = np.median(self.samples[:used], axis=0)
+        # + 0.0: -0.0 을 0.0 으로 표기
+        return {name: round(float(value), 3) + 0.0 for name, value in zip(METRICS, medians)}
+
+    def verdict(self) -> dict:
+        """
+        {"pass", "reasons", "samples", "metrics"} 를 반환합니다.
+        """
+        metrics = self.metrics()
+        limits = self.thresholds
+        reasons = []
+        if self.count < MIN_SAMPLES:
+            reasons.append(f"분석한 프레임이 부족합니다 ({self.count} < {MIN_SAMPLES})")
+        else:
+            if metrics["luminance"] < limits["min_luminance"]:
+                reasons.append(f"화면이 너무 어둡습니다 (밝기 {metrics['luminance']:.1f} < {limits['min_luminance']})")
+            elif metrics["luminance"] > limits["max_luminance"]:
+                reasons.append(f"화면이 너무 밝습니다 (밝기 {metrics['luminance']:.1f} > {limits['max_luminance']})")
+            # 밝기가 벗어나면 초점은 판정하지 않습니다.
+            elif metrics["contrast"] < limits["min_contrast"]:
+                reasons.append(f"장면이 단조로워 초점을 판정할 수 없습니다 (대비 {metrics['contrast']:.1f} < "
+                               f"{limits['min_contrast']}) - 물체나 얼굴을 비춰 주세요")
+            elif metrics["focus"] < limits["min_focus"]:
+                reasons.append(f"초점이 맞지 않습니다 (초점 {metrics['focus']:.3f} < {limits['min_focus']})")
+            worst = max(("cast_b", "cast_g", "cast_r"), key=lambda name: abs(metrics[name]))
+            if abs(metrics[worst]) > limits["max_cast"]:
+                reasons.append(f"색이 틀어졌습니다 ({worst[-1].upper()} 채널 {metrics[worst]:+.2f})")
+            if metrics["noise"] > limits["max_noise"]:
+                reasons.append(f"노이즈가 많습니다 (sigma {metrics['noise']:.1f} > {limits['max_noise']})")
+        return {"pass": not reasons, "reasons": reasons, "samples": self.count, "metrics": metrics}
+
+
+# ===============================
+# 합성 프레임 (카메라 없이 판정 확인용)
+# ===============================
+SYNTHETIC_KINDS = ("good", "dark", "bright", "blurred", "cast", "noisy")
+
+
+def synthetic_frame(kind: str = "good", size=(1280, 720), seed: int = 0):
+    """
+    판정 확인용 BGR 프레임을 만듭니다. "good" 은 사각형 무늬 장면, 나머지는 그 장면에 결함을 넣은 것입니다.
+    """
+    rng = np.random.default_rng(seed)
+    width, height = size
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    scene = 60.0 + 80.0 * (xx / width) + 30.0 * (yy / height)
+    if kind != "blurred":
+        # 크기가 다양한 밝고 어두운 사각형 (모서리가 선명도를 만듭니다)
+        for _ in range(60):
+            w, h = rng.integers(width // 40, width // 6), rng.integers(height // 40, height // 6)
+            x, y = rng.integers(0, width - w), rng.integers(0, height - h)
+            scene[y:y + h, x:x + w] = rng.uniform(20, 230)
+    else:
+        scene += 20.0 * np.sin(xx / width * 6.0) * np.cos(yy / height * 4.0)
+    frame = np.repeat(scene[..., None], 3, axis=2)
+    if kind == "dark":
+        frame *= 0.12
+    elif kind == "bright":
+        frame = frame * 0.2 + 215.0
+    elif kind == "cast":
+        frame *= np.array((0.6, 1.0, 1.5), dtype=np.float32)
+    noise_sigma = 25.0 if kind == "noisy" else 2.0
+    frame += rng.normal(0.0, noise_sigma, frame.shape).astype(np.float32)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def _video_frames(path: str, limit: int):
+    from kkomdae.lazy import cv2
+
+    cap = cv2.VideoCapture(path)
+    try:
+        for _ in range(limit):
+            ok, frame = cap.read()
+            if not ok:
+                break
+            yield frame
+    finally:
+        cap.release()
+
+
+def record_video(source, path: str, seconds: float) -> int:
+    """
+    프레임 공급원(kkomdae.frame_sources 지정 문자열)을 seconds 동안 MJPG 영상으로 녹화하고 프레임 수를 반환합니다.
+    """
+    from kkomdae.frame_sources import open_frame_source
+    from kkomdae.lazy import cv2
+
+    cap = open_frame_source(source)
+    if not cap.isOpened():
+        raise OSError(f"프레임 공급원을 열 수 없습니다: {source}")
+    writer = None
+    count = 0
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if writer is None:
+                height, width = frame.shape[:2]
+                writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+            writer.write(frame)
+            count += 1
+    finally:
+        if writer is not None:
+            writer.release()
+        cap.release()
+    return count
+
+
+if __name__ == "__main__":
+    import json
+
+    parser = argparse.ArgumentParser(description="카메라 화질 자동 판정")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--synthetic", action="store_true", help="합성 프레임 종류별 판정")
+    group.add_argument("--video", nargs="+", metavar="PATH", help="녹화한 영상 파일(또는 카메라 번호)들의 프레임 판정")
+    group.add_argument("--record", metavar="PATH", help="--source 를 MJPG 영상으로 녹화 (--video 검증용)")
+    parser.add_argument("--frames", type=int, default=MAX_SAMPLES, help="분석할 최대 프레임 수")
+    parser.add_argument("--source", default="0", help="--record 의 프레임 공급원 (기본: 카메라 0)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="--record 녹화 시간(초)")
+    parser.add_argument("--thresholds", type=json.loads, default=None, metavar="JSON",
+                        help='기준값 일부를 바꿔 판정 (예: {"min_focus": 0.05})')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        report = {}
+        for kind in SYNTHETIC_KINDS:
+            analyzer = CameraQualityAnalyzer()
+            frames = [synthetic_frame(kind, seed=seed) for seed in range(MIN_SAMPLES)]
+            start = time.perf_counter()
+            for frame in frames:
+                analyzer.add(frame)
+            report[kind] = dict(analyzer.verdict(),
+                                ms_per_frame=round((time.perf_counter() - start) / len(frames) * 1000, 3))
+    elif args.record:
+        report = {"path": args.record, "frames": record_video(args.source, args.record, args.seconds)}
+    else:
+        report = {}
+        for path in args.video:
+            analyzer = CameraQualityAnalyzer(thresholds=args.thresholds)
+            for frame in _video_frames(int(path) if path.isdigit() else path, args.frames):
+                analyzer.add(frame)
+            report[path] = analyzer.verdict()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
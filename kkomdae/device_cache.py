@@ -0,0 +1,58 @@
+# ===============================
+# Raw Input 장치 분류 캐시
+# ===============================
+# 키 입력마다 장치 이름을 조회하고 화이트리스트와 비교하는 대신,
+# hDevice 별로 한 번만 분류한 결과를 보관합니다.
+# 장치가 연결/해제되면(WM_INPUT_DEVICE_CHANGE) forget() 으로 그 장치의 항목을 지우고,
+# 장치 구성 전체가 바뀌었을 수 있으면 invalidate() 로 캐시를 비웁니다.
+from typing import NamedTuple, Optional
+
+
+def normalize_hwid(value: str) -> str:
+    """
+    장치 경로/하드웨어 ID 를 비교용으로 정규화합니다. (소문자, '\\' -> '#')
+    """
+    return value.lower().replace("\\", "#")
+
+
+class DeviceInfo(NamedTuple):
+    name: Optional[str]
+    is_internal: bool
+
+
+class DeviceClassifier:
+    """
+    hDevice -> DeviceInfo(name, is_internal) 캐시입니다.
+    resolve_name(hDevice) 는 장치 이름을 반환하거나, 알 수 없으면 None 을 반환해야 합니다.
+    """
+
+    def __init__(self, internal_hwids, resolve_name):
+        # 화이트리스트는 생성 시 한 번만 정규화합니다.
+        self._internal_ids = tuple(normalize_hwid(hwid) for hwid in internal_hwids)
+        self._resolve_name = resolve_name
+        self._cache = {}
+
+    def classify(self, hDevice) -> DeviceInfo:
+        info = self._cache.get(hDevice)
+        if info is None:
+            name = self._resolve_name(hDevice)
+            if name:
+                normalized = normalize_hwid(name)
+                info = DeviceInfo(name, any(hwid in normalized for hwid in self._internal_ids))
+                self._cache[hDevice] = info
+            else:
+                # 이름 조회 실패는 일시적일 수 있으므로 캐시하지 않습니다.
+                info = DeviceInfo(None, False)
+        return info
+
+    def is_internal(self, hDevice) -> bool:
+        return self.classify(hDevice).is_internal
+
+    def forget(self, hDevice) -> None:
+        self._cache.pop(hDevice, None)
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
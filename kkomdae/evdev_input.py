@@ -0,0 +1,305 @@
+# ===============================
+# Linux evdev 키보드 백엔드
+# ===============================
+# /dev/input/event* 장치를 논블로킹으로 열고 별도 리더 스레드에서 읽어
+# EV_KEY 코드를 keyboard_layout 과 같은 키 심볼로 변환합니다.
+# 내부 키보드는 INTERNAL_HWIDS 대신 sysfs 물리 경로(phys / 실제 장치 경로)로 판별합니다.
+# (장치 파일을 읽으려면 root 권한 또는 input 그룹 권한이 필요합니다.)
+#
+# 사용 예) python -m kkomdae.evdev_input --seconds 10   # 이벤트 처리량 측정
+import fcntl
+import glob
+import logging
+import os
+import platform
+import queue
+import select
+import struct
+import sysconfig
+import threading
+import time
+
+from kkomdae.device_cache import DeviceClassifier
+from kkomdae.input_backends import KeyboardBackend
+from kkomdae.key_pipeline import KeyEventPipeline
+
+EV_KEY = 0x01
+
+
+def _kernel_ulong_size() -> int:
+    """
+    이 프로세스 ABI 의 __kernel_ulong_t 크기(바이트).
+    64비트 프로세스는 8, 32비트 프로세스는 4 이며, x32 ABI(32비트 포인터, 64비트 커널 자료형)만 8 입니다.
+    """
+    if (sysconfig.get_config_var("MULTIARCH") or "").endswith("gnux32"):
+        return 8
+    return struct.calcsize("P")
+
+
+# struct input_event (linux/input.h): __kernel_ulong_t sec, usec; __u16 type; __u16 code; __s32 value
+# 사용자 공간의 time_t 크기(32비트 사용자 공간의 _TIME_BITS=64 포함)와 관계없이 커널은 __kernel_ulong_t 로
+# 쓰므로 C long / struct timeval 로 유추하지 않고 크기를 정해 둡니다. (정렬 여백 없음: 24 또는 16바이트)
+_EVENT = struct.Struct("=QQHHi" if _kernel_ulong_size() == 8 else "=IIHHi")
+# EVIOCSCLOCKID = _IOW('E', 0xa0, int): 이벤트 timestamp 를 CLOCK_MONOTONIC(time.perf_counter 기준)으로 변경
+EVIOCSCLOCKID = 0x400445A0
+READ_EVENTS = 64
+# sysfs capabilities 는 커널의 unsigned long 단위로 출력되므로 사용자 공간이 아니라 커널 기준 비트 수를 씁니다.
+_LONG_BITS = 64 if platform.machine() in ("x86_64", "aarch64", "arm64", "ppc64", "ppc64le", "s390x",
+                                          "riscv64", "mips64", "loongarch64") else 32
+
+# 내부 키보드(i8042 PS/2 컨트롤러)의 sysfs 물리 경로
+DEFAULT_INTERNAL_PHYS_PATHS = ("isa0060/serio0", "/devices/platform/i8042/")
+
+# linux/input-event-codes.h 의 KEY_* 코드 -> 키 심볼
+EVDEV_KEY_MAP = {
+    1: "ESC",
+    2: "1", 3: "2", 4: "3", 5: "4", 6: "5", 7: "6", 8: "7", 9: "8", 10: "9", 11: "0",
+    12: "-", 13: "=", 14: "BACK", 15: "TAB",
+    16: "Q", 17: "W", 18: "E", 19: "R", 20: "T", 21: "Y", 22: "U", 23: "I", 24: "O", 25: "P",
+    26: "[", 27: "]", 28: "ENTER", 29: "CTRL",
+    30: "A", 31: "S", 32: "D", 33: "F", 34: "G", 35: "H", 36: "J", 37: "K", 38: "L",
+    39: ";", 40: "'", 41: "`", 42: "LSHIFT", 43: "\\",
+    44: "Z", 45: "X", 46: "C", 47: "V", 48: "B", 49: "N", 50: "M",
+    51: ",", 52: ".", 53: "/", 54: "RSHIFT", 55: "N *", 56: "ALT", 57: "SPACE", 58: "CAPS",
+    59: "F1", 60: "F2", 61: "F3", 62: "F4", 63: "F5", 64: "F6", 65: "F7", 66: "F8", 67: "F9", 68: "F10",
+    69: "NUMLOCK",
+    71: "N 7", 72: "N 8", 73: "N 9", 74: "N -",
+    75: "N 4", 76: "N 5", 77: "N 6", 78: "N +",
+    79: "N 1", 80: "N 2", 81: "N 3", 82: "N 0", 83: "N .",
+    87: "F11", 88: "F12",
+    96: "N ENTER", 97: "CTRL", 98: "N /", 99: "PRT", 100: "ALT",
+    103: "UP", 105: "LEFT", 106: "RIGHT", 108: "DOWN", 110: "INS", 111: "DEL",
+    122: "한/영", 123: "한자", 125: "WIN",
+}
+
+
+def decode_evdev_records(records) -> list:
+    """
+    (timestamp, 장치 경로, EV_KEY 코드, 0, value) 레코드를
+    (timestamp, 장치 경로, 심볼, key_down 여부) 로 디코딩합니다. (value 1: 누름, 2: 반복, 0: 뗌)
+    """
+    key_map = EVDEV_KEY_MAP
+    decoded = []
+    append = decoded.append
+    for t, device, code, _, value in records:
+        sym = key_map.get(code)
+        if sym is not None:
+            append((t, device, sym, value != 0))
+    return decoded
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def device_phys_path(event_path: str, sysfs_root: str = "/sys/class/input") -> str:
+    """
+    이벤트 장치의 sysfs 물리 경로를 반환합니다. ("<phys> <실제 sysfs 장치 경로>")
+    """
+    device_dir = os.path.join(sysfs_root, os.path.basename(event_path), "device")
+    phys = _read_text(os.path.join(device_dir, "phys"))
+    real = os.path.realpath(device_dir) if os.path.exists(device_dir) else ""
+    return f"{phys} {real}".strip() or None
+
+
+def is_keyboard_device(event_path: str, sysfs_root: str = "/sys/class/input") -> bool:
+    """
+    EV_KEY 기능과 문자 키(KEY_A ~ KEY_Z 일부)를 가진 장치만 키보드로 간주합니다.
+    """
+    caps = os.path.join(sysfs_root, os.path.basename(event_path), "device", "capabilities", "key")
+    words = _read_text(caps).split()
+    if not words:
+        return False
+    # unsigned long 단위 16진수 워드들이며, 가장 뒤의 워드가 최하위 비트입니다.
+    bits = 0
+    for word in words:
+        bits = (bits << _LONG_BITS) | int(word, 16)
+    return all(bits >> code & 1 for code in (16, 30, 44))  # Q, A, Z
+
+
+class EvdevBackend(KeyboardBackend):
+    """
+    /dev/input/event* 를 읽는 Linux 키보드 백엔드입니다.
+    리더 스레드가 큐에 레코드를 쌓고, Tk 메인 스레드가 poll_ms 마다 한 묶음으로 가져갑니다.
+    """
+    name = "evdev"
+
+    def __init__(self, internal_phys_paths=DEFAULT_INTERNAL_PHYS_PATHS, poll_ms: int = 8,
+                 dev_root: str = "/dev/input", sysfs_root: str = "/sys/class/input"):
+        classifier = DeviceClassifier(internal_phys_paths,
+                                      lambda path: device_phys_path(path, sysfs_root))
+        super().__init__(classifier, KeyEventPipeline(classifier.is_internal, decode_evdev_records))
+        self.poll_ms = poll_ms
+        self.dev_root = dev_root
+        self.sysfs_root = sysfs_root
+        self.events = 0
+        self._window = None
+        self._dispatch = None
+        self._queue = queue.SimpleQueue()
+        self._fds = {}
+        self._thread = None
+        self._stop = None
+        self._poll_id = None
+        self._started_at = None
+
+    def attach(self, window, dispatch) -> None:
+        self._window = window
+        self._dispatch = dispatch
+
+    def open_devices(self) -> dict:
+        """
+        키보드 이벤트 장치를 논블로킹으로 엽니다. {fd: (장치 경로, monotonic timestamp 여부)}
+        """
+        fds = {}
+        for path in sorted(glob.glob(os.path.join(self.dev_root, "event*"))):
+            if not is_keyboard_device(path, self.sysfs_root):
+                continue
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                continue
+            try:
+                fcntl.ioctl(fd, EVIOCSCLOCKID, struct.pack("i", time.CLOCK_MONOTONIC))
+                monotonic = True
+            except OSError:
+                monotonic = False
+            fds[fd] = (path, monotonic)
+        return fds
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.classifier.invalidate()
+        self._fds = self.open_devices()
+        if not self._fds:
+            raise PermissionError("키보드 입력 장치(/dev/input/event*)를 열 수 없습니다. 권한을 확인해주세요.")
+        # 이전 리더 스레드가 아직 끝나지 않았을 수 있으므로 스레드마다 중지 이벤트를 따로 둡니다.
+        self._stop = threading.Event()
+        self.events = 0
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._reader, args=(self._fds, self._stop),
+                                        name="kkomdae-evdev", daemon=True)
+        self._thread.start()
+        if self._window is not None:
+            self._poll_id = self._window.after(self.poll_ms, self._poll)
+
+    def stop(self) -> None:
+        """
+        리더 스레드에 중지를 알립니다. 장치 파일은 리더 스레드가 끝날 때 스스로 닫으므로,
+        join 이 시간 초과되어도 읽는 중인 fd 를 닫지(그리고 번호가 재사용되지) 않습니다.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        if self._thread.is_alive():
+            logging.warning("evdev 리더 스레드가 아직 종료되지 않았습니다. (종료 시 장치를 닫음)")
+        self._thread = None
+        if self._poll_id is not None and self._window is not None:
+            self._window.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._fds = {}
+
+    def stats(self) -> dict:
+        """
+        수신한 키 이벤트 수와 초당 처리량을 반환합니다.
+        """
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            "events": self.events,
+            "elapsed_s": round(elapsed, 3),
+            "events_per_s": round(self.events / elapsed, 1) if elapsed > 0 else None,
+        }
+
+    def drain(self) -> list:
+        """
+        큐에 쌓인 레코드를 모두 꺼내 반환합니다.
+        """
+        records = []
+        get = self._queue.get_nowait
+        try:
+            while True:
+                records.append(get())
+        except queue.Empty:
+            pass
+        return records
+
+    def _poll(self) -> None:
+        records = self.drain()
+        if records:
+            self._dispatch(records)
+        if self._thread is not None:
+            self._poll_id = self._window.after(self.poll_ms, self._poll)
+
+    def _reader(self, devices: dict, stop: threading.Event) -> None:
+        """
+        stop 이 설정될 때까지 devices 의 fd 를 읽고, 끝나면 직접 닫습니다.
+        """
+        size = _EVENT.size
+        unpack_from = _EVENT.unpack_from
+        put = self._queue.put
+        fds = list(devices)
+        try:
+            while not stop.is_set():
+                try:
+                    readable, _, _ = select.select(fds, [], [], 0.1)
+                except (OSError, ValueError):
+                    return
+                for fd in readable:
+                    try:
+                        data = os.read(fd, size * READ_EVENTS)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        # 장치가 분리된 경우
+                        fds.remove(fd)
+                        _close_quietly(fd)
+                        continue
+                    path, monotonic = devices[fd]
+                    now = time.perf_counter()
+                    for offset in range(0, len(data) - size + 1, size):
+                        sec, usec, ev_type, code, value = unpack_from(data, offset)
+                        if ev_type == EV_KEY:
+                            t = sec + usec / 1e6 if monotonic else now
+                            put((t, path, code, 0, value))
+                            self.events += 1
+        finally:
+            for fd in fds:
+                _close_quietly(fd)
+
+
+def _close_quietly(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="evdev 키보드 이벤트 처리량 측정")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    backend = EvdevBackend()
+    pressed = set()
+    backend.attach(None, None)
+    backend.start()
+    devices = {path: backend.device_name(path) for path, _ in backend._fds.values()}
+    print("키를 눌러보세요...")
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        time.sleep(backend.poll_ms / 1000)
+        batch = backend.pipeline.process(backend.drain())
+        pressed.update(batch.pressed)
+    backend.stop()
+    result = backend.stats()
+    result["devices"] = devices
+    result["pressed_keys"] = sorted(pressed)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,197 @@
+# ===============================
+# 카메라 프레임 공급원
+# ===============================
+# 카메라 테스트와 벤치마크가 cv2.VideoCapture 와 같은 인터페이스(isOpened / read(image=) / get / release)로
+# 카메라, 영상 파일, 합성 프레임을 똑같이 다루도록 합니다. 카메라가 없는 Linux 장비에서도
+# 캡처 스레드와 벤치마크를 그대로 실행할 수 있습니다.
+#
+# 공급원 지정 문자열
+#   "0", "camera:0"          카메라 번호 (Windows 는 DirectShow, 그 외는 기본 백엔드,
+#                            CameraConfig 를 주면 그 백엔드/해상도/FOURCC 로 엶)
+#   "synthetic:1280x720@30"  합성 프레임 (지정한 FPS 로 일정하게 발행)
+#   그 밖의 문자열            영상 파일 경로 (파일의 FPS 에 맞춰 재생, 끝나면 처음부터 반복)
+import sys
+import time
+from typing import NamedTuple
+
+from kkomdae.lazy import cv2, np
+
+SYNTHETIC_PREFIX = "synthetic:"
+CAMERA_PREFIX = "camera:"
+
+
+def default_camera_backend() -> int:
+    return cv2.CAP_DSHOW if sys.platform == "win32" else cv2.CAP_ANY
+
+
+class CameraConfig(NamedTuple):
+    """
+    카메라를 여는 방법. backend 는 cv2.CAP_ 뒤의 이름("MSMF", "DSHOW", "V4L2", "ANY")입니다.
+    """
+    backend: str
+    width: int
+    height: int
+    fourcc: str
+
+
+def fourcc_name(value: float) -> str:
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+
+def describe_capture(cap) -> dict:
+    """
+    실제로 협상된 해상도와 FOURCC. (요청한 값과 다를 수 있음)
+    """
+    return {
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fourcc": fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)),
+    }
+
+
+def open_camera(index: int, config: CameraConfig):
+    """
+    config 의 백엔드로 카메라를 열고 FOURCC, 해상도 순서로 설정합니다.
+    (DirectShow 는 해상도보다 FOURCC 를 먼저 설정해야 적용되는 장치가 많습니다.)
+    """
+    cap = cv2.VideoCapture(index, getattr(cv2, f"CAP_{config.backend}"))
+    if cap.isOpened():
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.height)
+    return cap
+
+
+class SyntheticCapture:
+    """
+    지정한 해상도/FPS 로 프레임을 발행하는 가짜 VideoCapture 입니다.
+    읽는 쪽이 늦으면 실제 카메라처럼 지나간 프레임은 건너뛰고 missed 로 셉니다.
+    """
+
+    def __init__(self, width: int, height: int, fps: float):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.period = 1.0 / fps
+        self.missed = 0
+        self._index = 0
+        self._next_due = None
+        # 가로 그라디언트 위로 밝은 세로 띠가 움직이는 장면
+        self._base = np.repeat(np.linspace(40, 200, width, dtype=np.uint8)[None, :, None], 3, axis=2)
+        self._bar_width = max(1, width // 32)
+        self._opened = True
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def read(self, image=None):
+        if not self._opened:
+            return False, None
+        now = time.perf_counter()
+        if self._next_due is None:
+            self._next_due = now
+        elif now < self._next_due:
+            time.sleep(self._next_due - now)
+        elif now - self._next_due >= self.period:
+            skipped = int((now - self._next_due) / self.period)
+            self.missed += skipped
+            self._index += skipped
+            self._next_due += skipped * self.period
+        self._next_due += self.period
+
+        shape = (self.height, self.width, 3)
+        if image is None or image.shape != shape or image.dtype != np.uint8:
+            image = np.empty(shape, dtype=np.uint8)
+        image[:] = self._base
+        x = (self._index * self._bar_width) % self.width
+        image[:, x:x + self._bar_width] = 255
+        self._index += 1
+        return True, image
+
+    def get(self, prop) -> float:
+        if prop == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        return 0.0
+
+    def set(self, prop, value) -> bool:
+        return False
+
+    def release(self) -> None:
+        self._opened = False
+
+
+class PacedVideoFile:
+    """
+    영상 파일을 파일의 FPS 에 맞춰 읽습니다. 끝까지 읽으면 처음으로 돌아갑니다.
+    """
+
+    def __init__(self, path: str, loop: bool = True):
+        self.cap = cv2.VideoCapture(path)
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap.isOpened() else 0.0
+        self.period = 1.0 / fps if fps and fps > 0 else 1.0 / 30.0
+        self.loop = loop
+        self._next_due = None
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def read(self, image=None):
+        now = time.perf_counter()
+        if self._next_due is not None and now < self._next_due:
+            time.sleep(self._next_due - now)
+        self._next_due = max(now, self._next_due or now) + self.period
+        ok, frame = self.cap.read(image)
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read(image)
+        return ok, frame
+
+    def get(self, prop) -> float:
+        return self.cap.get(prop)
+
+    def set(self, prop, value) -> bool:
+        return self.cap.set(prop, value)
+
+    def release(self) -> None:
+        self.cap.release()
+
+
+def parse_synthetic_spec(spec: str):
+    """
+    "synthetic:1280x720@30" -> (1280, 720, 30.0)
+    """
+    body = spec[len(SYNTHETIC_PREFIX):]
+    size, _, fps = body.partition("@")
+    width, _, height = size.lower().partition("x")
+    return int(width), int(height), float(fps or 30)
+
+
+def camera_index(spec) -> int:
+    """
+    카메라 번호 지정이면 번호, 영상 파일/합성 프레임이면 None.
+    """
+    spec = str(spec)
+    if spec.startswith(CAMERA_PREFIX):
+        spec = spec[len(CAMERA_PREFIX):]
+    return int(spec) if spec.isdigit() else None
+
+
+def open_frame_source(spec="0", backend: int = None, config: CameraConfig = None):
+    """
+    지정 문자열에 맞는 VideoCapture 호환 객체를 엽니다. 열렸는지는 isOpened() 로 확인합니다.
+    config 는 카메라 번호일 때만 사용합니다.
+    """
+    spec = str(spec)
+    if spec.startswith(SYNTHETIC_PREFIX):
+        return SyntheticCapture(*parse_synthetic_spec(spec))
+    index = camera_index(spec)
+    if index is not None:
+        if config is not None:
+            return open_camera(index, config)
+        return cv2.VideoCapture(index, default_camera_backend() if backend is None else backend)
+    return PacedVideoFile(spec)
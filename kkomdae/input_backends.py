@@ -0,0 +1,55 @@
+# ===============================
+# 키보드 테스트 입력 백엔드
+# ===============================
+# 키보드 테스트는 플랫폼별 입력 백엔드로부터 레코드 묶음을 받아
+# 백엔드의 파이프라인(pipeline)으로 디코딩/장치 분류/병합을 수행합니다.
+#   - Windows: Win32 Raw Input (kkomdae.win_raw_input.RawInputBackend)
+#   - Linux  : /dev/input/event* (kkomdae.evdev_input.EvdevBackend)
+import sys
+
+
+class KeyboardBackend:
+    """
+    입력 백엔드 공통 인터페이스입니다.
+
+    attach(window, dispatch): 키보드 테스트 창에 연결합니다. (창 생성 시 한 번)
+        dispatch(records) 는 Tk 메인 스레드에서 레코드 묶음마다 호출됩니다.
+    start(): 입력 수신을 시작합니다. 실패하면 OSError 를 발생시킵니다.
+    stop(): 입력 수신을 중지합니다.
+    """
+    # 백엔드 이름 ("raw_input", "evdev")
+    name = ""
+    # 마지막 레코드 묶음이 레코드 timestamp 이전에 OS 메시지 큐에서 기다린 시간(초). 지연 시간 기록용
+    queued_s = 0.0
+
+    def __init__(self, classifier, pipeline):
+        # 장치 분류 캐시 (DeviceClassifier)와 디코딩 -> 병합 파이프라인 (KeyEventPipeline)
+        self.classifier = classifier
+        self.pipeline = pipeline
+
+    def attach(self, window, dispatch) -> None:
+        raise NotImplementedError
+
+    def start(self) -> None:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        raise NotImplementedError
+
+    def device_name(self, device):
+        return self.classifier.classify(device).name
+
+
+def create_keyboard_backend(internal_hwids, internal_phys_paths) -> KeyboardBackend:
+    """
+    현재 플랫폼에 맞는 키보드 입력 백엔드를 생성합니다.
+    internal_hwids: Windows Raw Input 장치 이름 화이트리스트
+    internal_phys_paths: Linux sysfs 물리 경로 화이트리스트
+    """
+    if sys.platform == "win32":
+        from kkomdae.win_raw_input import RawInputBackend
+        return RawInputBackend(internal_hwids)
+    if sys.platform.startswith("linux"):
+        from kkomdae.evdev_input import EvdevBackend
+        return EvdevBackend(internal_phys_paths)
+    raise OSError(f"{sys.platform} 에서는 키보드 테스트를 지원하지 않습니다.")
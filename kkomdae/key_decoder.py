@@ -0,0 +1,141 @@
+# ===============================
+# RAWKEYBOARD -> 키 심볼 디코더
+# ===============================
+# raw_input_wnd_proc 의 if/elif 분기를 미리 계산한 조회 테이블로 옮긴 순수 파이썬 모듈입니다.
+# ctypes.windll 에 의존하지 않으므로 Windows 가 아닌 환경에서도
+# 녹화된 RAWKEYBOARD 값(VKey, Flags, MakeCode)으로 벤치마크/회귀 검증이 가능합니다.
+
+# RAWKEYBOARD.Flags 비트
+RI_KEY_BREAK = 0x01
+RI_KEY_E0 = 0x02
+
+VK_SHIFT = 0x10
+
+# 가상 키 코드 -> 문자열 매핑 딕셔너리
+VK_MAPPING = {
+    0x30: "0",   0x31: "1",   0x32: "2",   0x33: "3",   0x34: "4",
+    0x35: "5",   0x36: "6",   0x37: "7",   0x38: "8",   0x39: "9",
+    0x41: "A",   0x42: "B",   0x43: "C",   0x44: "D",   0x45: "E",
+    0x46: "F",   0x47: "G",   0x48: "H",   0x49: "I",   0x4A: "J",
+    0x4B: "K",   0x4C: "L",   0x4D: "M",   0x4E: "N",   0x4F: "O",
+    0x50: "P",   0x51: "Q",   0x52: "R",   0x53: "S",   0x54: "T",
+    0x55: "U",   0x56: "V",   0x57: "W",   0x58: "X",   0x59: "Y",
+    0x5A: "Z",
+    0x20: "SPACE",
+    0x0D: "ENTER",
+    0x1B: "ESC",
+    0x09: "TAB",
+    0x08: "BACK",
+    0x70: "F1",  0x71: "F2",  0x72: "F3",  0x73: "F4",
+    0x74: "F5",  0x75: "F6",  0x76: "F7",  0x77: "F8",
+    0x78: "F9",  0x79: "F10", 0x7A: "F11", 0x7B: "F12",
+    0x2D: "INS",
+    0x2E: "DEL",
+    0x25: "LEFT",
+    0x26: "UP",
+    0x27: "RIGHT",
+    0x28: "DOWN",
+    0x14: "CAPS",
+    0x90: "NUMLOCK",
+    0x60: "N 0",
+    0x61: "N 1",
+    0x62: "N 2",
+    0x63: "N 3",
+    0x64: "N 4",
+    0x65: "N 5",
+    0x66: "N 6",
+    0x67: "N 7",
+    0x68: "N 8",
+    0x69: "N 9",
+    0x6A: "N *",
+    0x6B: "N +",
+    0x6C: "N ENTER",
+    0x6D: "N -",
+    0x6E: "N .",
+    0x6F: "N /",
+    0x2C: "PRT",
+    0xBB: "=",
+    0xBD: "-",
+    0xC0: "`",
+    0xDB: "[",
+    0xDD: "]",
+    0xDC: "\\",
+    0xBA: ";",
+    0xDE: "'",
+    0xBC: ",",
+    0xBE: ".",
+    0xBF: "/",
+    0xA0: "LSHIFT",
+    0xA1: "RSHIFT",
+    0x11: "CTRL",
+    0x5B: "WIN",
+    0x12: "ALT",
+    0x15: "한/영",
+    0x19: "한자",
+}
+
+# E0 플래그 여부에 따라 심볼이 달라지는 키: vkey -> (E0 없음, E0 있음)
+# (ENTER 는 E0 가 붙으면 숫자패드 ENTER, 편집/방향키는 E0 가 없으면 숫자패드 키)
+E0_VARIANTS = {
+    0x0D: ("ENTER", "N ENTER"),
+    0x2D: ("NUMINS", "INS"),
+    0x2E: ("NUMDEL", "DEL"),
+    0x26: ("NUMUP", "UP"),
+    0x25: ("NUMLEFT", "LEFT"),
+    0x28: ("NUMDOWN", "DOWN"),
+    0x27: ("NUMRIGHT", "RIGHT"),
+}
+
+# VK_SHIFT 는 좌/우 구분을 MakeCode 로 합니다.
+SHIFT_BY_MAKECODE = {
+    0x2A: "LSHIFT",
+    0x36: "RSHIFT",
+}
+
+
+def _build_key_table() -> tuple:
+    """
+    (vkey << 1 | e0) 인덱스 -> 심볼 테이블을 생성합니다. (매핑이 없으면 None)
+    """
+    table = [None] * (256 * 2)
+    for vkey, sym in VK_MAPPING.items():
+        table[vkey << 1] = sym
+        table[vkey << 1 | 1] = sym
+    for vkey, (plain, extended) in E0_VARIANTS.items():
+        table[vkey << 1] = plain
+        table[vkey << 1 | 1] = extended
+    return tuple(table)
+
+
+_KEY_TABLE = _build_key_table()
+
+
+def decode_key(vkey: int, flags: int, makecode: int):
+    """
+    RAWKEYBOARD 의 VKey, Flags, MakeCode 로 키 심볼을 반환합니다. (알 수 없으면 None)
+    Make/Break 구분은 하지 않습니다.
+    """
+    if vkey == VK_SHIFT:
+        return SHIFT_BY_MAKECODE.get(makecode, "SHIFT")
+    try:
+        return _KEY_TABLE[vkey << 1 | (flags & RI_KEY_E0) >> 1]
+    except IndexError:
+        return None
+
+
+def decode_batch(records) -> list:
+    """
+    (vkey, flags, makecode) 레코드 배열을 한 번에 디코딩해 심볼 리스트를 반환합니다.
+    """
+    table = _KEY_TABLE
+    size = len(table)
+    shift = SHIFT_BY_MAKECODE
+    result = []
+    append = result.append
+    for vkey, flags, makecode in records:
+        if vkey == VK_SHIFT:
+            append(shift.get(makecode, "SHIFT"))
+        else:
+            index = vkey << 1 | (flags & RI_KEY_E0) >> 1
+            append(table[index] if index < size else None)
+    return result
@@ -0,0 +1,117 @@
+# ===============================
+# 키 입력 디코딩 -> 장치 분류 -> 병합 파이프라인
+# ===============================
+# Raw Input 레코드 묶음(batch)을 한 번에 디코딩하고, 내부 키보드 입력만 골라
+# 한 묶음당 한 번의 UI 갱신(on_raw_keys)으로 병합합니다.
+# 입력은 (timestamp, hDevice, VKey, MakeCode, Flags) 튜플 리스트이므로
+# Windows 가 아닌 환경에서도 합성 데이터로 벤치마크할 수 있습니다.
+#
+# 사용 예) python -m kkomdae.key_pipeline --events 200000 --batch 16
+import argparse
+import random
+import time
+from typing import NamedTuple
+
+from kkomdae.key_decoder import RI_KEY_BREAK, VK_MAPPING, decode_key
+
+
+class KeyBatch(NamedTuple):
+    # 내부 키보드의 (timestamp, 심볼, key_down 여부) 이벤트 (입력 순서 유지)
+    events: list
+    # 이번 묶음에서 눌린(key down) 심볼 (중복 제거, 입력 순서 유지)
+    pressed: list
+
+
+def decode_raw_records(records) -> list:
+    """
+    (timestamp, hDevice, VKey, MakeCode, Flags) 레코드를
+    (timestamp, hDevice, 심볼, key_down 여부) 로 디코딩합니다. 알 수 없는 키는 버립니다.
+    """
+    decoded = []
+    append = decoded.append
+    for t, h_device, vkey, makecode, flags in records:
+        sym = decode_key(vkey, flags, makecode)
+        if sym is not None:
+            append((t, h_device, sym, not (flags & RI_KEY_BREAK)))
+    return decoded
+
+
+class KeyEventPipeline:
+    """
+    디코딩(decoder)과 병합(coalesce) 단계를 묶은 키 입력 파이프라인입니다.
+    is_internal(device) 는 내부 키보드 여부를 반환해야 합니다.
+    """
+
+    def __init__(self, is_internal, decoder=decode_raw_records):
+        self.is_internal = is_internal
+        self.decoder = decoder
+
+    def decode(self, records) -> list:
+        return self.decoder(records)
+
+    def coalesce(self, decoded) -> KeyBatch:
+        """
+        내부 키보드 이벤트만 남기고, 눌린 키 심볼을 중복 없이 모읍니다.
+        """
+        events = []
+        pressed = {}
+        internal = {}
+        is_internal = self.is_internal
+        for t, device, sym, is_down in decoded:
+            ok = internal.get(device)
+            if ok is None:
+                ok = internal[device] = is_internal(device)
+            if not ok:
+                continue
+            events.append((t, sym, is_down))
+            if is_down:
+                pressed[sym] = None
+        return KeyBatch(events, list(pressed))
+
+    def process(self, records) -> KeyBatch:
+        return self.coalesce(self.decode(records))
+
+
+# ===============================
+# 합성 데이터 벤치마크
+# ===============================
+def synthetic_records(count: int, devices=(1, 2), seed: int = 0) -> list:
+    """
+    무작위 Make/Break 키보드 레코드를 생성합니다. (hDevice 1 이 내부 키보드)
+    """
+    rng = random.Random(seed)
+    vkeys = list(VK_MAPPING)
+    records = []
+    for i in range(count):
+        vkey = rng.choice(vkeys)
+        flags = RI_KEY_BREAK if i % 2 else 0
+        records.append((i * 1e-3, rng.choice(devices), vkey, 0, flags))
+    return records
+
+
+def benchmark(events: int, batch: int) -> dict:
+    records = synthetic_records(events)
+    pipeline = KeyEventPipeline(lambda device: device == 1)
+    batches = [records[i:i + batch] for i in range(0, len(records), batch)]
+    start = time.perf_counter()
+    updates = 0
+    for chunk in batches:
+        if pipeline.process(chunk).pressed:
+            updates += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "events": events,
+        "batch": batch,
+        "ui_updates": updates,
+        "elapsed_s": round(elapsed, 6),
+        "ns_per_event": round(elapsed / max(events, 1) * 1e9, 1),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="키 입력 파이프라인 합성 벤치마크")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--batch", type=int, action="append", help="묶음 크기 (여러 번 지정 가능)")
+    args = parser.parse_args()
+    for size in args.batch or [1, 8, 64]:
+        print(benchmark(args.events, size))
@@ -0,0 +1,150 @@
+# ===============================
+# 키 입력 스트림 녹화/재생
+# ===============================
+# 키보드 테스트의 Raw Input 레코드를 작은 바이너리 파일로 녹화하고,
+# 같은 디코딩 -> 장치 분류 -> on_raw_key 파이프라인으로 다시 재생합니다.
+# 재생은 GUI 없이 최대 속도 또는 녹화 당시 간격으로 실행할 수 있습니다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더  : b"KKRI" + u16 버전
+#   'D' 블록: u64 hDevice, u16 이름 길이, UTF-8 장치 이름  (장치가 처음 등장할 때 한 번)
+#   'K' 블록: f64 timestamp(초), u64 hDevice, u16 VKey, u16 MakeCode, u16 Flags
+#
+# 사용 예) python -m kkomdae.key_recording keys.kkr [--realtime] [--internal-hwid ID]
+import argparse
+import struct
+import time
+
+from kkomdae.device_cache import DeviceClassifier
+from kkomdae.key_pipeline import KeyEventPipeline
+
+MAGIC = b"KKRI"
+VERSION = 1
+DEFAULT_INTERNAL_HWIDS = ("\\ACPI#MSF0001",)
+
+_HEADER = struct.Struct("<4sH")
+_DEVICE = struct.Struct("<cQH")
+_KEY = struct.Struct("<cdQHHH")
+
+
+class KeyRecorder:
+    """
+    (timestamp, hDevice, VKey, MakeCode, Flags) 레코드를 파일에 녹화합니다.
+    resolve_name(hDevice) 로 장치 이름을 조회해 재생 시 장치 분류에 사용합니다.
+    """
+
+    def __init__(self, path: str, resolve_name=None):
+        self.path = path
+        self._resolve_name = resolve_name
+        self._known_devices = set()
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+        self.count = 0
+
+    def write(self, records) -> None:
+        write = self._file.write
+        for t, h_device, vkey, makecode, flags in records:
+            if h_device not in self._known_devices:
+                self._known_devices.add(h_device)
+                name = (self._resolve_name(h_device) if self._resolve_name else None) or ""
+                encoded = name.encode("utf-8")
+                write(_DEVICE.pack(b"D", h_device or 0, len(encoded)) + encoded)
+            write(_KEY.pack(b"K", t, h_device or 0, vkey, makecode, flags))
+        self.count += len(records)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_recording(path: str):
+    """
+    녹화 파일을 읽어 (장치 이름 딕셔너리, 레코드 리스트)를 반환합니다.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"키 입력 녹화 파일이 아닙니다: {path}")
+    devices = {}
+    records = []
+    offset = _HEADER.size
+    end = len(data)
+    while offset < end:
+        kind = data[offset:offset + 1]
+        if kind == b"K":
+            _, t, h_device, vkey, makecode, flags = _KEY.unpack_from(data, offset)
+            records.append((t, h_device, vkey, makecode, flags))
+            offset += _KEY.size
+        elif kind == b"D":
+            _, h_device, length = _DEVICE.unpack_from(data, offset)
+            offset += _DEVICE.size
+            devices[h_device] = data[offset:offset + length].decode("utf-8")
+            offset += length
+        else:
+            raise ValueError(f"알 수 없는 블록입니다: {kind!r} (offset {offset})")
+    return devices, records
+
+
+def replay(records, pipeline: KeyEventPipeline, on_raw_keys, realtime: bool = False,
+           batch_window: float = 0.0) -> dict:
+    """
+    레코드를 파이프라인에 다시 넣고 눌린 키를 on_raw_keys 로 전달합니다.
+    realtime 이면 녹화 당시 간격을 재현하고, 아니면 최대 속도로 실행합니다.
+    batch_window(초) 안에 들어온 레코드는 한 묶음으로 처리합니다. (0 이면 같은 timestamp 끼리)
+    """
+    batches = []
+    for record in records:
+        if batches and record[0] - batches[-1][0][0] <= batch_window:
+            batches[-1].append(record)
+        else:
+            batches.append([record])
+
+    start = time.perf_counter()
+    origin = records[0][0] if records else 0.0
+    updates = 0
+    for batch in batches:
+        if realtime:
+            delay = (batch[0][0] - origin) - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        result = pipeline.process(batch)
+        if result.pressed:
+            on_raw_keys(result.pressed)
+            updates += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "records": len(records),
+        "batches": len(batches),
+        "ui_updates": updates,
+        "elapsed_s": round(elapsed, 6),
+        "records_per_s": round(len(records) / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def replay_file(path: str, internal_hwids=DEFAULT_INTERNAL_HWIDS, realtime: bool = False,
+                on_raw_keys=None) -> dict:
+    """
+    녹화 파일을 헤드리스로 재생합니다. 장치 분류는 파일에 저장된 장치 이름으로 합니다.
+    """
+    devices, records = read_recording(path)
+    classifier = DeviceClassifier(internal_hwids, devices.get)
+    pressed = set()
+    pipeline = KeyEventPipeline(classifier.is_internal)
+    stats = replay(records, pipeline, on_raw_keys or pressed.update, realtime=realtime)
+    if on_raw_keys is None:
+        stats["pressed_keys"] = sorted(pressed)
+    stats["devices"] = {str(h): name for h, name in devices.items()}
+    return stats
+
+
+if __name__ == "__main__":
+    import json
+
+    parser = argparse.ArgumentParser(description="키 입력 녹화 파일 재생")
+    parser.add_argument("path")
+    parser.add_argument("--realtime", action="store_true", help="녹화 당시 간격으로 재생")
+    parser.add_argument("--internal-hwid", action="append", help="내부 키보드 하드웨어 ID (여러 번 지정 가능)")
+    args = parser.parse_args()
+    result = replay_file(args.path, args.internal_hwid or DEFAULT_INTERNAL_HWIDS, realtime=args.realtime)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,152 @@
+# ===============================
+# 키별 입력 시간 측정 / 채터링 검출
+# ===============================
+# 키보드 테스트의 Make/Break 이벤트로 키마다 처음 누른 시각, 누른 횟수, 누른 시간을
+# KEY_INDEX 위치의 고정 크기 numpy 배열에 누적합니다. (테스트를 오래 해도 메모리가 늘지 않음)
+#   - 채터링: 키를 뗀 뒤 CHATTER_MS 안에 다시 Make 가 들어온 경우 (스위치 접점 튐)
+#   - 긴 입력: 한 번 누른 시간이 LONG_PRESS_MS 를 넘은 경우 (걸림/고착 의심)
+# 테스트 종료 시 summary() 에서 배열 연산으로 통계를 계산합니다.
+#
+# Raw Input 배치 모드에서는 한 번에 읽은 레코드가 같은 timestamp 를 가지므로
+# 시간 해상도는 메시지 처리 간격으로 제한됩니다. 한 배치 안의 같은 키 Break -> Make 는
+# 간격이 0 으로 보이지만 실제로는 메시지 처리 간격 안에 다시 눌린 것이므로 채터링으로 셉니다.
+# (접점 튐은 몇 ms 간격이라 같은 배치에 들어오는 경우가 가장 많습니다.)
+# 한 배치 안에서 눌렀다 뗀 입력은 누른 시간 0 으로 기록합니다.
+from kkomdae.keyboard_layout import KEY_INDEX, KEY_SYMBOLS
+from kkomdae.lazy import np
+
+CHATTER_MS = 8.0
+LONG_PRESS_MS = 1500.0
+
+_NAN = float("nan")
+
+
+class KeyTimingTracker:
+    """
+    키 위치별 입력 시간을 고정 크기 배열로 기록합니다.
+    키 테스트 통과 여부(한 번이라도 눌렸는지)도 함께 관리합니다.
+    """
+
+    def __init__(self, symbols=KEY_SYMBOLS, key_index=KEY_INDEX,
+                 chatter_ms: float = CHATTER_MS, long_press_ms: float = LONG_PRESS_MS):
+        self.symbols = tuple(symbols)
+        self.key_index = key_index
+        self.chatter_s = chatter_ms / 1000.0
+        self.long_press_s = long_press_ms / 1000.0
+        size = len(self.symbols)
+        # 통과 여부
+        self.pressed = np.zeros(size, dtype=bool)
+        # 시각 (초, 아직 없으면 NaN)
+        self.first_press = np.full(size, _NAN)
+        self.down_at = np.full(size, _NAN)
+        self.up_at = np.full(size, _NAN)
+        # 횟수 / 누른 시간 누적
+        self.press_count = np.zeros(size, dtype=np.int32)
+        self.release_count = np.zeros(size, dtype=np.int32)
+        self.total_duration = np.zeros(size)
+        self.max_duration = np.zeros(size)
+        self.chatter_count = np.zeros(size, dtype=np.int32)
+        self.long_press_count = np.zeros(size, dtype=np.int32)
+        self.remaining = size
+
+    def reset(self) -> None:
+        self.pressed.fill(False)
+        for array in (self.first_press, self.down_at, self.up_at):
+            array.fill(_NAN)
+        for array in (self.press_count, self.release_count, self.total_duration,
+                      self.max_duration, self.chatter_count, self.long_press_count):
+            array.fill(0)
+        self.remaining = len(self.symbols)
+
+    # -------------------------------
+    # 통과 여부 (기존 keys_not_pressed 집합 대체)
+    # -------------------------------
+    def mark_pressed(self, sym: str) -> bool:
+        """
+        키를 통과로 표시합니다. 처음 눌린 키면 True 를 반환합니다.
+        """
+        index = self.key_index.get(sym)
+        if index is None or self.pressed[index]:
+            return False
+        self.pressed[index] = True
+        self.remaining -= 1
+        return True
+
+    def is_pressed(self, sym: str) -> bool:
+        index = self.key_index.get(sym)
+        return index is not None and bool(self.pressed[index])
+
+    def not_pressed(self) -> list:
+        return [self.symbols[index] for index in np.flatnonzero(~self.pressed)]
+
+    # -------------------------------
+    # Make/Break 이벤트 기록
+    # -------------------------------
+    def feed(self, events) -> None:
+        """
+        (timestamp, 심볼, key_down 여부) 이벤트를 기록합니다. 누른 상태의 반복 Make 는 무시합니다.
+        """
+        key_index = self.key_index
+        down_at = self.down_at
+        up_at = self.up_at
+        for t, sym, is_down in events:
+            index = key_index.get(sym)
+            if index is None:
+                continue
+            if is_down:
+                if down_at[index] == down_at[index]:
+                    continue  # 자동 반복
+                down_at[index] = t
+                self.press_count[index] += 1
+                if self.press_count[index] == 1:
+                    self.first_press[index] = t
+                elif t - up_at[index] < self.chatter_s:
+                    # 같은 배치(t == up_at)의 Break -> Make 도 포함
+                    self.chatter_count[index] += 1
+            else:
+                start = down_at[index]
+                if start != start:
+                    continue  # 누른 기록 없이 들어온 Break
+                duration = t - start
+                down_at[index] = _NAN
+                up_at[index] = t
+                self.release_count[index] += 1
+                self.total_duration[index] += duration
+                if duration > self.max_duration[index]:
+                    self.max_duration[index] = duration
+                if duration > self.long_press_s:
+                    self.long_press_count[index] += 1
+
+    # -------------------------------
+    # 통계
+    # -------------------------------
+    def summary(self, now: float = None) -> dict:
+        """
+        키별 기록으로 입력 시간 통계와 채터링/긴 입력 키를 계산합니다.
+        now 를 주면 아직 누르고 있는 키의 누른 시간도 긴 입력 판정에 포함합니다.
+        """
+        symbols = np.array(self.symbols, dtype=object)
+        released = self.release_count > 0
+        mean_ms = self.total_duration[released] / self.release_count[released] * 1000.0
+        max_ms = self.max_duration * 1000.0
+        if now is not None:
+            held = ~np.isnan(self.down_at)
+            max_ms = np.where(held, np.maximum(max_ms, (now - self.down_at) * 1000.0), max_ms)
+        long_press = max_ms > self.long_press_s * 1000.0
+        chatter = self.chatter_count > 0
+        press_ms = None
+        if mean_ms.size:
+            p50, p95 = np.percentile(mean_ms, [50, 95])
+            press_ms = {
+                "p50": round(float(p50), 1),
+                "p95": round(float(p95), 1),
+                "max": round(float(max_ms.max()), 1),
+            }
+        return {
+            "keys_pressed": int(self.pressed.sum()),
+            "keys_total": len(self.symbols),
+            "presses": int(self.press_count.sum()),
+            "press_ms": press_ms,
+            "chatter": {sym: int(count) for sym, count in zip(symbols[chatter], self.chatter_count[chatter])},
+            "long_press": {sym: round(float(ms), 1) for sym, ms in zip(symbols[long_press], max_ms[long_press])},
+        }
@@ -0,0 +1,58 @@
+# ===============================
+# 키보드 테스트 레이아웃
+# ===============================
+# 키보드 테스트 창에 그릴 키 배열과 캔버스 좌표 계산을 담당합니다.
+# 각 키의 위치(KEY_INDEX)는 레이아웃 순서대로 매겨지며,
+# 키 상태를 배열/비트셋으로 관리하는 기능들이 같은 인덱스를 사용합니다.
+
+# 키보드 레이아웃 구성 (실제 키보드 레이아웃 반영) - (키 심볼, 너비) / 빈 문자열은 빈 칸
+KEYBOARD_LAYOUT = (
+    # 첫 번째 행: ESC, F1 ~ F12, PRT, INS, DEL, N /, N *
+    (("ESC", 5), ("F1", 5), ("F2", 5), ("F3", 5), ("F4", 5), ("F5", 5),
+     ("F6", 5), ("F7", 5), ("F8", 5), ("F9", 5), ("F10", 5), ("F11", 5),
+     ("F12", 5), ("PRT", 5), ("INS", 5), ("DEL", 4), ("N /", 4), ("N *", 4)),
+    # 두 번째 행: `, 1 ~ 0, -, =, BACK, N -, N +, NUMLOCK  (총합 88)
+    (("`", 5), ("1", 5), ("2", 5), ("3", 5), ("4", 5), ("5", 5),
+     ("6", 5), ("7", 5), ("8", 5), ("9", 5), ("0", 5), ("-", 5),
+     ("=", 5), ("BACK", 8), ("N -", 5), ("N +", 5), ("NUMLOCK", 5)),
+    # 세 번째 행: TAB, Q ~ P, [, ], \, N 7, N 8, N 9 (총합 88)
+    (("TAB", 8), ("Q", 5), ("W", 5), ("E", 5), ("R", 5), ("T", 5),
+     ("Y", 5), ("U", 5), ("I", 5), ("O", 5), ("P", 5), ("[", 5),
+     ("]", 5), ("\\", 5), ("N 7", 5), ("N 8", 5), ("N 9", 5)),
+    # 네 번째 행: CAPS, A, S ~ L, ;, ', ENTER, N 4, N 5, N 6
+    (("CAPS", 8), ("A", 7), ("S", 5), ("D", 5), ("F", 5), ("G", 5),
+     ("H", 5), ("J", 5), ("K", 5), ("L", 5), (";", 5), ("'", 5),
+     ("ENTER", 9), ("N 4", 5), ("N 5", 5), ("N 6", 5)),
+    # 다섯 번째 행: LSHIFT, Z, X, C, V, B, N, M, ,, ., /, RSHIFT, N 1, N 2, N 3
+    (("LSHIFT", 12), ("Z", 5), ("X", 5), ("C", 5), ("V", 5), ("B", 5),
+     ("N", 5), ("M", 5), (",", 5), (".", 5), ("/", 6), ("RSHIFT", 12),
+     ("N 1", 5), ("N 2", 5), ("N 3", 5)),
+    # 여섯 번째 행: CTRL, (빈 키), WIN, ALT, SPACE, 한/영, 한자, LEFT, DOWN, UP, RIGHT, N 0, N ., N ENTER
+    (("CTRL", 5), ("", 5), ("WIN", 5), ("ALT", 5), ("SPACE", 27), ("한/영", 5),
+     ("한자", 5), ("LEFT", 5), ("DOWN", 5), ("UP", 5), ("RIGHT", 5),
+     ("N 0", 5), ("N .", 5), ("N ENTER", 5)),
+)
+
+# 레이아웃 순서대로 나열한 키 심볼 (빈 칸 제외)과 심볼 -> 위치 인덱스
+KEY_SYMBOLS = tuple(key.upper() for row in KEYBOARD_LAYOUT for key, _ in row if key)
+KEY_INDEX = {sym: index for index, sym in enumerate(KEY_SYMBOLS)}
+
+
+def key_geometry(layout=KEYBOARD_LAYOUT, canvas_width: int = 1200, unit: int = 9,
+                 key_height: int = 32, gap: int = 6, row_gap: int = 10, top: int = 10) -> list:
+    """
+    레이아웃의 각 키를 캔버스 좌표로 변환해 (심볼, (x0, y0, x1, y1)) 리스트로 반환합니다.
+    키 너비는 width * unit 픽셀이며, 각 행은 가로 중앙에 정렬됩니다.
+    """
+    geometry = []
+    y = top
+    for row in layout:
+        row_width = sum(width * unit for _, width in row) + gap * (len(row) - 1)
+        x = (canvas_width - row_width) // 2
+        for key, width in row:
+            key_width = width * unit
+            if key:
+                geometry.append((key.upper(), (x, y, x + key_width, y + key_height)))
+            x += key_width + gap
+        y += key_height + row_gap
+    return geometry
@@ -0,0 +1,66 @@
+# ===============================
+# 키 입력 -> 화면 반영 지연 시간 기록기
+# ===============================
+# 입력 발생부터 키 표시가 다시 그려질 때까지 단계별 소요 시간을
+# 고정 크기 배열 링 버퍼에 저장하고, 테스트 종료 시 p50/p95/p99 를 보고합니다.
+# 링 버퍼가 가득 차면 가장 오래된 샘플부터 덮어쓰므로 메모리 사용량이 일정합니다.
+from array import array
+
+# receive: 입력 발생 -> 레코드 읽기 완료 (Raw Input: WM_INPUT 게시 시각(GetMessageTime, 틱 해상도)부터,
+#          evdev: 커널 이벤트 시각부터), decode: 키 심볼 디코딩, device: 장치 분류/병합,
+# on_raw_key: UI 상태 갱신, paint: 갱신 후 첫 idle(다시 그리기) 시점까지
+STAGES = ("receive", "decode", "device", "on_raw_key", "paint")
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyRecorder:
+    """
+    단계별 소요 시간(초)을 고정 크기 링 버퍼(array('d'))에 기록합니다.
+    """
+
+    def __init__(self, stages=STAGES, capacity: int = 4096):
+        self.stages = tuple(stages)
+        self.capacity = capacity
+        self._samples = {stage: array("d", bytes(8 * capacity)) for stage in self.stages}
+        self._counts = dict.fromkeys(self.stages, 0)
+
+    def add(self, stage: str, seconds: float) -> None:
+        count = self._counts[stage]
+        self._samples[stage][count % self.capacity] = seconds
+        self._counts[stage] = count + 1
+
+    def samples(self, stage: str) -> list:
+        """
+        링 버퍼에 남아 있는 샘플을 반환합니다. (순서는 보장하지 않음)
+        """
+        count = min(self._counts[stage], self.capacity)
+        return self._samples[stage][:count].tolist()
+
+    def percentiles(self, stage: str, percents=PERCENTILES) -> dict:
+        """
+        nearest-rank 방식의 백분위수(초)를 반환합니다. 샘플이 없으면 빈 딕셔너리.
+        """
+        values = sorted(self.samples(stage))
+        if not values:
+            return {}
+        last = len(values) - 1
+        return {p: values[min(last, max(0, -(-p * len(values) // 100) - 1))] for p in percents}
+
+    def report(self) -> dict:
+        """
+        단계별 샘플 수와 백분위수(ms)를 딕셔너리로 반환합니다.
+        """
+        result = {}
+        for stage in self.stages:
+            entry = {"count": self._counts[stage]}
+            for p, value in self.percentiles(stage).items():
+                entry[f"p{p}_ms"] = round(value * 1000, 3)
+            result[stage] = entry
+        return result
+
+    def format_report(self) -> str:
+        lines = [f"{'stage':<12}{'count':>8}" + "".join(f"{'p' + str(p) + ' ms':>12}" for p in PERCENTILES)]
+        for stage, entry in self.report().items():
+            values = "".join(f"{entry.get(f'p{p}_ms', float('nan')):>12.3f}" for p in PERCENTILES)
+            lines.append(f"{stage:<12}{entry['count']:>8}{values}")
+        return "\n".join(lines)
@@ -0,0 +1,105 @@
+# ===============================
+# 무거운 외부 라이브러리 지연 로딩
+# ===============================
+# numpy, cv2, win32com, psutil, qrcode 는 임포트 비용이 커서 모듈 최상단에서 불러오면
+# 첫 화면이 그려지기 전에 모든 비용을 치르게 됩니다.
+# 여기서는 실제 속성에 처음 접근하는 순간 모듈을 불러오는 프록시를 제공합니다.
+#
+# importlib 대신 함수 안의 import 문을 사용하는 이유:
+# PyInstaller 는 바이트코드의 import 문을 분석해 번들에 포함할 모듈을 찾으므로
+# 문자열 기반 동적 임포트를 쓰면 exe 빌드에서 모듈이 누락됩니다.
+import threading
+
+
+class LazyModule:
+    """
+    첫 속성 접근 시 loader 를 호출해 실제 모듈을 불러오는 프록시입니다.
+    """
+
+    def __init__(self, name: str, loader):
+        self._name = name
+        self._loader = loader
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        """
+        모듈을 불러와 반환합니다. 이미 불러온 경우 캐시된 모듈을 반환합니다.
+        """
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = self._loader()
+                module = self._module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def _import_numpy():
+    import numpy
+    return numpy
+
+
+def _import_cv2():
+    import cv2
+    return cv2
+
+
+def _import_win32com():
+    # win32com.client 를 함께 불러와야 win32com.client.GetObject 형태로 사용할 수 있습니다.
+    import win32com.client
+    import win32com
+    return win32com
+
+
+def _import_psutil():
+    import psutil
+    return psutil
+
+
+def _import_qrcode():
+    import qrcode
+    import qrcode.constants
+    return qrcode
+
+
+np = LazyModule("numpy", _import_numpy)
+cv2 = LazyModule("cv2", _import_cv2)
+win32com = LazyModule("win32com", _import_win32com)
+psutil = LazyModule("psutil", _import_psutil)
+qrcode = LazyModule("qrcode", _import_qrcode)
+
+# 백그라운드 워밍업 대상 (UI 에서 먼저 쓰일 가능성이 높은 순서)
+HEAVY_MODULES = (np, cv2, psutil, win32com, qrcode)
+
+
+def load_all(modules=HEAVY_MODULES) -> None:
+    """
+    모듈들을 지금 바로 불러옵니다.
+    실패한 모듈은 무시하며, 실제 사용 시점에 다시 임포트를 시도해 오류가 드러납니다.
+    """
+    for module in modules:
+        try:
+            module.load()
+        except Exception:
+            pass
+
+
+def warm_up(modules=HEAVY_MODULES) -> threading.Thread:
+    """
+    데몬 스레드에서 모듈들을 미리 불러옵니다. (load_all 참고)
+    """
+    thread = threading.Thread(target=load_all, args=(modules,), name="kkomdae-warm-up", daemon=True)
+    thread.start()
+    return thread
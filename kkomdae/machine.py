@@ -0,0 +1,28 @@
+# ===============================
+# 노트북 모델명 조회
+# ===============================
+# 모델별 설정(USB 포트 프로파일, 카메라 설정 캐시 등)을 고를 때 쓰는 모델명입니다.
+# Windows 는 레지스트리의 BIOS SystemProductName, 그 외는 DMI product_name 을 읽습니다.
+import sys
+
+DMI_PRODUCT_NAME = "/sys/class/dmi/id/product_name"
+BIOS_REGISTRY_KEY = r"HARDWARE\DESCRIPTION\System\BIOS"
+
+
+def machine_model(path: str = DMI_PRODUCT_NAME) -> str:
+    """
+    노트북 모델명. 알 수 없으면 빈 문자열입니다. (path 는 Windows 가 아닐 때 읽을 DMI 파일)
+    """
+    if sys.platform == "win32":
+        import winreg
+
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, BIOS_REGISTRY_KEY) as key:
+                return str(winreg.QueryValueEx(key, "SystemProductName")[0]).strip()
+        except OSError:
+            return ""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
@@ -0,0 +1,33 @@
+# ===============================
+# 사용자별 데이터/캐시 경로, 실행 파일 위치
+# ===============================
+import os
+import sys
+
+APP_DIR_NAME = "KkomDae"
+
+
+def user_cache_dir(*parts: str) -> str:
+    """
+    사용자별 캐시 디렉터리 경로를 반환합니다. (디렉터리는 생성하지 않습니다.)
+    Windows: %LOCALAPPDATA%\\KkomDae\\cache, 그 외: $XDG_CACHE_HOME/kkomdae
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        root = os.path.join(base, APP_DIR_NAME, "cache")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(base, APP_DIR_NAME.lower())
+    return os.path.join(root, *parts)
+
+
+def app_dir(*parts: str) -> str:
+    """
+    실행 파일(PyInstaller 로 묶은 exe)이 있는 디렉터리, 스크립트로 실행하면 저장소 최상위 디렉터리 경로.
+    검사 대상 노트북마다 USB 메모리나 공유 폴더의 같은 exe 를 실행하므로, 여기에 둔 파일은 모든 기기가 함께 씁니다.
+    """
+    if getattr(sys, "frozen", False):
+        root = os.path.dirname(os.path.abspath(sys.executable))
+    else:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(root, *parts)
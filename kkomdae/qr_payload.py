@@ -0,0 +1,110 @@
+# ===============================
+# QR 코드 결과 데이터
+# ===============================
+# QR 코드(버전 40, 오류 정정 L)에 넣을 수 있는 바이트 데이터는 최대 QR_MAX_BYTES 바이트입니다.
+# 테스트별 상세 결과(키별 시간, 불량 화소 좌표, 포트별 측정값 등)는 로그에 남기고,
+# QR 에는 통과 여부와 핵심 수치만 공백 없는 JSON 으로 넣습니다.
+# 그래도 한도를 넘으면 테스트별 통과 여부만 담은 요약으로 대신합니다.
+import json
+
+QR_MAX_BYTES = 2953
+
+
+def compact_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def rollover_summary(result: dict):
+    if not result:
+        return None
+    return {"max": result["max_simultaneous"], "pass": result["passed"]}
+
+
+def key_timing_summary(summary: dict):
+    if not summary:
+        return None
+    press_ms = summary.get("press_ms") or {}
+    return {
+        "p95_ms": press_ms.get("p95"),
+        "chatter": len(summary.get("chatter") or ()),
+        "long_press": len(summary.get("long_press") or ()),
+    }
+
+
+def usb_storage_summary(results: dict, by_drive: bool = False):
+    """
+    포트별 저장장치 결과를 전체 통과 여부와 가장 느린 속도로 줄입니다.
+    실패가 없고 캐시를 우회하지 못한(검증 불가) 포트가 있으면 ok 는 None 입니다.
+    by_drive 는 결과가 포트가 아니라 드라이브 문자별인 경우(Windows)입니다.
+    """
+    if not results:
+        return None
+    reads = [r["read_mb_s"] for r in results.values() if r.get("read_mb_s") is not None]
+    writes = [r["write_mb_s"] for r in results.values() if r.get("write_mb_s") is not None]
+    oks = [r.get("ok") for r in results.values()]
+    summary = {
+        "ok": False if False in oks else (None if None in oks else True),
+        "min_read_mb_s": min(reads) if reads else None,
+        "min_write_mb_s": min(writes) if writes else None,
+        "usb2": sorted(name for name, r in results.items() if r.get("usb2_suspect")),
+        # link: 협상 속도로 판정, read_speed: 읽기 속도로 추정 (느린 USB 메모리도 포함될 수 있음)
+        "usb2_by": "link" if all(r.get("usb2_by") == "link" for r in results.values()) else "read_speed",
+    }
+    if by_drive:
+        # 드라이브와 포트의 대응을 알 수 없어 어느 포트의 결과인지 모르는 경우
+        summary["by_drive"] = True
+    return summary
+
+
+def enumeration_summary(table: dict):
+    if not table:
+        return None
+    return {
+        "max_ms": max(row["max_ms"] for row in table.values()),
+        "slow": sorted(port for port, row in table.items() if row["slow"]),
+    }
+
+
+def camera_quality_summary(verdict: dict):
+    if not verdict:
+        return None
+    metrics = verdict.get("metrics") or {}
+    summary = {"pass": verdict["pass"]}
+    if verdict.get("override"):
+        # 자동 판정은 실패했지만 검사자가 화면을 확인하고 통과시킨 경우
+        summary["override"] = True
+    for name, key, digits in (("luminance", "lum", 1), ("contrast", "contrast", 1), ("focus", "focus", 3),
+                              ("noise", "noise", 1)):
+        if name in metrics:
+            summary[key] = round(metrics[name], digits)
+    if metrics:
+        summary["cast"] = round(max(abs(metrics[name]) for name in ("cast_b", "cast_g", "cast_r")), 2)
+    return summary
+
+
+def camera_defects_summary(result: dict):
+    if not result:
+        return None
+    summary = {"hot": result["hot"], "dead": result["dead"], "stuck": result["stuck"]}
+    if not result.get("verified", True):
+        # 압축 스트림(MJPG 등)으로 검사해 화소 단위 불량을 확인할 수 없었던 경우
+        summary["verified"] = False
+    return summary
+
+
+def status_only(results: dict) -> dict:
+    """
+    {"테스트": {"status": ..., ...}} 에서 통과 여부만 남긴 요약.
+    """
+    return {name: {"status": value["status"]} if isinstance(value, dict) and "status" in value else value
+            for name, value in results.items()}
+
+
+def encode_results(results: dict, limit: int = QR_MAX_BYTES):
+    """
+    QR 에 넣을 문자열과 요약으로 대체했는지 여부를 반환합니다.
+    """
+    data = compact_json(results)
+    if len(data.encode("utf-8")) <= limit:
+        return data, False
+    return compact_json(status_only(results)), True
@@ -0,0 +1,78 @@
+# ===============================
+# RAWINPUT(키보드) 바이트 파서
+# ===============================
+# GetRawInputData / GetRawInputBuffer 가 채워주는 RAWINPUT 구조체를
+# ctypes 구조체 캐스팅 없이 struct.unpack_from 으로 고정 오프셋에서 읽습니다.
+# 순수 파이썬이므로 Windows 가 아닌 환경에서도 바이트 열로 검증/벤치마크할 수 있습니다.
+#
+# RAWINPUTHEADER: DWORD dwType, DWORD dwSize, HANDLE hDevice, WPARAM wParam
+# RAWKEYBOARD   : USHORT MakeCode, Flags, Reserved, VKey, UINT Message, ULONG ExtraInformation
+import struct
+
+RIM_TYPEKEYBOARD = 1
+
+# 현재 프로세스의 포인터 크기 (8: 64비트, 4: 32비트)
+POINTER_SIZE = struct.calcsize("P")
+
+_FORMATS = {
+    8: "<IIQQHHHHII",
+    4: "<IIIIHHHHII",
+}
+
+
+class RawKeyboardParser:
+    """
+    RAWINPUT(키보드) 레코드를 읽는 파서입니다.
+    header_size 는 GetRawInputData 의 cbSizeHeader, size 는 키보드 레코드 전체 크기입니다.
+    """
+
+    def __init__(self, pointer_size: int = POINTER_SIZE):
+        if pointer_size not in _FORMATS:
+            raise ValueError(f"지원하지 않는 포인터 크기입니다: {pointer_size}")
+        self.pointer_size = pointer_size
+        self._struct = struct.Struct(_FORMATS[pointer_size])
+        self.header_size = 8 + 2 * pointer_size
+        self.size = self._struct.size
+
+    def parse(self, buffer, offset: int = 0):
+        """
+        buffer 의 offset 위치에서 레코드를 읽어
+        (dwType, dwSize, hDevice, MakeCode, Flags, VKey) 튜플을 반환합니다.
+        dwType 이 키보드가 아니면 키보드 필드 값은 의미가 없습니다.
+        """
+        (dw_type, dw_size, h_device, _wparam,
+         makecode, flags, _reserved, vkey, _message, _extra) = self._struct.unpack_from(buffer, offset)
+        return dw_type, dw_size, h_device, makecode, flags, vkey
+
+    def pack(self, h_device: int, makecode: int, flags: int, vkey: int,
+             message: int = 0x0100, dw_type: int = RIM_TYPEKEYBOARD) -> bytes:
+        """
+        레코드를 바이트 열로 만듭니다. (테스트/벤치마크용 합성 데이터 생성)
+        """
+        return self._struct.pack(dw_type, self.size, h_device, 0,
+                                 makecode, flags, 0, vkey, message, 0)
+
+    def align(self, size: int) -> int:
+        """
+        GetRawInputBuffer 결과에서 다음 레코드까지의 간격(NEXTRAWINPUTBLOCK)을 계산합니다.
+        64비트는 QWORD, 32비트는 DWORD 경계로 정렬됩니다.
+        """
+        mask = self.pointer_size - 1
+        return (size + mask) & ~mask
+
+    def parse_buffer(self, buffer, count: int, timestamp: float = 0.0, out: list = None) -> list:
+        """
+        GetRawInputBuffer 로 채워진 buffer 에서 count 개의 레코드를 읽어
+        키보드 레코드만 (timestamp, hDevice, VKey, MakeCode, Flags) 튜플로 out 에 추가합니다.
+        """
+        if out is None:
+            out = []
+        unpack_from = self._struct.unpack_from
+        offset = 0
+        for _ in range(count):
+            (dw_type, dw_size, h_device, _wparam,
+             makecode, flags, _reserved, vkey, _message, _extra) = unpack_from(buffer, offset)
+            if dw_type == RIM_TYPEKEYBOARD:
+                out.append((timestamp, h_device, vkey, makecode, flags))
+            offset += self.align(dw_size or self.size)
+        return out
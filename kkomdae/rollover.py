@@ -0,0 +1,221 @@
+# ===============================
+# N키 롤오버 / 고스팅 테스트
+# ===============================
+# 키보드 매트릭스 불량(고스팅, 동시 입력 차단)을 찾기 위해 조합 키를 동시에 누르게 하고,
+# 현재 눌린 키를 KEY_INDEX 위치의 비트셋으로 관리합니다.
+# Make/Break 이벤트마다 비트 하나와 카운터만 갱신하므로 이벤트당 상수 시간입니다.
+#
+# 사용 예) python -m kkomdae.rollover --events 200000   # 이벤트 처리 속도 측정
+import argparse
+import random
+import time
+
+from kkomdae.keyboard_layout import KEY_INDEX, KEY_SYMBOLS
+
+# 순서대로 진행할 조합 키 (이름, 동시에 누를 키 심볼)
+ROLLOVER_CHORDS = (
+    ("WASD + Shift", ("W", "A", "S", "D", "LSHIFT")),
+    ("홈 행", ("A", "S", "D", "F", "J", "K", "L", ";")),
+    ("Ctrl + Shift + Alt + Space", ("CTRL", "LSHIFT", "ALT", "SPACE")),
+    ("QWER + 1234", ("Q", "W", "E", "R", "1", "2", "3", "4")),
+)
+
+
+class HeldKeySet:
+    """
+    현재 눌린 키를 위치 인덱스 비트셋으로 관리합니다. 개수는 누름/뗌 시 증감으로 유지합니다.
+    """
+    __slots__ = ("bits", "count")
+
+    def __init__(self):
+        self.bits = 0
+        self.count = 0
+
+    def press(self, index: int) -> bool:
+        """
+        키를 눌린 상태로 표시합니다. 이미 눌려 있던 키(자동 반복)면 False 를 반환합니다.
+        """
+        bit = 1 << index
+        if self.bits & bit:
+            return False
+        self.bits |= bit
+        self.count += 1
+        return True
+
+    def release(self, index: int) -> bool:
+        bit = 1 << index
+        if not self.bits & bit:
+            return False
+        self.bits ^= bit
+        self.count -= 1
+        return True
+
+    def clear(self) -> None:
+        self.bits = 0
+        self.count = 0
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self.bits >> index & 1)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def _mask(indices) -> int:
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def _symbols(bits: int, symbols=KEY_SYMBOLS) -> list:
+    return [symbols[index] for index in range(len(symbols)) if bits >> index & 1]
+
+
+class RolloverTest:
+    """
+    조합 키(chords)를 순서대로 진행하는 롤오버 테스트입니다.
+    조합의 모든 키가 동시에 눌리면 통과하고 다음 조합으로 넘어갑니다.
+    끝까지 함께 눌리지 않은 키는 차단된 키(blocked)로, 조합 진행 중 조합 밖에서
+    들어온 키는 고스트 키(ghost)로 기록합니다.
+    """
+
+    def __init__(self, chords=ROLLOVER_CHORDS, key_index=KEY_INDEX):
+        self.key_index = key_index
+        self.chords = [(name, tuple(keys), _mask(key_index[key] for key in keys)) for name, keys in chords]
+        self.held = HeldKeySet()
+        self.max_simultaneous = 0
+        self.results = []
+        self.current = 0
+        self._start_chord()
+
+    @property
+    def done(self) -> bool:
+        return self.current >= len(self.chords)
+
+    @property
+    def current_chord(self):
+        """
+        진행 중인 조합의 (이름, 키 심볼 튜플)을 반환합니다. 모두 끝났으면 None.
+        """
+        if self.done:
+            return None
+        name, keys, _ = self.chords[self.current]
+        return name, keys
+
+    def _start_chord(self) -> None:
+        self._chord_best = 0
+        self._chord_best_bits = 0
+        self._ghost_bits = 0
+        if not self.done:
+            # 이전 조합에서 계속 누르고 있는 키도 반영합니다. (조합 전환 시 한 번만 계산)
+            self._chord_held = bin(self.held.bits & self.chords[self.current][2]).count("1")
+            self._update_best()
+
+    def _update_best(self) -> None:
+        if self._chord_held > self._chord_best:
+            self._chord_best = self._chord_held
+            self._chord_best_bits = self.held.bits & self.chords[self.current][2]
+
+    def _finish_chord(self, passed: bool) -> None:
+        name, keys, mask = self.chords[self.current]
+        self.results.append({
+            "name": name,
+            "passed": passed,
+            "max_held": self._chord_best,
+            "blocked": [] if passed else _symbols(mask & ~self._chord_best_bits),
+            "ghost": _symbols(self._ghost_bits),
+        })
+        self.current += 1
+        self._start_chord()
+
+    def feed(self, events) -> bool:
+        """
+        (timestamp, 심볼, key_down 여부) 이벤트를 반영합니다.
+        조합이 통과되어 다음 조합으로 넘어가면 True 를 반환합니다.
+        """
+        key_index = self.key_index
+        held = self.held
+        advanced = False
+        for _, sym, is_down in events:
+            index = key_index.get(sym)
+            if index is None:
+                continue
+            if self.done:
+                if is_down:
+                    held.press(index)
+                else:
+                    held.release(index)
+                continue
+            in_chord = self.chords[self.current][2] >> index & 1
+            if is_down:
+                if not held.press(index):
+                    continue
+                if held.count > self.max_simultaneous:
+                    self.max_simultaneous = held.count
+                if in_chord:
+                    self._chord_held += 1
+                    self._update_best()
+                    if self._chord_held == len(self.chords[self.current][1]):
+                        self._finish_chord(True)
+                        advanced = True
+                elif self._chord_held >= 2:
+                    # 조합 키를 누르는 중에 조합 밖의 키가 들어오면 고스팅 후보로 기록합니다.
+                    self._ghost_bits |= 1 << index
+            elif held.release(index) and in_chord:
+                self._chord_held -= 1
+        return advanced
+
+    def skip(self) -> None:
+        """
+        진행 중인 조합을 실패로 기록하고 다음 조합으로 넘어갑니다.
+        """
+        if not self.done:
+            self._finish_chord(False)
+
+    def abort(self) -> None:
+        """
+        남은 조합을 모두 실패로 기록합니다.
+        """
+        while not self.done:
+            self._finish_chord(False)
+
+    def result(self) -> dict:
+        return {
+            "max_simultaneous": self.max_simultaneous,
+            "passed": bool(self.results) and all(chord["passed"] for chord in self.results),
+            "chords": list(self.results),
+        }
+
+
+def benchmark(events: int, chord_size: int = 8, seed: int = 0) -> dict:
+    """
+    무작위 키로 chord_size 개씩 누르고 떼는 이벤트 스트림을 처리하는 속도를 측정합니다.
+    """
+    rng = random.Random(seed)
+    stream = []
+    while len(stream) < events:
+        keys = rng.sample(KEY_SYMBOLS, chord_size)
+        stream.extend((0.0, key, True) for key in keys)
+        stream.extend((0.0, key, False) for key in keys)
+    stream = stream[:events]
+    test = RolloverTest()
+    start = time.perf_counter()
+    test.feed(stream)
+    elapsed = time.perf_counter() - start
+    return {
+        "events": len(stream),
+        "chord_size": chord_size,
+        "elapsed_s": round(elapsed, 6),
+        "ns_per_event": round(elapsed / max(len(stream), 1) * 1e9, 1),
+        "max_simultaneous": test.max_simultaneous,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="롤오버 테스트 이벤트 처리 벤치마크")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--chord", type=int, action="append", help="동시에 누를 키 수 (여러 번 지정 가능)")
+    args = parser.parse_args()
+    for size in args.chord or [2, 8, 32]:
+        print(benchmark(args.events, size))
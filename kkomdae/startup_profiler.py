@@ -0,0 +1,80 @@
+# ===============================
+# 시작 단계별 소요 시간 측정
+# ===============================
+# TestApp 생성 과정(모듈 임포트, 테마 초기화, 카드 생성, 첫 idle 콜백)을
+# time.perf_counter_ns 기반의 단조 고해상도 타이머로 측정하고 JSON 으로 출력합니다.
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """
+    이름 붙은 구간(phase)의 시작 시각과 소요 시간을 기록합니다.
+    모든 시각은 origin_ns(프로세스 시작 기준점)로부터의 상대값으로 보고합니다.
+    """
+
+    def __init__(self, origin_ns: int = None):
+        self.origin_ns = time.perf_counter_ns() if origin_ns is None else origin_ns
+        self.phases = []
+        # None 이면 출력하지 않음, "-" 이면 표준 출력, 그 외에는 파일 경로
+        self.output = None
+        self.finished = False
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """
+        이미 측정한 구간을 기록합니다.
+        """
+        self.phases.append((name, start_ns, end_ns - start_ns))
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        with 블록 실행 시간을 name 구간으로 기록합니다.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter_ns())
+
+    def as_dict(self) -> dict:
+        phases = [
+            {
+                "name": name,
+                "start_ms": round((start - self.origin_ns) / 1e6, 3),
+                "duration_ms": round(duration / 1e6, 3),
+            }
+            for name, start, duration in self.phases
+        ]
+        end_ns = max((start + duration for _, start, duration in self.phases), default=self.origin_ns)
+        return {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "total_ms": round((end_ns - self.origin_ns) / 1e6, 3),
+            "phases": phases,
+        }
+
+    def finish(self) -> None:
+        """
+        측정을 마치고 output 이 지정되어 있으면 결과를 출력합니다. (한 번만 실행)
+        """
+        if self.finished:
+            return
+        self.finished = True
+        if self.output:
+            self.dump(self.output)
+
+    def dump(self, output: str = "-") -> None:
+        """
+        측정 결과를 JSON 으로 출력합니다. output 이 "-" 이면 표준 출력에 씁니다.
+        """
+        text = json.dumps(self.as_dict(), ensure_ascii=False, indent=2)
+        if output == "-":
+            # 콘솔 없는(--noconsole) exe 에서는 sys.stdout 이 None 입니다.
+            if sys.stdout is not None:
+                print(text)
+        else:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
@@ -0,0 +1,93 @@
+# ===============================
+# 첫 화면 표시까지의 시간 비교 (즉시 임포트 vs 지연 임포트)
+# ===============================
+# 새 프로세스마다 무거운 모듈(kkomdae.lazy.HEAVY_MODULES)을 창보다 먼저 불러오는 경우(eager)와
+# 지연 로딩하는 경우(lazy)에 Tk 창을 만들고 첫 update_idletasks() 가 끝날 때까지의 시간을
+# 여러 번 측정해 중앙값을 출력합니다. 임포트 캐시가 섞이지 않도록 측정마다 새 인터프리터를 띄웁니다.
+# 두 모드 모두 앱 스크립트(--app)를 임포트해 앱과 같은 모듈(ttkbootstrap, PIL, kkomdae.*)을 불러오므로,
+# 차이는 무거운 모듈을 먼저 불러오는지 여부뿐입니다.
+# 디스플레이가 없으면 창 생성은 건너뛰고(paint_ms = None) 첫 화면 전에 치르는 임포트 시간만 비교합니다.
+#
+# 앱 전체의 단계별 시간은 kkomdae_port*.py --profile-startup [--eager-imports] 로 확인합니다.
+#
+# 사용 예) python -m kkomdae.startup_timing --runs 5
+#          python -m kkomdae.startup_timing --app kkomdae_port3_250310
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODES = ("eager", "lazy")
+DEFAULT_APP = "kkomdae_port1_250310"
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_once(mode: str, app: str = DEFAULT_APP) -> dict:
+    """
+    현재 프로세스에서 한 번 측정합니다. (새 인터프리터에서 호출해야 의미가 있음)
+    app 은 앱 스크립트 모듈 이름으로, 최상위에서 임포트만 하므로 창은 만들지 않습니다.
+    """
+    start = time.perf_counter_ns()
+    importlib.import_module(app)
+    from kkomdae.lazy import load_all
+    if mode == "eager":
+        # 앱의 --eager-imports 와 같은 순서 (모듈 임포트 뒤, 창 생성 전)
+        load_all()
+    imported = time.perf_counter_ns()
+
+    import tkinter
+    paint_ms = None
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        root = None
+    if root is not None:
+        root.title("KkomDae Diagnostics")
+        tkinter.Label(root, text="KkomDae Diagnostics").pack()
+        root.update_idletasks()
+        paint_ms = round((time.perf_counter_ns() - start) / 1e6, 1)
+        root.destroy()
+    return {"mode": mode, "import_ms": round((imported - start) / 1e6, 1), "paint_ms": paint_ms}
+
+
+def run_measurements(runs: int = 5, app: str = DEFAULT_APP) -> dict:
+    """
+    모드마다 runs 번 새 프로세스로 측정해 {모드: {"import_ms", "paint_ms", "runs"}} 중앙값을 반환합니다.
+    """
+    samples = {mode: [] for mode in MODES}
+    for _ in range(runs):
+        # 모드를 번갈아 실행해 디스크 캐시 상태가 한쪽에만 유리하지 않게 합니다.
+        for mode in MODES:
+            output = subprocess.run([sys.executable, "-m", "kkomdae.startup_timing", "--child", mode, "--app", app],
+                                    cwd=_PACKAGE_ROOT, capture_output=True, text=True, check=True).stdout
+            samples[mode].append(json.loads(output))
+
+    def median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 1) if values else None
+
+    return {
+        mode: {
+            "import_ms": median(s["import_ms"] for s in rows),
+            "paint_ms": median(s["paint_ms"] for s in rows),
+            "runs": len(rows),
+        }
+        for mode, rows in samples.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="첫 화면 표시까지의 시간 비교 (즉시 임포트 vs 지연 임포트)")
+    parser.add_argument("--runs", type=int, default=5, help="모드별 측정 횟수")
+    parser.add_argument("--app", default=DEFAULT_APP, help=f"임포트할 앱 스크립트 모듈 (기본: {DEFAULT_APP})")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_once(args.child, args.app)))
+    else:
+        print(json.dumps(run_measurements(args.runs, args.app), ensure_ascii=False, indent=2))
@@ -0,0 +1,83 @@
+# ===============================
+# USB 포트별 연결 -> 인식(열거) 지연 시간
+# ===============================
+# 장치를 꽂은 뒤 포트에 인식되기까지의 시간을 포트별로 기록합니다. (허브 불량의 초기 징후)
+# 사용자 모드에서 전기적 연결 순간은 볼 수 없으므로, 시작 시각은 장치에 대한 첫 OS 신호
+# (Windows: 새 devnode 가 생길 때 오는 DBT_DEVNODES_CHANGED)이고,
+# 끝 시각은 USB 장치 인터페이스 도착을 포트에 반영한 시각입니다.
+#
+# 장치를 뽑을 때도 DBT_DEVNODES_CHANGED 가 오므로, 해제 직후(removal_quiet_s)의 신호는 무시합니다.
+# DBT_DEVNODES_CHANGED 는 특정 장치가 아니라 시스템 전체의 장치 트리 변경(블루투스, 카메라 전원 관리 등)에도
+# 오므로, 시작 신호는 MAX_PENDING_S 동안만 유효합니다. 이보다 오래된 신호를 시작으로 쓰면 관계없는 변경부터
+# 잰 값이 되어 정상 포트도 느리게 보입니다. (경고 기준 ENUMERATION_WARN_MS 의 몇 배로, 그보다 오래 걸린
+# 인식은 재지 않습니다.) USB 장치 인터페이스 도착(DBT_DEVICEARRIVAL)은 끝 시각으로 쓰므로
+# 시작 기준으로 삼으면 지연 시간이 0 에 가까워져 쓸 수 없습니다.
+ENUMERATION_WARN_MS = 1000.0
+MAX_PENDING_S = 5.0
+
+
+class EnumerationLatencyTracker:
+    """
+    포트별 열거 지연 시간(ms) 통계를 관리합니다.
+    """
+
+    def __init__(self, warn_ms: float = ENUMERATION_WARN_MS, removal_quiet_s: float = 1.0,
+                 max_pending_s: float = MAX_PENDING_S):
+        self.warn_ms = warn_ms
+        self.removal_quiet_s = removal_quiet_s
+        self.max_pending_s = max_pending_s
+        self._pending = None
+        self._last_removal = None
+        # 포트 번호 -> [횟수, 마지막, 최소, 최대] (ms)
+        self._stats = {}
+
+    def plug_signal(self, t: float) -> None:
+        """
+        새 장치의 첫 신호 시각을 기록합니다. (이미 대기 중이면 더 이른 시각을 유지)
+        """
+        if self._pending is not None and t - self._pending <= self.max_pending_s:
+            return
+        if self._last_removal is not None and t - self._last_removal < self.removal_quiet_s:
+            return
+        self._pending = t
+
+    def removed(self, t: float) -> None:
+        self._pending = None
+        self._last_removal = t
+
+    def enumerated(self, port: int, t: float):
+        """
+        포트에 장치가 인식된 시각을 기록하고 지연 시간(ms)을 반환합니다. 시작 신호가 없으면 None.
+        """
+        start, self._pending = self._pending, None
+        if start is None or t - start > self.max_pending_s:
+            return None
+        latency_ms = (t - start) * 1000.0
+        stats = self._stats.get(port)
+        if stats is None:
+            self._stats[port] = [1, latency_ms, latency_ms, latency_ms]
+        else:
+            stats[0] += 1
+            stats[1] = latency_ms
+            stats[2] = min(stats[2], latency_ms)
+            stats[3] = max(stats[3], latency_ms)
+        return latency_ms
+
+    def is_slow(self, port: int) -> bool:
+        stats = self._stats.get(port)
+        return stats is not None and stats[3] > self.warn_ms
+
+    def table(self) -> dict:
+        """
+        {포트 번호: {"count", "last_ms", "min_ms", "max_ms", "slow"}} 를 반환합니다.
+        """
+        return {
+            port: {
+                "count": count,
+                "last_ms": round(last, 1),
+                "min_ms": round(low, 1),
+                "max_ms": round(high, 1),
+                "slow": high > self.warn_ms,
+            }
+            for port, (count, last, low, high) in sorted(self._stats.items())
+        }
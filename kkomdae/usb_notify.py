@@ -0,0 +1,139 @@
+# ===============================
+# USB 장치 연결/해제 알림 (RegisterDeviceNotification)
+# ===============================
+# 새로고침 버튼으로 WMI 전체 조회를 반복하는 대신, 창에 USB 장치 인터페이스 알림을 등록하고
+# WM_DEVICECHANGE(DBT_DEVICEARRIVAL / DBT_DEVICEREMOVECOMPLETE) 로 들어온 장치 하나만 해석합니다.
+# dbcc_name 은 "\\?\USB#VID_xxxx&PID_xxxx#<인스턴스>#{GUID}" 형식의 장치 경로이므로
+# PNPDeviceID("USB\VID_xxxx&PID_xxxx\<인스턴스>")로 바꿔 usb_ports 와 같은 규칙으로 포트를 찾습니다.
+import ctypes
+import logging
+import time
+from ctypes import wintypes
+
+from kkomdae.usb_ports import usb_port_number
+from kkomdae.win32 import (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE, DBT_DEVNODES_CHANGED,
+                           DBT_DEVTYP_DEVICEINTERFACE, IS_WINDOWS, WM_DEVICECHANGE, WindowSubclass, user32)
+
+DEVICE_NOTIFY_WINDOW_HANDLE = 0x00000000
+
+
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", ctypes.c_ulong),
+        ("Data2", ctypes.c_ushort),
+        ("Data3", ctypes.c_ushort),
+        ("Data4", ctypes.c_ubyte * 8)
+    ]
+
+
+# GUID_DEVINTERFACE_USB_DEVICE {A5DCBF10-6530-11D2-901F-00C04FB951ED}
+GUID_DEVINTERFACE_USB_DEVICE = GUID(0xA5DCBF10, 0x6530, 0x11D2,
+                                    (ctypes.c_ubyte * 8)(0x90, 0x1F, 0x00, 0xC0, 0x4F, 0xB9, 0x51, 0xED))
+
+
+class DEV_BROADCAST_HDR(ctypes.Structure):
+    _fields_ = [
+        ("dbch_size", wintypes.DWORD),
+        ("dbch_devicetype", wintypes.DWORD),
+        ("dbch_reserved", wintypes.DWORD)
+    ]
+
+
+class DEV_BROADCAST_DEVICEINTERFACE_W(ctypes.Structure):
+    _fields_ = [
+        ("dbcc_size", wintypes.DWORD),
+        ("dbcc_devicetype", wintypes.DWORD),
+        ("dbcc_reserved", wintypes.DWORD),
+        ("dbcc_classguid", GUID),
+        ("dbcc_name", ctypes.c_wchar * 1)
+    ]
+
+
+if IS_WINDOWS:
+    user32.RegisterDeviceNotificationW.restype = wintypes.HANDLE
+    user32.RegisterDeviceNotificationW.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+    user32.UnregisterDeviceNotification.restype = wintypes.BOOL
+    user32.UnregisterDeviceNotification.argtypes = [wintypes.HANDLE]
+
+
+def device_path_to_pnp_id(device_path: str) -> str:
+    """
+    장치 인터페이스 경로를 PNPDeviceID 형식으로 변환합니다.
+    "\\\\?\\USB#VID_046D&PID_C52B#5&1A2B3C&0&2#{a5dcbf10-...}" -> "USB\\VID_046D&PID_C52B\\5&1A2B3C&0&2"
+    """
+    path = device_path
+    if path.startswith("\\\\?\\") or path.startswith("\\??\\"):
+        path = path[4:]
+    guid_start = path.rfind("#{")
+    if guid_start != -1:
+        path = path[:guid_start]
+    return path.replace("#", "\\").upper()
+
+
+def read_device_path(lParam) -> str:
+    """
+    WM_DEVICECHANGE 의 lParam(DEV_BROADCAST_HDR*)에서 장치 인터페이스 경로를 읽습니다.
+    장치 인터페이스 알림이 아니면 None.
+    """
+    if not lParam:
+        return None
+    header = DEV_BROADCAST_HDR.from_address(lParam)
+    if header.dbch_devicetype != DBT_DEVTYP_DEVICEINTERFACE:
+        return None
+    return ctypes.wstring_at(lParam + DEV_BROADCAST_DEVICEINTERFACE_W.dbcc_name.offset)
+
+
+class UsbDeviceNotifier:
+    """
+    창(hwnd)에 USB 장치 인터페이스 알림을 등록하고,
+    장치가 연결/해제될 때 on_change(포트 번호, 연결 여부, PNPDeviceID, 수신 시각)를 호출합니다.
+    포트 번호를 알 수 없는 장치(허브 하위 장치 등)는 무시합니다.
+    on_devnodes_changed(수신 시각)는 장치 트리가 바뀔 때(DBT_DEVNODES_CHANGED) 호출됩니다.
+    수신 시각은 time.perf_counter() 기준입니다.
+    """
+
+    def __init__(self, hwnd: int, on_change, on_devnodes_changed=None):
+        if not IS_WINDOWS:
+            raise OSError("USB 장치 알림은 Windows 에서만 지원합니다.")
+        self.hwnd = hwnd
+        self._on_change = on_change
+        self._on_devnodes_changed = on_devnodes_changed
+        self._subclass = WindowSubclass(hwnd, self._wnd_proc)
+
+        notification_filter = DEV_BROADCAST_DEVICEINTERFACE_W()
+        notification_filter.dbcc_size = ctypes.sizeof(DEV_BROADCAST_DEVICEINTERFACE_W)
+        notification_filter.dbcc_devicetype = DBT_DEVTYP_DEVICEINTERFACE
+        notification_filter.dbcc_classguid = GUID_DEVINTERFACE_USB_DEVICE
+        self._handle = user32.RegisterDeviceNotificationW(
+            hwnd, ctypes.byref(notification_filter), DEVICE_NOTIFY_WINDOW_HANDLE
+        )
+        if not self._handle:
+            error = ctypes.WinError()
+            self._subclass.detach()
+            raise error
+
+    def close(self) -> None:
+        if self._handle:
+            user32.UnregisterDeviceNotification(self._handle)
+            self._handle = None
+        self._subclass.detach()
+
+    def _wnd_proc(self, hWnd, msg, wParam, lParam):
+        if msg != WM_DEVICECHANGE:
+            return None
+        timestamp = time.perf_counter()
+        if wParam == DBT_DEVNODES_CHANGED:
+            if self._on_devnodes_changed is not None:
+                self._on_devnodes_changed(timestamp)
+            return None
+        if wParam not in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE):
+            return None
+        device_path = read_device_path(lParam)
+        if device_path:
+            pnp_id = device_path_to_pnp_id(device_path)
+            port = usb_port_number(pnp_id)
+            logging.debug(f"USB 장치 알림: {pnp_id} (port {port})")
+            if port is not None:
+                self._on_change(port, wParam == DBT_DEVICEARRIVAL, pnp_id, timestamp)
+        # 다른 처리기(Tk 등)도 메시지를 받도록 넘깁니다.
+        return None
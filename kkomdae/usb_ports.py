@@ -0,0 +1,177 @@
+# ===============================
+# USB 포트 인식 (WMI)
+# ===============================
+# Win32_PnPEntity 전체를 COM 으로 순회하면 장치가 수백 개인 PC 에서 새로고침마다 수 초가 걸립니다.
+# WQL 의 LIKE 필터로 USB 장치만 서버(WMI) 쪽에서 거르고, PNPDeviceID 속성만 가져오며,
+# forward-only + 반동기(semi-synchronous) 열거로 결과를 받습니다.
+#
+# 사용 예)
+#   python -m kkomdae.usb_ports --record devices.json     # (Windows) 현재 PC 의 PNPDeviceID 목록 저장
+#   python -m kkomdae.usb_ports --replay devices.json     # 저장된 목록으로 두 방식 비교
+#   python -m kkomdae.usb_ports --synthetic 2000          # 합성 목록으로 비교
+#   python -m kkomdae.usb_ports --live                    # (Windows) 실제 WMI 질의 시간 비교
+import argparse
+import json
+import random
+import re
+import time
+
+from kkomdae.lazy import win32com
+
+# PNPDeviceID 끝의 "&0&<포트 번호>"
+USB_PORT_PATTERN = re.compile(r"&0&(\d)$")
+
+# LIKE 'USB%' 는 USBSTOR\ 등도 포함하므로 USB\ 접두사는 Python 에서 한 번 더 확인합니다.
+WQL_USB_QUERY = "SELECT PNPDeviceID FROM Win32_PnPEntity WHERE PNPDeviceID LIKE 'USB%'"
+WBEM_FLAG_RETURN_IMMEDIATELY = 0x10
+WBEM_FLAG_FORWARD_ONLY = 0x20
+
+
+def usb_port_number(device_id: str):
+    """
+    USB 장치의 PNPDeviceID 에서 포트 번호(int)를 추출합니다. USB\\ 장치가 아니거나 형식이 다르면 None.
+    """
+    device_path = device_id.upper()
+    if not device_path.startswith("USB\\"):
+        return None
+    match = USB_PORT_PATTERN.search(device_path)
+    return int(match.group(1)) if match else None
+
+
+def find_usb_ports(device_ids) -> set:
+    """
+    PNPDeviceID 목록에서 장치가 연결된 포트 번호 집합을 반환합니다.
+    """
+    ports = set()
+    for device_id in device_ids:
+        if device_id:
+            port = usb_port_number(device_id)
+            if port is not None:
+                ports.add(port)
+    return ports
+
+
+def query_usb_device_ids(wmi=None) -> list:
+    """
+    WQL 필터로 USB 장치의 PNPDeviceID 만 조회합니다.
+    """
+    if wmi is None:
+        wmi = win32com.client.GetObject("winmgmts:")
+    result = wmi.ExecQuery(WQL_USB_QUERY, "WQL", WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY)
+    return [entity.PNPDeviceID for entity in result]
+
+
+def query_all_device_ids(wmi=None) -> list:
+    """
+    (비교용) 기존 방식처럼 Win32_PnPEntity 전체를 열거해 PNPDeviceID 를 모읍니다.
+    """
+    if wmi is None:
+        wmi = win32com.client.GetObject("winmgmts:")
+    device_ids = []
+    for entity in wmi.InstancesOf("Win32_PnPEntity"):
+        if hasattr(entity, "PNPDeviceID") and entity.PNPDeviceID:
+            device_ids.append(entity.PNPDeviceID)
+    return device_ids
+
+
+# ===============================
+# 벤치마크
+# ===============================
+def legacy_scan(device_ids) -> set:
+    """
+    기존 refresh_usb_check 의 Python 쪽 처리 (전체 목록 순회, 매번 정규식 컴파일 조회)
+    """
+    ports = set()
+    for device_id in device_ids:
+        device_path = device_id.upper()
+        if not device_path.startswith("USB\\"):
+            continue
+        match = re.search(r'&0&(\d)$', device_path)
+        if match:
+            ports.add(int(match.group(1)))
+    return ports
+
+
+def like_usb(device_ids) -> list:
+    """
+    WQL LIKE 'USB%' 필터 결과를 흉내 냅니다. (WQL 문자열 비교는 대소문자를 구분하지 않음)
+    """
+    return [device_id for device_id in device_ids if device_id[:3].upper() == "USB"]
+
+
+def synthetic_device_ids(count: int, usb_ratio: float = 0.1, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    prefixes = ["ACPI\\PNP0C0A\\", "PCI\\VEN_8086&DEV_A0E8\\", "HID\\VID_046D&PID_C52B\\",
+                "SWD\\MMDEVAPI\\", "ROOT\\SYSTEM\\", "DISPLAY\\SDC4152\\", "USBSTOR\\DISK&VEN_SAMSUNG\\"]
+    device_ids = []
+    for i in range(count):
+        if rng.random() < usb_ratio:
+            device_ids.append(f"USB\\VID_{rng.randrange(0xFFFF):04X}&PID_{rng.randrange(0xFFFF):04X}\\"
+                              f"5&{rng.randrange(1 << 32):X}&0&{rng.randint(1, 9)}")
+        else:
+            device_ids.append(f"{rng.choice(prefixes)}{i:04X}")
+    return device_ids
+
+
+def benchmark(device_ids, repeat: int = 200) -> dict:
+    """
+    기록된 PNPDeviceID 목록으로 두 방식의 Python 쪽 처리 시간을 비교합니다.
+    (WQL 방식은 WMI 가 돌려주는 USB% 장치만 처리하므로, 필터링된 목록으로 측정합니다.)
+    COM 호출과 객체 마샬링 비용은 포함되지 않으며, 실제 WMI 시간은 --live 로 측정합니다.
+    """
+    filtered = like_usb(device_ids)
+    expected = legacy_scan(device_ids)
+    assert find_usb_ports(filtered) == expected
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        legacy_scan(device_ids)
+    legacy = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        find_usb_ports(filtered)
+    filtered_time = (time.perf_counter() - start) / repeat
+    return {
+        "devices": len(device_ids),
+        "usb_devices": len(filtered),
+        "ports": sorted(expected),
+        "legacy_us": round(legacy * 1e6, 1),
+        "wql_filtered_us": round(filtered_time * 1e6, 1),
+    }
+
+
+def benchmark_live(repeat: int = 5) -> dict:
+    """
+    (Windows) 실제 WMI 질의 시간을 비교합니다.
+    """
+    wmi = win32com.client.GetObject("winmgmts:")
+    timings = {}
+    for name, query in (("instances_of", query_all_device_ids), ("wql", query_usb_device_ids)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            device_ids = query(wmi)
+        timings[f"{name}_ms"] = round((time.perf_counter() - start) / repeat * 1000, 1)
+        timings[f"{name}_devices"] = len(device_ids)
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="USB 포트 인식 WMI 질의 벤치마크")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--record", metavar="PATH", help="현재 PC 의 PNPDeviceID 목록을 JSON 으로 저장")
+    group.add_argument("--replay", metavar="PATH", help="저장된 목록으로 비교")
+    group.add_argument("--synthetic", type=int, metavar="N", help="합성 장치 N 개로 비교")
+    group.add_argument("--live", action="store_true", help="실제 WMI 질의 시간 비교")
+    args = parser.parse_args()
+
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as f:
+            json.dump(query_all_device_ids(), f, ensure_ascii=False, indent=1)
+    elif args.replay:
+        with open(args.replay, encoding="utf-8") as f:
+            print(benchmark(json.load(f)))
+    elif args.synthetic:
+        print(benchmark(synthetic_device_ids(args.synthetic)))
+    else:
+        print(benchmark_live())
@@ -0,0 +1,339 @@
+# ===============================
+# USB 저장장치 속도 / 무결성 테스트
+# ===============================
+# 포트에 장치가 인식되는 것만으로는 USB 2.0 으로 협상된 포트나 데이터를 깨뜨리는 포트를 찾을 수 없습니다.
+# 포트에 꽂힌 USB 메모리에 의사 난수 파일을 큰 정렬 버퍼로 쓰고 다시 읽어
+# 스트리밍 해시(blake2b)로 검증하며, 포트별 쓰기/읽기 MB/s 를 측정합니다.
+#   - 버퍼는 mmap 익명 매핑(페이지 정렬)을 재사용하며, 페이지 캐시를 우회해 실제 장치에서 읽습니다.
+#     Linux 는 O_DIRECT (지원하지 않는 tmpfs 등은 fsync + 캐시 비우기(posix_fadvise)),
+#     Windows 는 CreateFileW(FILE_FLAG_NO_BUFFERING | FILE_FLAG_WRITE_THROUGH) 를 사용합니다.
+#   - 캐시를 우회하지 못하면 읽기 속도와 무결성은 캐시에서 읽은 값일 수 있으므로
+#     통과로 보고하지 않고 "verified": False (검증 불가)로 표시합니다.
+#   - 서로 다른 버스(루트 허브)의 포트는 병렬로, 같은 버스의 포트는 순서대로 테스트합니다.
+#   - USB 2.0 협상 여부(usb2_suspect)는 장치의 협상 속도(Linux sysfs speed, Mbps)를 알면 그것으로 판정하고,
+#     모르면(Windows 등) 읽기 속도가 USB2_MAX_MB_S 미만인지로 추정합니다. 느린 USB 메모리도 의심으로
+#     나오므로 추정은 참고용이며, 어느 쪽으로 판정했는지 "usb2_by"("link" / "read_speed")에 남깁니다.
+#
+# 사용 예)
+#   python -m kkomdae.usb_storage --target /dev/shm --size-mb 64        # tmpfs 로 로컬 확인
+#   python -m kkomdae.usb_storage --ports                               # (Linux) 포트별 마운트된 USB 메모리 테스트
+import argparse
+import ctypes
+import hashlib
+import mmap
+import os
+import random
+import re
+import struct
+import threading
+import time
+from ctypes import wintypes
+
+from kkomdae.win32 import IS_WINDOWS
+
+BLOCK_SIZE = 8 * 1024 * 1024
+DEFAULT_SIZE_MB = 256
+TEST_FILE_NAME = "kkomdae_usb_test.bin"
+# 읽기 속도가 이보다 낮으면 USB 2.0(이론상 60MB/s, 실측 약 35~40MB/s)으로 협상된 것으로 의심합니다.
+USB2_MAX_MB_S = 45.0
+# 협상 속도(Mbps)가 이보다 낮으면 USB 2.0 이하로 협상된 것입니다. (USB 3.x SuperSpeed = 5000)
+USB3_MIN_MBPS = 5000
+_MB = 1024 * 1024
+
+GENERIC_READ = 0x80000000
+GENERIC_WRITE = 0x40000000
+FILE_SHARE_READ = 0x00000001
+CREATE_ALWAYS = 2
+OPEN_EXISTING = 3
+FILE_ATTRIBUTE_NORMAL = 0x00000080
+FILE_FLAG_NO_BUFFERING = 0x20000000
+FILE_FLAG_WRITE_THROUGH = 0x80000000
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+if IS_WINDOWS:
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                     wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    kernel32.WriteFile.restype = wintypes.BOOL
+    kernel32.WriteFile.argtypes = [wintypes.HANDLE, wintypes.LPCVOID, wintypes.DWORD,
+                                   ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+    kernel32.ReadFile.restype = wintypes.BOOL
+    kernel32.ReadFile.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD,
+                                  ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+    kernel32.FlushFileBuffers.restype = wintypes.BOOL
+    kernel32.FlushFileBuffers.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+else:
+    kernel32 = None
+
+
+class _PosixTestFile:
+    """
+    O_DIRECT 로 열어 보고, 지원하지 않으면 일반 모드로 엽니다.
+    일반 모드는 fsync 후 posix_fadvise(DONTNEED) 로 캐시를 비워야 캐시를 우회한 것으로 봅니다.
+    """
+
+    def __init__(self, path: str, buffer: mmap.mmap, write: bool):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC if write else os.O_RDONLY
+        self.view = memoryview(buffer)
+        self.uncached = False
+        direct = getattr(os, "O_DIRECT", 0)
+        if direct:
+            try:
+                self.fd = os.open(path, flags | direct, 0o644)
+                self.uncached = True
+                return
+            except OSError:
+                pass
+        self.fd = os.open(path, flags, 0o644)
+
+    def write(self, size: int) -> None:
+        offset = 0
+        while offset < size:
+            offset += os.write(self.fd, self.view[offset:size])
+
+    def readinto(self) -> int:
+        return os.readv(self.fd, [self.view])
+
+    def sync(self) -> None:
+        os.fsync(self.fd)
+        if not self.uncached and hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(self.fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                self.uncached = True
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        self.view.release()
+        os.close(self.fd)
+
+
+class _WindowsTestFile:
+    """
+    FILE_FLAG_NO_BUFFERING 으로 열어 시스템 캐시를 거치지 않고 읽고 씁니다.
+    버퍼 주소와 크기, 파일 위치가 섹터 크기의 배수여야 하므로 페이지 정렬된 mmap 버퍼와
+    BLOCK_SIZE 단위 블록을 그대로 넘깁니다. 쓰기는 FILE_FLAG_WRITE_THROUGH 로 장치까지 바로 기록합니다.
+    """
+
+    def __init__(self, path: str, buffer: mmap.mmap, write: bool):
+        flags = FILE_ATTRIBUTE_NORMAL | FILE_FLAG_NO_BUFFERING
+        if write:
+            flags |= FILE_FLAG_WRITE_THROUGH
+        self.uncached = True
+        handle = self._create(path, write, flags)
+        if handle is None:
+            # 섹터 크기가 맞지 않는 등 버퍼링 없이 열 수 없는 장치는 일반 모드로 열고 검증 불가로 표시합니다.
+            self.uncached = False
+            handle = self._create(path, write, flags & ~FILE_FLAG_NO_BUFFERING)
+            if handle is None:
+                raise ctypes.WinError(ctypes.get_last_error())
+        self.handle = handle
+        # from_buffer 는 mmap 을 내보내기(export) 상태로 잡아 두므로 close() 에서 반드시 놓습니다.
+        self._array = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+        self._size = len(buffer)
+
+    @staticmethod
+    def _create(path: str, write: bool, flags: int):
+        handle = kernel32.CreateFileW(path, GENERIC_WRITE if write else GENERIC_READ, FILE_SHARE_READ, None,
+                                      CREATE_ALWAYS if write else OPEN_EXISTING, flags, None)
+        if handle is None or handle == INVALID_HANDLE_VALUE:
+            return None
+        return handle
+
+    def write(self, size: int) -> None:
+        done = wintypes.DWORD()
+        if not kernel32.WriteFile(self.handle, self._array, size, ctypes.byref(done), None):
+            raise ctypes.WinError(ctypes.get_last_error())
+        if done.value != size:
+            raise OSError(f"WriteFile 이 {size} 바이트 중 {done.value} 바이트만 썼습니다.")
+
+    def readinto(self) -> int:
+        done = wintypes.DWORD()
+        if not kernel32.ReadFile(self.handle, self._array, self._size, ctypes.byref(done), None):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return done.value
+
+    def sync(self) -> None:
+        if not kernel32.FlushFileBuffers(self.handle):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def close(self) -> None:
+        self._array = None
+        kernel32.CloseHandle(self.handle)
+
+
+_TestFile = _WindowsTestFile if IS_WINDOWS else _PosixTestFile
+
+
+def storage_test(directory: str, size_mb: int = DEFAULT_SIZE_MB, block_size: int = BLOCK_SIZE,
+                 seed: int = 0, keep: bool = False, link_mbps: float = None) -> dict:
+    """
+    directory 에 size_mb 크기의 테스트 파일을 쓰고 다시 읽어 속도와 무결성을 확인합니다.
+    link_mbps 는 장치의 협상 속도로, 알면 읽기 속도 대신 이것으로 USB 2.0 여부를 판정합니다.
+    """
+    blocks = max(1, size_mb * _MB // block_size)
+    path = os.path.join(directory, TEST_FILE_NAME)
+    # 페이지 정렬된 재사용 버퍼 (O_DIRECT / FILE_FLAG_NO_BUFFERING 은 정렬된 버퍼/크기를 요구)
+    buffer = mmap.mmap(-1, block_size)
+    view = memoryview(buffer)
+    pattern = random.Random(seed).randbytes(block_size)
+    written = hashlib.blake2b()
+    result = {"directory": directory, "size_mb": blocks * block_size // _MB, "link_mbps": link_mbps}
+    try:
+        # 쓰기: 블록마다 앞부분에 블록 번호를 넣어 장치의 중복 제거/압축을 피합니다.
+        f = _TestFile(path, buffer, write=True)
+        # 속도는 해시 계산을 뺀 입출력 시간만으로 계산합니다.
+        write_time = 0.0
+        try:
+            for index in range(blocks):
+                buffer[:] = pattern
+                struct.pack_into("<QQ", buffer, 0, index, seed)
+                written.update(view)
+                start = time.perf_counter()
+                f.write(block_size)
+                write_time += time.perf_counter() - start
+            start = time.perf_counter()
+            f.sync()
+            write_time += time.perf_counter() - start
+            write_uncached = f.uncached
+        finally:
+            f.close()
+
+        # 읽기: 같은 버퍼에 큰 단위로 읽으며 해시를 갱신합니다.
+        f = _TestFile(path, buffer, write=False)
+        read_hash = hashlib.blake2b()
+        read_time = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                count = f.readinto()
+                read_time += time.perf_counter() - start
+                if not count:
+                    break
+                read_hash.update(view[:count])
+            verified = write_uncached or f.uncached
+        finally:
+            f.close()
+
+        total_mb = blocks * block_size / _MB
+        read_mb_s = round(total_mb / read_time, 1) if read_time > 0 else None
+        matched = read_hash.digest() == written.digest()
+        result.update({
+            # 캐시에서 읽었을 수 있으면 일치해도 통과로 보지 않습니다. (불일치는 그대로 실패)
+            "verified": verified,
+            "ok": None if matched and not verified else matched,
+            "write_mb_s": round(total_mb / write_time, 1) if write_time > 0 else None,
+            "read_mb_s": read_mb_s,
+        })
+        if link_mbps is not None:
+            result.update({"usb2_suspect": link_mbps < USB3_MIN_MBPS, "usb2_by": "link"})
+        else:
+            result.update({
+                "usb2_suspect": verified and read_mb_s is not None and read_mb_s < USB2_MAX_MB_S,
+                "usb2_by": "read_speed",
+            })
+    except OSError as e:
+        result.update({"ok": False, "error": str(e)})
+    finally:
+        view.release()
+        buffer.close()
+        if not keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return result
+
+
+def run_port_tests(targets: dict, size_mb: int = DEFAULT_SIZE_MB) -> dict:
+    """
+    {포트: (디렉터리, 버스, 협상 속도 Mbps 또는 None)} 를 테스트해 {포트: 결과} 를 반환합니다.
+    버스가 다른 포트는 병렬로, 같은 버스의 포트는 한 스레드에서 순서대로 테스트합니다.
+    """
+    groups = {}
+    for port, (directory, bus, link_mbps) in targets.items():
+        groups.setdefault(bus, []).append((port, directory, link_mbps))
+    results = {}
+
+    def run(items):
+        for port, directory, link_mbps in items:
+            results[port] = storage_test(directory, size_mb, link_mbps=link_mbps)
+
+    threads = [threading.Thread(target=run, args=(items,), name=f"kkomdae-usb-storage-{bus}", daemon=True)
+               for bus, items in groups.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+# ===============================
+# Linux: 포트별 마운트 위치 찾기
+# ===============================
+_USB_DEVICE_IN_PATH = re.compile(r"/(\d+-[\d.]+)/\1:")
+
+
+def _mount_points(mounts_path: str = "/proc/mounts") -> dict:
+    mounts = {}
+    try:
+        with open(mounts_path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 2 and fields[0].startswith("/dev/"):
+                    # /proc/mounts 는 공백을 \040 으로 표기합니다.
+                    mounts.setdefault(fields[0][5:], fields[1].replace("\\040", " "))
+    except OSError:
+        pass
+    return mounts
+
+
+def find_usb_mounts(usb_backend, block_root: str = "/sys/block", mounts_path: str = "/proc/mounts") -> dict:
+    """
+    포트별로 마운트된 USB 저장장치를 찾아 {포트: (마운트 위치, 버스, 협상 속도 Mbps)} 를 반환합니다.
+    usb_backend 는 kkomdae.usb_sysfs.SysfsUsbBackend 입니다.
+    """
+    mounts = _mount_points(mounts_path)
+    targets = {}
+    try:
+        disks = os.listdir(block_root)
+    except OSError:
+        return targets
+    for disk in disks:
+        match = _USB_DEVICE_IN_PATH.search(os.path.realpath(os.path.join(block_root, disk)))
+        if not match:
+            continue
+        usb_device = match.group(1)
+        port = usb_backend.port_of(usb_device)
+        if port is None or port in targets:
+            continue
+        names = [disk] + sorted(name for name in os.listdir(os.path.join(block_root, disk))
+                                if name.startswith(disk))
+        for name in names:
+            if name in mounts:
+                targets[port] = (mounts[name], usb_device.split("-", 1)[0], usb_backend.device_speed(usb_device))
+                break
+    return targets
+
+
+if __name__ == "__main__":
+    import json
+
+    parser = argparse.ArgumentParser(description="USB 저장장치 속도/무결성 테스트")
+    parser.add_argument("--target", action="append", metavar="DIR", help="테스트할 디렉터리 (여러 번 지정 시 병렬)")
+    parser.add_argument("--ports", action="store_true", help="(Linux) 포트별로 마운트된 USB 저장장치 자동 검색")
+    parser.add_argument("--size-mb", type=int, default=DEFAULT_SIZE_MB)
+    args = parser.parse_args()
+
+    if args.ports:
+        from kkomdae.usb_sysfs import SysfsUsbBackend
+        targets = find_usb_mounts(SysfsUsbBackend.for_model())
+    else:
+        # 디렉터리마다 다른 그룹으로 두어 병렬로 실행합니다.
+        targets = {directory: (directory, index, None) for index, directory in enumerate(args.target or [])}
+    if not targets:
+        parser.error("테스트할 대상이 없습니다. --target 또는 --ports 를 지정하세요.")
+    print(json.dumps(run_port_tests(targets, args.size_mb), ensure_ascii=False, indent=2))
@@ -0,0 +1,186 @@
+# ===============================
+# Linux sysfs USB 토폴로지 백엔드
+# ===============================
+# /sys/bus/usb/devices 의 장치 이름은 "<버스>-<포트>[.<허브 포트>...]" 형식의 버스-포트 경로입니다.
+# (예: "1-2" = 1번 버스 2번 포트, "1-2.3" = 그 포트에 연결된 허브의 3번 포트, "1-2:1.0" = 인터페이스)
+# 물리 포트 하나는 USB 2.0 버스와 USB 3.x(SuperSpeed) 버스에 각각 경로를 가지므로,
+# 모델별 프로파일(물리 포트 번호 -> 루트 버스-포트 경로들)로 역방향 색인을 만들어
+# 장치마다 딕셔너리 조회 한 번(O(1))으로 물리 포트를 찾습니다.
+#
+# 사용 예)
+#   python -m kkomdae.usb_sysfs                       # 현재 PC 스캔 결과
+#   python -m kkomdae.usb_sysfs --fake 5000           # 가짜 sysfs 트리(장치 5000개) 스캔 시간 측정
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from kkomdae.machine import machine_model
+
+SYSFS_USB_DEVICES = "/sys/bus/usb/devices"
+
+# 모델명 -> {물리 포트 번호: (루트 버스-포트 경로, ...)}
+# 프로파일이 없는 모델은 "default" 를 사용합니다. (1/2번 버스의 루트 포트 번호 = 물리 포트 번호)
+# 새 모델은 포트마다 장치를 꽂아 보며 python -m kkomdae.usb_sysfs 로 경로를 확인해 추가합니다.
+USB_PORT_PROFILES = {
+    "default": {
+        1: ("1-1", "2-1"),
+        2: ("1-2", "2-2"),
+        3: ("1-3", "2-3"),
+    },
+}
+
+
+def load_profiles(path: str, profiles: dict = USB_PORT_PROFILES) -> dict:
+    """
+    JSON 프로파일 파일({"모델": {"1": ["1-1", "2-1"], ...}})을 읽어 profiles 에 추가합니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    for model, ports in data.items():
+        profiles[model] = {int(port): tuple(paths) for port, paths in ports.items()}
+    return profiles
+
+
+class SysfsUsbBackend:
+    """
+    프로파일로 만든 버스-포트 경로 색인으로 /sys/bus/usb/devices 를 스캔합니다.
+    """
+
+    def __init__(self, profile: dict, sysfs_root: str = SYSFS_USB_DEVICES):
+        if not os.path.isdir(sysfs_root):
+            raise OSError(f"USB sysfs 경로가 없습니다: {sysfs_root}")
+        self.sysfs_root = sysfs_root
+        self.profile = profile
+        # 루트 버스-포트 경로 -> 물리 포트 번호
+        self.port_index = {path: port for port, paths in profile.items() for path in paths}
+
+    @classmethod
+    def for_model(cls, model: str = None, profiles: dict = USB_PORT_PROFILES,
+                  sysfs_root: str = SYSFS_USB_DEVICES) -> "SysfsUsbBackend":
+        """
+        모델명(생략 시 DMI product_name)에 맞는 프로파일로 백엔드를 생성합니다.
+        """
+        if model is None:
+            model = machine_model()
+        profile = profiles.get(model) or profiles["default"]
+        return cls(profile, sysfs_root)
+
+    def port_of(self, device_name: str):
+        """
+        sysfs 장치 이름의 물리 포트 번호를 반환합니다. 매핑되지 않은 장치/인터페이스/루트 허브는 None.
+        """
+        if ":" in device_name:
+            return None
+        return self.port_index.get(device_name.split(".", 1)[0])
+
+    def scan(self) -> dict:
+        """
+        물리 포트 번호 -> 연결된 장치 이름 리스트를 반환합니다.
+        """
+        ports = {}
+        port_index = self.port_index
+        with os.scandir(self.sysfs_root) as entries:
+            for entry in entries:
+                name = entry.name
+                if ":" in name:
+                    continue  # 인터페이스
+                port = port_index.get(name.split(".", 1)[0])
+                if port is not None:
+                    ports.setdefault(port, []).append(name)
+        return ports
+
+    def connected_ports(self) -> set:
+        """
+        장치가 연결된 물리 포트 번호 집합을 반환합니다.
+        """
+        return set(self.scan())
+
+    def device_speed(self, device_name: str):
+        """
+        장치의 협상 속도(Mbps, 예: 480 = USB 2.0, 5000 = USB 3.x)를 반환합니다.
+        """
+        try:
+            with open(os.path.join(self.sysfs_root, device_name, "speed"), encoding="utf-8") as f:
+                return float(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+
+# ===============================
+# 가짜 sysfs 트리 / 벤치마크
+# ===============================
+def make_fake_tree(root: str, devices) -> str:
+    """
+    root 아래에 장치 이름 목록으로 가짜 /sys/bus/usb/devices 트리를 만듭니다.
+    디렉터리와 speed 파일만 생성합니다. ("usbN" 루트 허브와 인터페이스 이름도 그대로 생성)
+    """
+    os.makedirs(root, exist_ok=True)
+    for name in devices:
+        path = os.path.join(root, name)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "speed"), "w", encoding="utf-8") as f:
+            f.write("5000\n" if name.startswith("2-") else "480\n")
+    return root
+
+
+def fake_device_names(count: int, buses: int = 4, ports: int = 8) -> list:
+    """
+    루트 허브, 루트 포트 장치, 허브 하위 장치와 인터페이스를 섞은 장치 이름 count 개를 만듭니다.
+    """
+    names = [f"usb{bus}" for bus in range(1, buses + 1)]
+    i = 0
+    while len(names) < count:
+        bus = i % buses + 1
+        port = i // buses % ports + 1
+        # 같은 루트 포트 뒤에 허브 단계를 늘려가며 고유한 경로를 만듭니다. (허브 포트 1~7)
+        path = f"{bus}-{port}"
+        depth = i // (buses * ports)
+        while depth:
+            path += f".{depth % 7 + 1}"
+            depth //= 7
+        names.append(path)
+        names.append(f"{path}:1.0")
+        i += 1
+    return names[:count]
+
+
+def benchmark(count: int, repeat: int = 20) -> dict:
+    with tempfile.TemporaryDirectory() as root:
+        make_fake_tree(root, fake_device_names(count))
+        backend = SysfsUsbBackend(USB_PORT_PROFILES["default"], root)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            ports = backend.scan()
+        elapsed = (time.perf_counter() - start) / repeat
+        return {
+            "entries": count,
+            "mapped_devices": sum(len(names) for names in ports.values()),
+            "ports": sorted(ports),
+            "scan_ms": round(elapsed * 1000, 3),
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="sysfs USB 포트 스캔")
+    parser.add_argument("--fake", type=int, metavar="N", help="가짜 sysfs 트리(항목 N 개)로 스캔 시간 측정")
+    parser.add_argument("--model", default=None, help="사용할 프로파일 모델명 (기본: DMI product_name)")
+    parser.add_argument("--profiles", default=None, metavar="PATH", help="추가 프로파일 JSON 파일")
+    parser.add_argument("--sysfs", default=SYSFS_USB_DEVICES)
+    args = parser.parse_args()
+
+    if args.fake:
+        print(benchmark(args.fake))
+    else:
+        if args.profiles:
+            load_profiles(args.profiles)
+        backend = SysfsUsbBackend.for_model(args.model, sysfs_root=args.sysfs)
+        result = {
+            "model": args.model or machine_model(),
+            "ports": {port: [(name, backend.device_speed(name)) for name in names]
+                      for port, names in sorted(backend.scan().items())},
+            # 프로파일 작성용: 매핑과 관계없이 보이는 모든 장치 경로
+            "devices": sorted(name for name in os.listdir(args.sysfs) if ":" not in name),
+        }
+        print(json.dumps(result, ensure_ascii=False, indent=2))
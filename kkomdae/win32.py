@@ -0,0 +1,91 @@
+# ===============================
+# Windows API 상수 및 공통 헬퍼
+# ===============================
+# user32 함수 서명과 윈도우 프로시저 서브클래싱을 한곳에서 관리합니다.
+# Windows 가 아닌 환경에서도 임포트는 되도록 ctypes.windll 사용 부분을 분리했습니다.
+import ctypes
+import sys
+from ctypes import wintypes
+
+IS_WINDOWS = sys.platform == "win32"
+
+# 플랫폼에 따라 LRESULT, LONG_PTR 타입 결정
+if ctypes.sizeof(ctypes.c_void_p) == 8:
+    LRESULT = ctypes.c_longlong
+    LONG_PTR = ctypes.c_longlong
+else:
+    LRESULT = ctypes.c_long
+    LONG_PTR = ctypes.c_long
+
+# Windows 메시지 상수
+WM_NCDESTROY = 0x0082
+WM_INPUT = 0x00FF
+WM_INPUT_DEVICE_CHANGE = 0x00FE
+GWL_WNDPROC = -4
+
+WM_DEVICECHANGE = 0x0219
+DBT_DEVNODES_CHANGED = 0x0007
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+DBT_DEVTYP_DEVICEINTERFACE = 0x00000005
+
+if IS_WINDOWS:
+    # user32 라이브러리 로드 및 함수 서명 지정
+    user32 = ctypes.windll.user32
+    user32.SetWindowLongPtrW.restype = LONG_PTR
+    user32.SetWindowLongPtrW.argtypes = [wintypes.HWND, wintypes.INT, LONG_PTR]
+    user32.CallWindowProcW.restype = LRESULT
+    user32.CallWindowProcW.argtypes = [LONG_PTR, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+    user32.DefWindowProcW.restype = LRESULT
+    user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+
+    # WNDPROC 타입 선언 (윈도우 프로시저 콜백)
+    WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+else:
+    user32 = None
+    WNDPROC = None
+
+
+class WindowSubclass:
+    """
+    hwnd 의 윈도우 프로시저를 교체합니다.
+    handler(hWnd, msg, wParam, lParam) 가 None 을 반환하면 원래 프로시저로 메시지를 넘기고,
+    정수를 반환하면 그 값을 결과로 사용합니다. 창이 파괴될 때(WM_NCDESTROY) 자동으로 복원됩니다.
+    """
+
+    def __init__(self, hwnd: int, handler):
+        self.hwnd = hwnd
+        self._handler = handler
+        # 콜백 객체가 GC 되지 않도록 참조를 유지합니다.
+        self._wnd_proc = WNDPROC(self._proc)
+        cb_func_ptr = LONG_PTR(ctypes.cast(self._wnd_proc, ctypes.c_void_p).value)
+        self._old_wnd_proc = user32.SetWindowLongPtrW(hwnd, GWL_WNDPROC, cb_func_ptr)
+
+    def detach(self) -> None:
+        """
+        원래 윈도우 프로시저를 복원합니다.
+        """
+        if self._old_wnd_proc is not None:
+            user32.SetWindowLongPtrW(self.hwnd, GWL_WNDPROC, self._old_wnd_proc)
+            old_proc, self._old_wnd_proc = self._old_wnd_proc, None
+            return old_proc
+        return None
+
+    def _proc(self, hWnd, msg, wParam, lParam):
+        if msg == WM_NCDESTROY:
+            old_proc = self.detach()
+            if old_proc:
+                return user32.CallWindowProcW(old_proc, hWnd, msg, wParam, lParam)
+            return 0
+
+        result = self._handler(hWnd, msg, wParam, lParam)
+        if result is not None:
+            return result
+
+        if not user32.IsWindow(hWnd):
+            return 0
+
+        if self._old_wnd_proc:
+            return user32.CallWindowProcW(self._old_wnd_proc, hWnd, msg, wParam, lParam)
+        else:
+            return user32.DefWindowProcW(hWnd, msg, wParam, lParam)
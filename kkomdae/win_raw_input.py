@@ -0,0 +1,190 @@
+# ===============================
+# Win32 Raw Input 키보드 백엔드
+# ===============================
+# 키보드 테스트 창의 윈도우 프로시저를 서브클래싱해 WM_INPUT 을 받고,
+# GetRawInputData / GetRawInputBuffer 로 레코드를 읽어 dispatch 로 전달합니다.
+import ctypes
+import logging
+import time
+from ctypes import wintypes
+
+from kkomdae.device_cache import DeviceClassifier
+from kkomdae.input_backends import KeyboardBackend
+from kkomdae.key_pipeline import KeyEventPipeline
+from kkomdae.raw_input_parser import RawKeyboardParser
+from kkomdae.win32 import IS_WINDOWS, WM_INPUT, WM_INPUT_DEVICE_CHANGE, WindowSubclass, user32
+
+RID_INPUT = 0x10000003
+RIDI_DEVICENAME = 0x20000007
+RIDEV_INPUTSINK = 0x00000100
+RIDEV_DEVNOTIFY = 0x00002000  # 장치 연결/해제 시 WM_INPUT_DEVICE_CHANGE 를 hwndTarget 으로 보냄
+RIDEV_NOLEGACY = 0x00000030  # legacy 메시지 차단
+RIDEV_REMOVE = 0x00000001   # Raw Input 해제 플래그
+RAW_INPUT_BATCH_SIZE = 64   # GetRawInputBuffer 한 번에 읽을 최대 레코드 수
+
+if IS_WINDOWS:
+    user32.GetRawInputData.restype = wintypes.UINT
+    user32.GetRawInputData.argtypes = [wintypes.HANDLE, wintypes.UINT, ctypes.c_void_p,
+                                       ctypes.POINTER(wintypes.UINT), wintypes.UINT]
+    user32.GetRawInputBuffer.restype = wintypes.UINT
+    user32.GetRawInputBuffer.argtypes = [ctypes.c_void_p, ctypes.POINTER(wintypes.UINT), wintypes.UINT]
+    user32.GetMessageTime.restype = wintypes.LONG
+    user32.GetMessageTime.argtypes = []
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetTickCount.restype = wintypes.DWORD
+    kernel32.GetTickCount.argtypes = []
+else:
+    kernel32 = None
+
+
+# Raw Input 관련 구조체 정의
+class RAWINPUTDEVICE(ctypes.Structure):
+    _fields_ = [
+        ("usUsagePage", ctypes.c_ushort),
+        ("usUsage", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("hwndTarget", ctypes.c_void_p)
+    ]
+
+
+# ===============================
+# Raw Input 관련 유틸리티 함수
+# ===============================
+def message_age_s() -> float:
+    """
+    창 프로시저가 처리 중인 메시지가 큐에 게시된 뒤 지난 시간(초).
+    GetMessageTime / GetTickCount 는 시스템 타이머 해상도(약 10~16ms) 단위입니다.
+    """
+    age_ms = (kernel32.GetTickCount() - user32.GetMessageTime()) & 0xFFFFFFFF
+    # 틱 카운터가 한 바퀴 돈 경우 등 음수(부호 없는 큰 값)는 0 으로 봅니다.
+    return age_ms / 1000.0 if age_ms < 0x80000000 else 0.0
+
+
+def get_device_name(hDevice: int) -> str:
+    """
+    주어진 hDevice 핸들을 통해 장치 이름을 반환합니다.
+    """
+    size = ctypes.c_uint(0)
+    if user32.GetRawInputDeviceInfoW(hDevice, RIDI_DEVICENAME, None, ctypes.byref(size)) == 0:
+        buffer = ctypes.create_unicode_buffer(size.value)
+        if user32.GetRawInputDeviceInfoW(hDevice, RIDI_DEVICENAME, buffer, ctypes.byref(size)) > 0:
+            return buffer.value
+    return None
+
+
+def register_raw_input(hwnd: int) -> None:
+    """
+    지정된 윈도우 핸들에 대해 Raw Input을 등록합니다.
+    legacy 메시지(WM_KEYDOWN 등)를 생성하지 않도록 설정하고,
+    키보드 연결/해제를 WM_INPUT_DEVICE_CHANGE 로 같은 창에 알리도록 합니다.
+    """
+    rid = RAWINPUTDEVICE()
+    rid.usUsagePage = 0x01   # Generic Desktop Controls
+    rid.usUsage = 0x06       # Keyboard
+    rid.dwFlags = RIDEV_INPUTSINK | RIDEV_NOLEGACY | RIDEV_DEVNOTIFY
+    rid.hwndTarget = hwnd
+    if not user32.RegisterRawInputDevices(ctypes.byref(rid), 1, ctypes.sizeof(rid)):
+        raise ctypes.WinError()
+
+
+def unregister_raw_input() -> None:
+    """
+    등록된 Raw Input을 해제합니다.
+    """
+    rid = RAWINPUTDEVICE()
+    rid.usUsagePage = 0x01
+    rid.usUsage = 0x06
+    rid.dwFlags = RIDEV_REMOVE
+    rid.hwndTarget = 0
+    if not user32.RegisterRawInputDevices(ctypes.byref(rid), 1, ctypes.sizeof(rid)):
+        raise ctypes.WinError()
+
+
+class RawInputBackend(KeyboardBackend):
+    """
+    Win32 Raw Input 키보드 백엔드입니다.
+    batching 이 True 이면 WM_INPUT 마다 GetRawInputBuffer 로 대기 중인 입력을 한 번에 처리합니다.
+    """
+    name = "raw_input"
+
+    def __init__(self, internal_hwids, batching: bool = True):
+        classifier = DeviceClassifier(internal_hwids, get_device_name)
+        super().__init__(classifier, KeyEventPipeline(classifier.is_internal))
+        self.batching = batching
+        self.registered = False
+        self._hwnd = None
+        self._dispatch = None
+        self._subclass = None
+
+        # WM_INPUT 처리용 파서와 재사용 버퍼 (키 입력마다 새로 할당하지 않음)
+        self._parser = RawKeyboardParser()
+        self._buffer = ctypes.create_string_buffer(self._parser.size)
+        self._size = wintypes.UINT(0)
+        self._batch_buffer = ctypes.create_string_buffer(self._parser.size * RAW_INPUT_BATCH_SIZE)
+
+    def attach(self, window, dispatch) -> None:
+        self._hwnd = window.winfo_id()
+        self._dispatch = dispatch
+        self._subclass = WindowSubclass(self._hwnd, self._wnd_proc)
+
+    def start(self) -> None:
+        # 창을 여는 사이 장치가 바뀌었을 수 있으므로 장치 분류 캐시를 비웁니다.
+        self.classifier.invalidate()
+        register_raw_input(self._hwnd)
+        self.registered = True
+
+    def stop(self) -> None:
+        if self.registered:
+            self.registered = False
+            unregister_raw_input()
+
+    def _wnd_proc(self, hWnd, msg, wParam, lParam):
+        if msg == WM_INPUT_DEVICE_CHANGE:
+            # WM_DEVICECHANGE 는 최상위 창에만 브로드캐스트되어 Tk 자식 창(winfo_id)으로는 오지 않습니다.
+            # RIDEV_DEVNOTIFY 로 받은 알림의 lParam 은 연결/해제된 hDevice 이며,
+            # 핸들이 재사용될 수 있으므로 그 장치의 분류를 지웁니다. (파서와 같은 부호 없는 값으로 변환)
+            self.classifier.forget(ctypes.c_size_t(lParam).value)
+            return 0
+
+        if msg == WM_INPUT:
+            # 레코드 timestamp 는 창 프로시저 진입 시각(perf_counter)이고, 그 전에 큐에서 기다린 시간은
+            # 해상도가 낮아(틱 단위) 키 시간 측정에 섞지 않고 queued_s 로 따로 둡니다.
+            arrived = time.perf_counter()
+            self.queued_s = message_age_s()
+            logging.debug("raw_input_wnd_proc: WM_INPUT 메시지 처리 시작")
+            records = self.read(lParam, arrived)
+            if records:
+                self._dispatch(records)
+            return 0
+        return None
+
+    def read(self, lParam, timestamp: float = None) -> list:
+        """
+        WM_INPUT 의 lParam 레코드와, (batching 모드에서) 대기 중인 Raw Input 을 모두 읽어
+        (timestamp, hDevice, VKey, MakeCode, Flags) 레코드 리스트로 반환합니다.
+        timestamp 는 메시지 수신 시각이며, 생략하면 지금 시각입니다.
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        parser = self._parser
+        records = []
+        # 미리 할당한 버퍼를 재사용해 GetRawInputData 를 한 번만 호출합니다.
+        raw_size = self._size
+        raw_size.value = parser.size
+        copied = user32.GetRawInputData(lParam, RID_INPUT, self._buffer,
+                                        ctypes.byref(raw_size), parser.header_size)
+        if copied != 0xFFFFFFFF and copied >= parser.size:
+            parser.parse_buffer(self._buffer, 1, timestamp, records)
+
+        if self.batching:
+            # 아직 처리되지 않은 입력을 GetRawInputBuffer 로 한꺼번에 가져옵니다.
+            buffer = self._batch_buffer
+            while True:
+                raw_size.value = len(buffer)
+                count = user32.GetRawInputBuffer(buffer, ctypes.byref(raw_size), parser.header_size)
+                if count == 0 or count == 0xFFFFFFFF:
+                    break
+                parser.parse_buffer(buffer, count, timestamp, records)
+                if count < RAW_INPUT_BATCH_SIZE:
+                    break
+        return records
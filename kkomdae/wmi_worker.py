@@ -0,0 +1,131 @@
+# ===============================
+# WMI 전용 작업 스레드
+# ===============================
+# WMI 질의를 Tk 메인 스레드에서 실행하면 조회가 끝날 때까지 UI 가 멈춥니다.
+# 여기서는 COM 을 초기화한 작업 스레드가 WMI 서비스에 한 번 연결해 두고
+# 요청 큐의 작업을 순서대로 처리합니다. 결과는 결과 큐에 쌓이며,
+# Tk 메인 스레드가 after 로 큐를 확인해 콜백을 호출합니다. (Tk 는 다른 스레드에서 호출하면 안 됨)
+#
+# 작업 함수는 func(wmi) 형태이며, COM 객체는 스레드(아파트먼트)에 묶여 있으므로
+# 문자열/숫자 같은 일반 파이썬 값만 반환해야 합니다.
+# 제한 시간(timeout) 안에 끝나지 않으면 오류 콜백에 TimeoutError 를 전달하고,
+# 멈춘 스레드는 버린 뒤 다음 요청부터 새 스레드/새 연결로 처리합니다.
+import itertools
+import logging
+import queue
+import threading
+import time
+
+from kkomdae.lazy import win32com
+
+DEFAULT_TIMEOUT_S = 10.0
+
+
+def connect_wmi(moniker: str = "winmgmts:"):
+    return win32com.client.GetObject(moniker)
+
+
+class WmiWorker:
+    """
+    WMI 연결을 유지하는 작업 스레드입니다.
+    root 는 결과를 전달할 Tk 위젯(after 사용)입니다.
+    """
+
+    def __init__(self, root, timeout: float = DEFAULT_TIMEOUT_S, poll_ms: int = 50, connect=connect_wmi):
+        self.root = root
+        self.timeout = timeout
+        self.poll_ms = poll_ms
+        self._connect = connect
+        self._ids = itertools.count(1)
+        self._results = queue.SimpleQueue()
+        self._requests = None
+        self._thread = None
+        # 요청 id -> (마감 시각, 콜백, 오류 콜백)
+        self._pending = {}
+        self._poll_id = None
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending)
+
+    def submit(self, func, callback, errback=None) -> int:
+        """
+        func(wmi) 를 작업 스레드에서 실행하고, 결과를 Tk 메인 스레드에서 callback(result) 로 전달합니다.
+        실패 또는 시간 초과 시 errback(exception) 을 호출합니다.
+        """
+        if self._thread is None:
+            self._start_thread()
+        request_id = next(self._ids)
+        self._pending[request_id] = (time.monotonic() + self.timeout, callback, errback)
+        self._requests.put((request_id, func))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+        return request_id
+
+    def stop(self) -> None:
+        if self._requests is not None:
+            self._requests.put(None)
+        self._requests = None
+        self._thread = None
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._pending.clear()
+
+    def _start_thread(self) -> None:
+        # 스레드마다 자기 요청 큐를 가지므로, 멈춘 스레드를 버려도 새 요청이 그 뒤에 쌓이지 않습니다.
+        self._requests = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, args=(self._requests,),
+                                        name="kkomdae-wmi", daemon=True)
+        self._thread.start()
+
+    def _run(self, requests) -> None:
+        import pythoncom
+        pythoncom.CoInitialize()
+        try:
+            wmi = None
+            while True:
+                item = requests.get()
+                if item is None:
+                    break
+                request_id, func = item
+                try:
+                    if wmi is None:
+                        wmi = self._connect()
+                    self._results.put((request_id, True, func(wmi)))
+                except Exception as e:
+                    # 연결이 끊겼을 수 있으므로 다음 요청에서 다시 연결합니다.
+                    wmi = None
+                    self._results.put((request_id, False, e))
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        try:
+            while True:
+                request_id, ok, value = self._results.get_nowait()
+                entry = self._pending.pop(request_id, None)
+                if entry is None:
+                    continue  # 이미 시간 초과로 처리된 요청
+                _, callback, errback = entry
+                if ok:
+                    callback(value)
+                elif errback is not None:
+                    errback(value)
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+        if any(deadline <= now for deadline, _, _ in self._pending.values()):
+            # 앞선 요청이 멈추면 뒤의 요청도 처리되지 않으므로 대기 중인 요청을 모두 실패 처리합니다.
+            logging.warning(f"WMI 요청이 {self.timeout}초 안에 끝나지 않아 작업 스레드를 다시 시작합니다.")
+            pending, self._pending = self._pending, {}
+            self._requests.put(None)
+            self._thread = None
+            for _, _, errback in pending.values():
+                if errback is not None:
+                    errback(TimeoutError(f"WMI 응답 없음 ({self.timeout}초 초과)"))
+
+        if self._pending:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
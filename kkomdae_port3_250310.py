@@ -1,162 +1,52 @@
 # ===============================
 # 표준 라이브러리 및 외부 라이브러리 임포트
 # ===============================
+import time
+# 모듈 임포트 시간 측정 기준점 (시작 프로파일링용)
+_IMPORT_START_NS = time.perf_counter_ns()
+
 import sys
 import os
-import re
+import argparse
 import subprocess
+import threading
 import logging
-import ctypes
-from ctypes import wintypes
-from tkinter import messagebox
+from tkinter import Canvas, messagebox
 
 # 외부 라이브러리
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 from PIL import Image, ImageTk, ImageFont, ImageDraw, ImageEnhance
-import cv2
-import win32com.client
-import psutil
-import qrcode
 
-# ===============================
-# Windows API 상수 및 구조체 정의
-# ===============================
-# 플랫폼에 따라 LRESULT, LONG_PTR 타입 결정
-if ctypes.sizeof(ctypes.c_void_p) == 8:
-    LRESULT = ctypes.c_longlong
-    LONG_PTR = ctypes.c_longlong
-else:
-    LRESULT = ctypes.c_long
-    LONG_PTR = ctypes.c_long
-
-# Windows 메시지 상수
-WM_NCDESTROY = 0x0082
-WM_INPUT = 0x00FF
-RID_INPUT = 0x10000003
-GWL_WNDPROC = -4
-RIDI_DEVICENAME = 0x20000007
-RIM_TYPEKEYBOARD = 1
-RIDEV_INPUTSINK = 0x00000100
-RIDEV_NOLEGACY = 0x00000030  # legacy 메시지 차단
-RIDEV_REMOVE = 0x00000001   # Raw Input 해제 플래그
-
-RI_KEY_BREAK = 0x01
-RI_KEY_E0 = 0x02
-
-WM_DEVICECHANGE = 0x0219
-DBT_DEVICEARRIVAL = 0x8000
-DBT_DEVICEREMOVECOMPLETE = 0x8004
-DBT_DEVTYP_DEVICEINTERFACE = 0x00000005
-
-# user32 라이브러리 로드 및 함수 서명 지정
-user32 = ctypes.windll.user32
-user32.SetWindowLongPtrW.restype = LONG_PTR
-user32.SetWindowLongPtrW.argtypes = [wintypes.HWND, wintypes.INT, LONG_PTR]
-user32.CallWindowProcW.restype = LRESULT
-user32.CallWindowProcW.argtypes = [LONG_PTR, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
-
-# Raw Input 관련 구조체 정의
-class RAWINPUTDEVICE(ctypes.Structure):
-    _fields_ = [
-        ("usUsagePage", ctypes.c_ushort),
-        ("usUsage", ctypes.c_ushort),
-        ("dwFlags", ctypes.c_ulong),
-        ("hwndTarget", ctypes.c_void_p)
-    ]
-
-class RAWINPUTHEADER(ctypes.Structure):
-    _fields_ = [
-        ("dwType", ctypes.c_uint),
-        ("dwSize", ctypes.c_uint),
-        ("hDevice", ctypes.c_void_p),
-        ("wParam", ctypes.c_ulong)
-    ]
-
-class RAWKEYBOARD(ctypes.Structure):
-    _fields_ = [
-        ("MakeCode", ctypes.c_ushort),
-        ("Flags", ctypes.c_ushort),
-        ("Reserved", ctypes.c_ushort),
-        ("VKey", ctypes.c_ushort),
-        ("Message", ctypes.c_uint),
-        ("ExtraInformation", ctypes.c_ulong)
-    ]
-
-class RAWINPUT(ctypes.Structure):
-    class _u(ctypes.Union):
-        _fields_ = [("keyboard", RAWKEYBOARD)]
-    _anonymous_ = ("u",)
-    _fields_ = [
-        ("header", RAWINPUTHEADER),
-        ("u", _u)
-    ]
-
-# WNDPROC 타입 선언 (윈도우 프로시저 콜백)
-WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
-
-# 가상 키 코드 -> 문자열 매핑 딕셔너리
-VK_MAPPING = {
-    0x30: "0",   0x31: "1",   0x32: "2",   0x33: "3",   0x34: "4",
-    0x35: "5",   0x36: "6",   0x37: "7",   0x38: "8",   0x39: "9",
-    0x41: "A",   0x42: "B",   0x43: "C",   0x44: "D",   0x45: "E",
-    0x46: "F",   0x47: "G",   0x48: "H",   0x49: "I",   0x4A: "J",
-    0x4B: "K",   0x4C: "L",   0x4D: "M",   0x4E: "N",   0x4F: "O",
-    0x50: "P",   0x51: "Q",   0x52: "R",   0x53: "S",   0x54: "T",
-    0x55: "U",   0x56: "V",   0x57: "W",   0x58: "X",   0x59: "Y",
-    0x5A: "Z",
-    0x20: "SPACE",
-    0x0D: "ENTER",
-    0x1B: "ESC",
-    0x09: "TAB",
-    0x08: "BACK",
-    0x70: "F1",  0x71: "F2",  0x72: "F3",  0x73: "F4",
-    0x74: "F5",  0x75: "F6",  0x76: "F7",  0x77: "F8",
-    0x78: "F9",  0x79: "F10", 0x7A: "F11", 0x7B: "F12",
-    0x2D: "INS",
-    0x2E: "DEL",
-    0x25: "LEFT",
-    0x26: "UP",
-    0x27: "RIGHT",
-    0x28: "DOWN",
-    0x14: "CAPS",
-    0x90: "NUMLOCK",
-    0x60: "N 0",
-    0x61: "N 1",
-    0x62: "N 2",
-    0x63: "N 3",
-    0x64: "N 4",
-    0x65: "N 5",
-    0x66: "N 6",
-    0x67: "N 7",
-    0x68: "N 8",
-    0x69: "N 9",
-    0x6A: "N *",
-    0x6B: "N +",
-    0x6C: "N ENTER",
-    0x6D: "N -",
-    0x6E: "N .",
-    0x6F: "N /",
-    0x2C: "PRT",
-    0xBB: "=",
-    0xBD: "-",
-    0xC0: "`",
-    0xDB: "[",
-    0xDD: "]",
-    0xDC: "\\",
-    0xBA: ";",
-    0xDE: "'",
-    0xBC: ",",
-    0xBE: ".",
-    0xBF: "/",
-    0xA0: "LSHIFT",
-    0xA1: "RSHIFT",
-    0x11: "CTRL",
-    0x5B: "WIN",
-    0x12: "ALT",
-    0x15: "한/영",
-    0x19: "한자",
-}
+# 무거운 라이브러리(psutil, qrcode)는 처음 사용할 때 불러옵니다. (cv2 는 kkomdae 의 카메라 모듈에서 사용)
+from kkomdae.lazy import load_all, psutil, qrcode, warm_up
+from kkomdae.asset_cache import AssetCache
+from kkomdae.startup_profiler import StartupProfiler
+from kkomdae.input_backends import create_keyboard_backend
+from kkomdae.keyboard_layout import key_geometry
+from kkomdae.usb_ports import find_usb_ports, query_usb_device_ids
+from kkomdae.usb_notify import UsbDeviceNotifier
+from kkomdae.usb_latency import EnumerationLatencyTracker
+from kkomdae.usb_sysfs import SysfsUsbBackend
+from kkomdae.usb_storage import find_usb_mounts, run_port_tests
+from kkomdae.wmi_worker import DEFAULT_TIMEOUT_S, WmiWorker
+from kkomdae.key_timing import KeyTimingTracker
+from kkomdae.rollover import RolloverTest
+from kkomdae.latency import LatencyRecorder
+from kkomdae.key_recording import KeyRecorder
+from kkomdae.camera_bench import CameraBenchmark, write_report
+from kkomdae.camera_config import FALLBACK, CameraConfigCache, probe_and_cache
+from kkomdae.machine import machine_model
+from kkomdae.frame_sources import camera_index
+from kkomdae.camera_preview import HighGuiPresenter, TkFramePresenter
+from kkomdae.camera_quality import CameraQualityAnalyzer
+from kkomdae.camera_defects import DefectScanner
+from kkomdae.qr_payload import (camera_defects_summary, camera_quality_summary, encode_results,
+                                enumeration_summary, key_timing_summary, rollover_summary, usb_storage_summary)
+
+# 시작 단계 프로파일러 (모듈 임포트 구간은 여기서 바로 기록)
+STARTUP_PROFILER = StartupProfiler(origin_ns=_IMPORT_START_NS)
+STARTUP_PROFILER.record("module import", _IMPORT_START_NS, time.perf_counter_ns())
 
 # exe 빌드 시 파일 경를 찾기 위한 함수
 def resource_path(relative_path):
@@ -167,69 +57,91 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-# ===============================
-# Raw Input 관련 유틸리티 함수
-# ===============================
-def get_device_name(hDevice: int) -> str:
-    """
-    주어진 hDevice 핸들을 통해 장치 이름을 반환합니다.
-    """
-    size = ctypes.c_uint(0)
-    if user32.GetRawInputDeviceInfoW(hDevice, RIDI_DEVICENAME, None, ctypes.byref(size)) == 0:
-        buffer = ctypes.create_unicode_buffer(size.value)
-        if user32.GetRawInputDeviceInfoW(hDevice, RIDI_DEVICENAME, buffer, ctypes.byref(size)) > 0:
-            return buffer.value
-    return None
-
-def register_raw_input(hwnd: int) -> None:
-    """
-    지정된 윈도우 핸들에 대해 Raw Input을 등록합니다.
-    legacy 메시지(WM_KEYDOWN 등)를 생성하지 않도록 설정합니다.
-    """
-    rid = RAWINPUTDEVICE()
-    rid.usUsagePage = 0x01   # Generic Desktop Controls
-    rid.usUsage = 0x06       # Keyboard
-    rid.dwFlags = RIDEV_INPUTSINK | RIDEV_NOLEGACY
-    rid.hwndTarget = hwnd
-    if not user32.RegisterRawInputDevices(ctypes.byref(rid), 1, ctypes.sizeof(rid)):
-        raise ctypes.WinError()
-
-def unregister_raw_input() -> None:
-    """
-    등록된 Raw Input을 해제합니다.
-    """
-    rid = RAWINPUTDEVICE()
-    rid.usUsagePage = 0x01
-    rid.usUsage = 0x06
-    rid.dwFlags = RIDEV_REMOVE
-    rid.hwndTarget = 0
-    if not user32.RegisterRawInputDevices(ctypes.byref(rid), 1, ctypes.sizeof(rid)):
-        raise ctypes.WinError()
-
 # ===============================
 # TestApp 클래스 정의 (메인 GUI 애플리케이션)
 # ===============================
 class TestApp(ttkb.Window):
-    def __init__(self):
-        super().__init__(themename="flatly")
+    def __init__(self, warm_up_modules: bool = True, profiler: StartupProfiler = STARTUP_PROFILER,
+                 key_latency: bool = False, record_keys: str = None,
+                 wmi_timeout: float = DEFAULT_TIMEOUT_S, camera_preview: str = "tk",
+                 camera_source: str = "0", camera_benchmark: str = None, camera_cache: str = None):
+        self.profiler = profiler
+        # 카메라 미리보기 방식: "tk" (메인 앱의 창 안에 표시) 또는 "highgui" (기존 OpenCV 창)
+        self.camera_preview_mode = camera_preview
+        # 카메라 프레임 공급원 (카메라 번호, 영상 파일, synthetic:WxH@FPS - kkomdae.frame_sources)
+        self.camera_source = camera_source
+        # 지정하면 카메라 테스트의 처리량 벤치마크 결과를 해당 JSON 파일에 저장합니다.
+        self.camera_benchmark_path = camera_benchmark
+        # WMI 질의 제한 시간(초). 넘으면 오류로 처리하고 WMI 작업 스레드를 다시 시작합니다.
+        self.wmi_timeout = wmi_timeout
+        # True 이면 키보드 테스트에서 키 입력 -> 화면 반영 지연 시간을 기록합니다.
+        self.key_latency_enabled = key_latency
+        # 지정하면 키보드 테스트의 Raw Input 레코드를 해당 파일에 녹화합니다.
+        self.record_keys_path = record_keys
+        with profiler.phase("ttkb.Window theme init"):
+            super().__init__(themename="flatly")
         self.title("KkomDae Diagnostics")
         self.geometry("1200x950")
         self.resizable(False, False)
         self._style = ttkb.Style()
 
         # 변수 및 상태 초기화
-        self._init_variables()
+        with profiler.phase("_init_variables"):
+            self._init_variables()
 
         # UI 구성
-        self.create_title_section()
+        with profiler.phase("create_title_section"):
+            self.create_title_section()
         self.create_test_items()
 
+        # mainloop 의 첫 idle 콜백까지의 시간을 기록합니다.
+        self._init_done_ns = time.perf_counter_ns()
+        self.after_idle(self._on_first_idle)
+
+        # 메인 창이 화면에 표시된 뒤 무거운 라이브러리를 백그라운드에서 미리 불러옵니다.
+        # (unbind 는 오래된 tkinter 에서 같은 이벤트의 다른 바인딩까지 지우므로 한 번만 실행되게 플래그로 막습니다.)
+        self._warm_up_started = False
+        if warm_up_modules:
+            self.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event) -> None:
+        """
+        메인 창이 처음 매핑되면 워밍업 스레드를 시작합니다.
+        """
+        if event.widget is not self or self._warm_up_started:
+            return
+        self._warm_up_started = True
+        warm_up()
+
+    def _on_first_idle(self) -> None:
+        """
+        mainloop 의 첫 idle 콜백에서 첫 화면 그리기(update_idletasks)까지 기록하고 시작 프로파일링을 마칩니다.
+        """
+        idle_ns = time.perf_counter_ns()
+        self.profiler.record("mainloop first idle", self._init_done_ns, idle_ns)
+        self.update_idletasks()
+        self.profiler.record("first paint (update_idletasks)", idle_ns, time.perf_counter_ns())
+        self.profiler.finish()
+
     def _init_variables(self) -> None:
         """
         내부 변수와 상태를 초기화합니다.
         """
         # 내부 키보드의 Raw Input device 화이트리스트
         self.INTERNAL_HWIDS = ["\\ACPI#MSF0001"]
+        # Linux 에서 내부 키보드를 판별할 sysfs 물리 경로 화이트리스트
+        self.INTERNAL_PHYS_PATHS = ["isa0060/serio0", "/devices/platform/i8042/"]
+        # 키보드 입력 백엔드 (Windows: Raw Input, Linux: evdev) - 장치 분류 캐시와 파이프라인을 가짐
+        try:
+            self.keyboard_backend = create_keyboard_backend(self.INTERNAL_HWIDS, self.INTERNAL_PHYS_PATHS)
+        except OSError as e:
+            logging.warning(f"키보드 입력 백엔드를 사용할 수 없습니다: {e}")
+            self.keyboard_backend = None
+        # 키 입력 지연 시간 기록기 (key_latency 옵션 사용 시 키보드 테스트마다 새로 생성)
+        self.key_latency = None
+        self.key_latency_report = None
+        # 키 입력 녹화기 (record_keys 옵션 사용 시 키보드 테스트마다 새로 생성)
+        self.key_recorder = None
 
         # 테스트 완료 여부 딕셔너리
         self.test_done = {
@@ -276,6 +188,9 @@ class TestApp(ttkb.Window):
         self.samsung_700_path = resource_path("SamsungOne-700.ttf")
         self.notosans_path = resource_path("NotoSansKR-VariableFont_wght.ttf")
 
+        # 렌더링된 텍스트/아이콘 이미지 캐시
+        self.asset_cache = AssetCache()
+
         # resource_path 함수를 이용해 이미지 파일의 경로를 동적으로 설정
         self.test_icons = {
             "키보드": resource_path("keyboard.png"),
@@ -298,15 +213,54 @@ class TestApp(ttkb.Window):
         # USB 관련 변수 초기화
         self.usb_ports = {"port1": False, "port2": False, "port3": False}
         self.usb_test_complete = False
+        # USB 장치 연결 알림 (USB 테스트를 처음 시작할 때 메인 창에 등록)
+        self.usb_notifier = None
+        # 포트별 연결 -> 인식 지연 시간
+        self.usb_latency = EnumerationLatencyTracker()
+        # WMI 연결을 유지하는 작업 스레드 (처음 조회할 때 시작)
+        self.wmi_worker = None
+        # Linux: sysfs USB 토폴로지 백엔드 (모델별 포트 프로파일 사용)
+        self.usb_sysfs = None
+        # USB 저장장치 속도/무결성 테스트 결과 (포트 또는 드라이브 -> 결과)
+        self.usb_storage_results = None
+        self._usb_storage_thread = None
+
+        # 카메라 캡처 스레드와 미리보기, 마지막 테스트의 캡처/표시 통계
+        self.camera_capture = None
+        self.camera_presenter = None
+        self.camera_window = None
+        self.camera_stats = None
+        self.camera_preview_stats = None
+        # 미리보기 프레임의 화질 판정 (밝기/선명도/색/노이즈)
+        self.camera_quality = None
+        self.camera_quality_result = None
+        # 여러 프레임에 걸친 불량 화소 검사 (작업 스레드)
+        self.camera_defects = None
+        self.camera_defects_result = None
+        # 카메라 열기/첫 프레임/FPS/프레임 간격 측정
+        self.camera_bench = None
+        self.camera_bench_result = None
+        # 모델별로 캐시한 카메라 백엔드/해상도/FOURCC (없으면 처음 한 번 측정)
+        self.camera_config_cache = CameraConfigCache(camera_cache)
+        self.camera_model = None
+        self.camera_config = None
+        self.camera_config_checked = False
+        self._camera_probe_thread = None
+        # 카메라 미리보기 갱신 주기(ms) - 화면 주사율 수준
+        self.camera_frame_interval_ms = 16
 
         # 배터리 리포트 파일 경로 초기화
         self.report_path = None
 
         # 키보드 테스트 관련 변수
         self.failed_keys = []
-        self.keys_not_pressed = set()
-        self.all_keys = set()
-        self.key_widgets = {}
+        # 키별 통과 여부/입력 시간 기록 (numpy 배열, 키보드 테스트를 처음 열 때 생성)
+        self.key_timing = None
+        self.key_timing_result = None
+        self.key_items = {}  # 키 심볼 -> 캔버스 사각형 아이템 id
+        # N키 롤오버 / 고스팅 테스트 (진행 중일 때만 RolloverTest) 및 마지막 결과
+        self.rollover_test = None
+        self.rollover_result = None
 
     # -------------------------------
     # UI 구성 메서드들
@@ -324,7 +278,10 @@ class TestApp(ttkb.Window):
 
         # SSAFY 로고 이미지 삽입
         img_path = resource_path("ssafy_logo.png")
-        image = Image.open(img_path).resize((80, 60), Image.LANCZOS)
+        image = self.asset_cache.get_or_render(
+            "logo", ((80, 60),), (img_path,),
+            lambda: Image.open(img_path).resize((80, 60), Image.LANCZOS)
+        )
         self.ssafy_logo = ImageTk.PhotoImage(image)
         img_label = ttkb.Label(title_frame, image=self.ssafy_logo, background="#0078D7", anchor="w")
         img_label.grid(row=0, column=0, padx=30, pady=(30, 10), sticky="w")
@@ -356,20 +313,27 @@ class TestApp(ttkb.Window):
     def create_text_image(self, text: str, size: tuple, font_path: str, font_size: int, color: tuple, align_left: bool = False) -> ImageTk.PhotoImage:
         """
         텍스트를 이미지로 변환하여 반환합니다.
+        렌더링 결과는 asset_cache 에 저장되어 다음 실행부터 재사용됩니다.
         """
-        img = Image.new("RGBA", size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        try:
-            font = ImageFont.truetype(font_path, font_size)
-        except IOError:
-            print(f"⚠️ 폰트 '{font_path}'을 찾을 수 없습니다. 기본 폰트 사용")
-            font = ImageFont.load_default()
-
-        # 텍스트 위치 계산
-        text_bbox = draw.textbbox((0, 0), text, font=font)
-        text_x = 10 if align_left else (size[0] - text_bbox[2]) // 2
-        text_y = (size[1] - font_size) // 2
-        draw.text((text_x, text_y), text, font=font, fill=color, spacing=2, stroke_width=0.2)
+        def render() -> Image.Image:
+            img = Image.new("RGBA", size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            try:
+                font = self.asset_cache.load_font(font_path, font_size)
+            except IOError:
+                print(f"⚠️ 폰트 '{font_path}'을 찾을 수 없습니다. 기본 폰트 사용")
+                font = ImageFont.load_default()
+
+            # 텍스트 위치 계산
+            text_bbox = draw.textbbox((0, 0), text, font=font)
+            text_x = 10 if align_left else (size[0] - text_bbox[2]) // 2
+            text_y = (size[1] - font_size) // 2
+            draw.text((text_x, text_y), text, font=font, fill=color, spacing=2, stroke_width=0.2)
+            return img
+
+        img = self.asset_cache.get_or_render(
+            "text", (text, tuple(size), font_size, tuple(color), align_left), (font_path,), render
+        )
         return ImageTk.PhotoImage(img)
 
     def create_test_items(self) -> None:
@@ -392,7 +356,8 @@ class TestApp(ttkb.Window):
         for idx, name in enumerate(self.tests):
             row = idx // 3  # 0,1,2 -> 0 / 3,4,5 -> 1
             col = idx % 3   # 0,3 -> 0 / 1,4 -> 1 / 2,5 -> 2
-            self._create_test_item(test_frame, name, row, col)
+            with self.profiler.phase(f"_create_test_item[{name}]"):
+                self._create_test_item(test_frame, name, row, col)
 
     def _create_test_item(self, parent, name: str, row: int, col: int) -> None:
         """
@@ -409,9 +374,13 @@ class TestApp(ttkb.Window):
         icon_frame.grid_propagate(False)
         # 아이콘 이미지 로드 및 명암(채도) 낮추기
         icon_path = self.test_icons.get(name, "default.png")
-        icon_img = Image.open(icon_path).resize((50, 50), Image.LANCZOS)
-        enhancer = ImageEnhance.Color(icon_img)
-        icon_img = enhancer.enhance(0)  # 채도를 0으로 낮춰 흑백 효과
+
+        def render_icon() -> Image.Image:
+            icon_img = Image.open(icon_path).resize((50, 50), Image.LANCZOS)
+            enhancer = ImageEnhance.Color(icon_img)
+            return enhancer.enhance(0)  # 채도를 0으로 낮춰 흑백 효과
+
+        icon_img = self.asset_cache.get_or_render("icon", ((50, 50), 0), (icon_path,), render_icon)
         icon_photo = ImageTk.PhotoImage(icon_img)
         icon_label = ttkb.Label(icon_frame, image=icon_photo,justify='center')
         icon_label.image = icon_photo  # 이미지 참조 유지
@@ -491,6 +460,18 @@ class TestApp(ttkb.Window):
                 state="disabled"
             )
             self.usb_refresh_button.grid(row=4, column=0, sticky="ew", pady=(5, 0)) # sticky="ew" 추가
+            # (선택) 꽂혀 있는 USB 메모리로 포트별 속도/무결성 테스트
+            self.usb_storage_button = ttkb.Button(
+                frame,
+                text="저장장치 속도 테스트",
+                bootstyle=SECONDARY,
+                command=self.start_usb_storage_test,
+                state="disabled"
+            )
+            self.usb_storage_button.grid(row=5, column=0, sticky="ew", pady=(5, 0))
+            # 포트별 연결 -> 인식 지연 시간 표
+            self.usb_latency_label = ttkb.Label(frame, text="", font=("맑은 고딕", 10), bootstyle="secondary")
+            self.usb_latency_label.grid(row=6, column=0, sticky="ew", pady=(5, 0))
         elif name == "배터리":
             # 기존 변수명 유지: battery_report_button
             self.battery_report_button = ttkb.Button(
@@ -563,191 +544,311 @@ class TestApp(ttkb.Window):
     # -------------------------------
     def open_keyboard_test(self) -> None:
         """
-        키보드 테스트 창을 열어 Raw Input 이벤트를 처리합니다.
+        키보드 테스트 창을 열어 키 입력 이벤트를 처리합니다.
+        창은 처음 한 번만 생성하고, 이후에는 숨겨 두었다가 다시 표시합니다.
         """
         def create_window() -> ttkb.Toplevel:
-            kb_window = ttkb.Toplevel(self)
-            kb_window.title("키보드 테스트")
-            kb_window.geometry("1200x500")
-            # 키보드 테스트 창 구성
-            info_label = ttkb.Label(kb_window, text="모든 키를 한 번씩 눌러보세요.\n완료 시 창이 닫힙니다.")
-            info_label.pack(pady=5)
-            return kb_window
-
+            kb_window = getattr(self, "kb_window_ref", None)
+            if kb_window is not None and kb_window.winfo_exists():
+                kb_window.deiconify()
+                return kb_window
+            return self._build_keyboard_window()
+
+        if self.keyboard_backend is None:
+            messagebox.showerror("키보드 오류", "이 환경에서는 키보드 테스트를 지원하지 않습니다.")
+            return
         kb_window = self.open_test_window("키보드", create_window)
         if kb_window is None:
             return
 
-        # 키보드 레이아웃 구성 (실제 키보드 레이아웃 반영)
-
-        keyboard_layout = [
-            # 첫 번째 행: ESC, F1 ~ F12, PRT, INS, DEL, N /, N *
-            [("ESC", 5), ("F1", 5), ("F2", 5), ("F3", 5), ("F4", 5), ("F5", 5),
-            ("F6", 5), ("F7", 5), ("F8", 5), ("F9", 5), ("F10", 5), ("F11", 5),
-            ("F12", 5), ("PRT", 5), ("INS", 5), ("DEL", 4), ("N /", 4), ("N *", 4)],
-            # 두 번째 행: `, 1 ~ 0, -, =, BACK, N -, N +, NUMLOCK  (총합 88)
-            [("`", 5), ("1", 5), ("2", 5), ("3", 5), ("4", 5), ("5", 5),
-            ("6", 5), ("7", 5), ("8", 5), ("9", 5), ("0", 5), ("-", 5),
-            ("=", 5), ("BACK", 8), ("N -", 5), ("N +", 5), ("NUMLOCK", 5)],
-            # 세 번째 행: TAB, Q ~ P, [, ], \, N 7, N 8, N 9 (총합 88)
-            [("TAB", 8), ("Q", 5), ("W", 5), ("E", 5), ("R", 5), ("T", 5),
-            ("Y", 5), ("U", 5), ("I", 5), ("O", 5), ("P", 5), ("[", 5),
-            ("]", 5), ("\\", 5), ("N 7", 5), ("N 8", 5), ("N 9", 5)],
-            # 네 번째 행: CAPS, A, S ~ L, ;, ', ENTER, N 4, N 5, N 6
-
-            [("CAPS", 8), ("A", 7), ("S", 5), ("D", 5), ("F", 5), ("G", 5),
-            ("H", 5), ("J", 5), ("K", 5), ("L", 5), (";", 5), ("'", 5),
-            ("ENTER", 9), ("N 4", 5), ("N 5", 5), ("N 6", 5)],
-            # 다섯 번째 행: LSHIFT, Z, X, C, V, B, N, M, ,, ., /, RSHIFT, N 1, N 2, N 3
-            [("LSHIFT", 12), ("Z", 5), ("X", 5), ("C", 5), ("V", 5), ("B", 5),
-            ("N", 5), ("M", 5), (",", 5), (".", 5), ("/", 6), ("RSHIFT", 12),
-            ("N 1", 5), ("N 2", 5), ("N 3", 5)],
-            # 여섯 번째 행: CTRL, (빈 키), WIN, ALT, SPACE, 한/영, 한자, LEFT, DOWN, UP, RIGHT, N 0, N ., N ENTER
-            [("CTRL", 5), ("", 5), ("WIN", 5), ("ALT", 5), ("SPACE", 27), ("한/영", 5),
-            ("한자", 5), ("LEFT", 5), ("DOWN", 5), ("UP", 5), ("RIGHT", 5), 
-            ("N 0", 5), ("N .", 5), ("N ENTER", 5)]
-        ]
-
-        # 키보드 레이아웃 구성 (실제 키보드 배열과 유사)
-        self.all_keys = set()
-        self.key_widgets = {}
-        for row_keys in keyboard_layout:
-            row_frame = ttkb.Frame(kb_window)
-            row_frame.pack(pady=5)
-            for key, width in row_keys:
-                if key == "":  # 빈 문자열이면 키 입력 대상에서 제외
-                    spacer = ttkb.Label(row_frame, text="", width=width)
-                    spacer.pack(side=LEFT, padx=3)
-                    continue
-                key_upper = key.upper()
-                self.all_keys.add(key_upper)
-                # 각 키의 너비를 튜플의 두 번째 요소로 지정
-                btn = ttkb.Label(row_frame, text=key, width=width, bootstyle="inverse-light",
-                                font=("맑은 고딕", 10, "bold"))
-                btn.pack(side=LEFT, padx=3)
-                self.key_widgets[key_upper] = btn
-        self.keys_not_pressed = set(self.all_keys)
-
-        # Raw Input 등록
-        hwnd = kb_window.winfo_id()
-        register_raw_input(hwnd)
-
-        # Raw Input 윈도우 프로시저 정의
-        def raw_input_wnd_proc(hWnd, msg, wParam, lParam):
-            if msg == WM_NCDESTROY:
-                if self._kb_old_wnd_proc is not None:
-                    user32.SetWindowLongPtrW(hWnd, GWL_WNDPROC, self._kb_old_wnd_proc)
-                    self._kb_old_wnd_proc = None
-                return 0
-
-            if msg == WM_INPUT:
-                logging.debug("raw_input_wnd_proc: WM_INPUT 메시지 처리 시작")
-                size = ctypes.c_uint(0)
-                if user32.GetRawInputData(lParam, RID_INPUT, None, ctypes.byref(size),
-                                          ctypes.sizeof(RAWINPUTHEADER)) == 0:
-                    buffer = ctypes.create_string_buffer(size.value)
-                    if user32.GetRawInputData(lParam, RID_INPUT, buffer, ctypes.byref(size),
-                                              ctypes.sizeof(RAWINPUTHEADER)) == size.value:
-                        raw = ctypes.cast(buffer, ctypes.POINTER(RAWINPUT)).contents
-                        if raw.header.dwType == RIM_TYPEKEYBOARD:
-                            if (raw.u.keyboard.Flags & RI_KEY_BREAK) == 0:  # Key Down 이벤트
-                                vkey = raw.u.keyboard.VKey
-                                logging.debug(f"raw_input_wnd_proc: 키 입력 감지, vkey={vkey}")
-                                # 키 심볼 결정
-                                if vkey == 0x0D:
-                                    key_sym = "N ENTER" if (raw.u.keyboard.Flags & RI_KEY_E0) else "ENTER"
-                                elif vkey == 0x10:
-                                    if raw.u.keyboard.MakeCode == 0x2A:
-                                        key_sym = "LSHIFT"
-                                    elif raw.u.keyboard.MakeCode == 0x36:
-                                        key_sym = "RSHIFT"
-                                    else:
-                                        key_sym = "SHIFT"
-                                elif vkey == 0x2D:
-                                    key_sym = "INS" if (raw.u.keyboard.Flags & RI_KEY_E0) else "NUMINS"
-                                elif vkey == 0x2E:
-                                    key_sym = "DEL" if (raw.u.keyboard.Flags & RI_KEY_E0) else "NUMDEL"
-                                elif vkey == 0x26:
-                                    key_sym = "UP" if (raw.u.keyboard.Flags & RI_KEY_E0) else "NUMUP"
-                                elif vkey == 0x25:
-                                    key_sym = "LEFT" if (raw.u.keyboard.Flags & RI_KEY_E0) else "NUMLEFT"
-                                elif vkey == 0x28:
-                                    key_sym = "DOWN" if (raw.u.keyboard.Flags & RI_KEY_E0) else "NUMDOWN"
-                                elif vkey == 0x27:
-                                    key_sym = "RIGHT" if (raw.u.keyboard.Flags & RI_KEY_E0) else "NUMRIGHT"
-                                elif vkey in VK_MAPPING:
-                                    key_sym = VK_MAPPING[vkey]
-                                else:
-                                    key_sym = None
-
-                                if key_sym:
-                                    device_name = get_device_name(raw.header.hDevice)
-                                    if device_name:
-                                        device_name_lower = device_name.lower().replace("\\", "#")
-                                        is_internal = any(
-                                            internal_id.lower().replace("\\", "#") in device_name_lower
-                                            for internal_id in self.INTERNAL_HWIDS
-                                        )
-                                    else:
-                                        is_internal = False
-                                        logging.debug(f"키: {key_sym} is_internal: {is_internal}")
-
-                                    if is_internal:
-                                        self.on_raw_key(key_sym)
-                return 0
-
-            if not user32.IsWindow(hWnd):
-                return 0
-
-            if self._kb_old_wnd_proc:
-                return user32.CallWindowProcW(self._kb_old_wnd_proc, hWnd, msg, wParam, lParam)
+        # 모든 키를 누르지 않은 상태로 초기화
+        if self.key_timing is None:
+            self.key_timing = KeyTimingTracker()
+        else:
+            self.key_timing.reset()
+        self.rollover_test = None
+        self.rollover_button.config(text="롤오버 테스트")
+        self.rollover_label.config(text="")
+        self.key_latency = LatencyRecorder() if self.key_latency_enabled else None
+        if self.record_keys_path:
+            if self.keyboard_backend.name == "raw_input":
+                try:
+                    self.key_recorder = KeyRecorder(self.record_keys_path, self.keyboard_backend.device_name)
+                except OSError as e:
+                    self.disable_key_recording(e)
             else:
-                return user32.DefWindowProcW(hWnd, msg, wParam, lParam)
+                logging.warning("키 입력 녹화는 Raw Input 백엔드에서만 지원합니다.")
+        self.kb_canvas.itemconfigure("key", fill=self._kb_idle_color, outline="", width=1)
+
+        # 입력 수신 시작 (Raw Input 등록 / evdev 장치 열기)
+        try:
+            self.keyboard_backend.start()
+        except OSError as e:
+            messagebox.showerror("키보드 오류", f"키 입력을 받을 수 없습니다:\n{e}")
+            self.close_keyboard_window()
+
+    def _build_keyboard_window(self) -> ttkb.Toplevel:
+        """
+        키보드 테스트 창과 키 배열 캔버스를 생성하고 입력 백엔드를 연결합니다.
+        """
+        kb_window = ttkb.Toplevel(self)
+        kb_window.title("키보드 테스트")
+        kb_window.geometry("1200x500")
+        # 키보드 테스트 창 구성
+        info_label = ttkb.Label(kb_window, text="모든 키를 한 번씩 눌러보세요.\n완료 시 창이 닫힙니다.")
+        info_label.pack(pady=5)
+
+        # 조합 키를 동시에 눌러 N키 롤오버 / 고스팅을 확인하는 모드
+        rollover_frame = ttkb.Frame(kb_window)
+        rollover_frame.pack(pady=5)
+        self.rollover_button = ttkb.Button(
+            rollover_frame,
+            text="롤오버 테스트",
+            bootstyle=SECONDARY,
+            command=self.on_rollover_button
+        )
+        self.rollover_button.pack(side="left", padx=5)
+        self.rollover_label = ttkb.Label(rollover_frame, text="", font=("맑은 고딕", 12))
+        self.rollover_label.pack(side="left", padx=5)
+
+        # 키 배열을 하나의 Canvas 에 한 번만 그리고, 키 상태는 사각형 색상으로 표시합니다.
+        colors = self._style.colors
+        self._kb_idle_color = colors.light      # inverse-light
+        self._kb_pressed_color = colors.dark    # inverse-dark
+        self._kb_held_color = colors.warning    # 롤오버 테스트에서 누르고 있는 키
+        self._kb_chord_color = colors.danger    # 롤오버 테스트에서 눌러야 할 조합 키 테두리
+        canvas = Canvas(kb_window, width=1200, height=280, highlightthickness=0)
+        canvas.pack(fill="both", expand=True)
+        self.key_items = {}
+        for key, (x0, y0, x1, y1) in key_geometry(canvas_width=1200):
+            self.key_items[key] = canvas.create_rectangle(
+                x0, y0, x1, y1, fill=self._kb_idle_color, outline="", tags=("key",)
+            )
+            canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=key, fill=colors.selectfg,
+                               font=("맑은 고딕", 10, "bold"))
+        self.kb_canvas = canvas
+
+        # 입력 백엔드를 창에 연결합니다. (Raw Input 윈도우 프로시저 서브클래싱 등)
+        self.keyboard_backend.attach(kb_window, self.dispatch_key_records)
 
         def on_close_keyboard_window():
             """키보드 창 종료 시 누르지 않은 키가 있으면 기록합니다."""
-            if self.keys_not_pressed:
-                unregister_raw_input()
-                self.failed_keys = list(self.keys_not_pressed)
-                self.test_status_labels["키보드"].config(text="오류 발생", bootstyle="danger")
-                self.failed_keys_button.config(state="normal")
+            if self.rollover_test is not None:
+                self.finish_rollover_test(abort=True)
+            if not self.key_timing.remaining:
+                # 모든 키를 누른 뒤 롤오버 테스트 중에 창을 닫은 경우에도 정상 완료 처리합니다.
+                self.complete_keyboard_test()
+                return
+            self.keyboard_backend.stop()
+            self.failed_keys = self.key_timing.not_pressed()
+            self.test_status_labels["키보드"].config(text="오류 발생", bootstyle="danger")
+            self.failed_keys_button.config(state="normal")
             self.close_keyboard_window()
 
         kb_window.protocol("WM_DELETE_WINDOW", on_close_keyboard_window)
-        self._raw_input_wnd_proc = WNDPROC(raw_input_wnd_proc)
-        cb_func_ptr = ctypes.cast(self._raw_input_wnd_proc, ctypes.c_void_p).value
-        cb_func_ptr = LONG_PTR(cb_func_ptr)
-        old_proc = user32.SetWindowLongPtrW(hwnd, GWL_WNDPROC, cb_func_ptr)
-        self._kb_old_wnd_proc = old_proc
-        self._kb_hwnd = hwnd
         self.kb_window_ref = kb_window
+        return kb_window
 
+    def dispatch_key_records(self, records) -> None:
+        """
+        입력 백엔드가 전달한 레코드 묶음을 파이프라인으로 처리해 눌린 키를 반영합니다.
+        지연 시간 기록기가 켜져 있으면 단계별 소요 시간을 함께 기록합니다.
+        """
+        if self.key_recorder is not None:
+            try:
+                self.key_recorder.write(records)
+            except OSError as e:
+                self.disable_key_recording(e)
+
+        pipeline = self.keyboard_backend.pipeline
+        recorder = self.key_latency
+        if recorder is None:
+            batch = pipeline.process(records)
+            self.key_timing.feed(batch.events)
+            if batch.pressed:
+                self.on_raw_keys(batch.pressed)
+            if self.rollover_test is not None:
+                self.on_rollover_events(batch.events)
+            return
+
+        # 레코드의 timestamp 는 입력 수신 시각(WM_INPUT 창 프로시저 진입 / evdev 커널 이벤트 시각)이며,
+        # 그 전에 OS 메시지 큐에서 기다린 시간(queued_s)을 더해 입력 발생부터 잽니다.
+        t_received = records[0][0] - self.keyboard_backend.queued_s
+        t_read = time.perf_counter()
+        decoded = pipeline.decode(records)
+        t_decoded = time.perf_counter()
+        batch = pipeline.coalesce(decoded)
+        t_classified = time.perf_counter()
+        recorder.add("receive", t_read - t_received)
+        recorder.add("decode", t_decoded - t_read)
+        recorder.add("device", t_classified - t_decoded)
+        self.key_timing.feed(batch.events)
+        if batch.pressed:
+            self.on_raw_keys(batch.pressed)
+            t_dispatched = time.perf_counter()
+            recorder.add("on_raw_key", t_dispatched - t_classified)
+            # 캔버스 다시 그리기는 idle 시점에 처리되므로, 그 뒤에 실행되는 idle 콜백으로 측정합니다.
+            self.after_idle(lambda: recorder.add("paint", time.perf_counter() - t_dispatched))
+        if self.rollover_test is not None:
+            self.on_rollover_events(batch.events)
+
+    def report_key_latency(self) -> None:
+        """
+        키보드 테스트 종료 시 단계별 지연 시간 백분위수를 출력합니다.
+        """
+        if self.key_latency is not None:
+            self.key_latency_report = self.key_latency.report()
+            print("⌨️ 키 입력 지연 시간 (입력 수신 -> 화면 반영)")
+            print(self.key_latency.format_report())
 
     def close_keyboard_window(self) -> None:
         """
-        키보드 테스트 종료 시 Raw Input 프로시저 복원 및 창 닫기
+        키보드 테스트 종료 시 창을 숨깁니다.
+        창과 입력 백엔드 연결은 다음 테스트에서 재사용합니다.
         """
-        if hasattr(self, '_kb_hwnd') and self._kb_hwnd and self._kb_old_wnd_proc is not None:
-            user32.SetWindowLongPtrW(self._kb_hwnd, GWL_WNDPROC, self._kb_old_wnd_proc)
-            self._kb_old_wnd_proc = None
-        if hasattr(self, 'kb_window_ref'):
-            self.kb_window_ref.destroy()
+        kb_window = getattr(self, "kb_window_ref", None)
+        if kb_window is not None and kb_window.winfo_exists():
+            kb_window.withdraw()
+        # 키별 입력 시간 통계 (아직 누르고 있는 키는 지금까지의 시간으로 판정)
+        if self.key_timing is not None:
+            self.key_timing_result = self.key_timing.summary(now=time.perf_counter())
+        # 마지막 키의 paint 단계가 기록된 뒤 보고합니다.
+        self.after_idle(self.report_key_latency)
+        if self.key_recorder is not None:
+            try:
+                self.key_recorder.close()
+            except OSError as e:
+                self.disable_key_recording(e)
+            else:
+                print(f"⌨️ 키 입력 {self.key_recorder.count}건 녹화: {self.key_recorder.path}")
+                self.key_recorder = None
         self.on_test_window_close("키보드")
 
+    def disable_key_recording(self, error: OSError) -> None:
+        """
+        녹화 파일을 열거나 쓸 수 없으면 오류를 기록하고 녹화만 중단합니다. (키보드 테스트는 계속 진행)
+        """
+        logging.error(f"키 입력 녹화를 중단합니다 ({self.record_keys_path}): {error}")
+        recorder, self.key_recorder = self.key_recorder, None
+        if recorder is not None:
+            try:
+                recorder.close()
+            except OSError:
+                pass
+
     def on_raw_key(self, key: str) -> None:
         """
         키 입력 이벤트 처리. 해당 키가 눌리면 상태 업데이트 후 모든 키 입력 시 테스트 완료.
         """
-        if key in self.keys_not_pressed:
-            self.keys_not_pressed.remove(key)
-            widget = self.key_widgets.get(key)
-            if widget:
-                widget.config(bootstyle="inverse-dark")
-            if not self.keys_not_pressed:
-                unregister_raw_input()
-                self.failed_keys_button.config(state="disabled")
-                self.close_keyboard_window()
-                self.mark_test_complete("키보드")
+        self.on_raw_keys((key,))
+
+    def on_raw_keys(self, keys) -> None:
+        """
+        한 묶음(batch)의 눌린 키들을 한 번에 반영하고, 모든 키 입력 시 테스트 완료.
+        """
+        changed = False
+        for key in keys:
+            if self.key_timing.mark_pressed(key):
+                item = self.key_items.get(key)
+                if item:
+                    self.kb_canvas.itemconfigure(item, fill=self._kb_pressed_color)
+                changed = True
+        # 롤오버 테스트 중에는 모든 키를 눌러도 창을 닫지 않고, 롤오버 테스트가 끝난 뒤 완료 처리합니다.
+        if changed and not self.key_timing.remaining and self.rollover_test is None:
+            self.complete_keyboard_test()
+
+    def complete_keyboard_test(self) -> None:
+        """
+        모든 키 입력 확인 후 키보드 테스트를 완료 처리합니다.
+        """
+        self.keyboard_backend.stop()
+        self.failed_keys_button.config(state="disabled")
+        self.close_keyboard_window()
+        self.mark_test_complete("키보드")
+
+    # -------------------------------
+    # N키 롤오버 / 고스팅 테스트
+    # -------------------------------
+    def on_rollover_button(self) -> None:
+        """
+        롤오버 테스트를 시작하거나, 진행 중이면 현재 조합을 실패로 기록하고 건너뜁니다.
+        """
+        if self.rollover_test is None:
+            self.rollover_test = RolloverTest()
+            self.rollover_button.config(text="다음 조합 (건너뛰기)")
+            self.update_rollover_prompt()
+            return
+        self.rollover_test.skip()
+        if self.rollover_test.done:
+            self.finish_rollover_test()
+        else:
+            self.update_rollover_prompt()
+
+    def update_rollover_prompt(self) -> None:
+        """
+        진행 중인 조합의 안내 문구와 조합 키 테두리를 표시합니다.
+        """
+        test = self.rollover_test
+        name, keys = test.current_chord
+        self.rollover_label.config(
+            text=f"[{test.current + 1}/{len(test.chords)}] {name}: {', '.join(keys)} 를 동시에 누르세요."
+        )
+        self.kb_canvas.itemconfigure("key", outline="", width=1)
+        for key in keys:
+            item = self.key_items.get(key)
+            if item:
+                self.kb_canvas.itemconfigure(item, outline=self._kb_chord_color, width=3)
+
+    def on_rollover_events(self, events) -> None:
+        """
+        Make/Break 이벤트를 롤오버 테스트에 반영하고, 누르고 있는 키를 캔버스에 표시합니다.
+        """
+        test = self.rollover_test
+        advanced = test.feed(events)
+        canvas = self.kb_canvas
+        for _, sym, is_down in events:
+            item = self.key_items.get(sym)
+            if not item:
+                continue
+            if is_down:
+                fill = self._kb_held_color
+            elif not self.key_timing.is_pressed(sym):
+                fill = self._kb_idle_color
+            else:
+                fill = self._kb_pressed_color
+            canvas.itemconfigure(item, fill=fill)
+        if test.done:
+            self.finish_rollover_test()
+        elif advanced:
+            self.update_rollover_prompt()
+
+    def finish_rollover_test(self, abort: bool = False) -> None:
+        """
+        롤오버 테스트 결과를 저장하고 요약을 표시합니다.
+        abort 이면 남은 조합을 실패로 기록합니다. (키보드 창을 닫은 경우)
+        """
+        test = self.rollover_test
+        if abort:
+            test.abort()
+        self.rollover_test = None
+        self.rollover_result = test.result()
+        if abort:
+            return
+        blocked = sorted({key for chord in self.rollover_result["chords"] for key in chord["blocked"]})
+        ghost = sorted({key for chord in self.rollover_result["chords"] for key in chord["ghost"]})
+        summary = f"롤오버 결과: 최대 동시 입력 {self.rollover_result['max_simultaneous']}키"
+        if blocked:
+            summary += f" / 차단: {', '.join(blocked)}"
+        if ghost:
+            summary += f" / 고스트: {', '.join(ghost)}"
+        self.rollover_label.config(text=summary)
+        self.rollover_button.config(text="롤오버 테스트")
+        self.kb_canvas.itemconfigure("key", outline="", width=1)
+        for key in self.key_items:
+            fill = self._kb_pressed_color if self.key_timing.is_pressed(key) else self._kb_idle_color
+            self.kb_canvas.itemconfigure(self.key_items[key], fill=fill)
+        if not self.key_timing.remaining:
+            self.complete_keyboard_test()
 
     def show_failed_keys(self) -> None:
         """
@@ -774,36 +875,184 @@ class TestApp(ttkb.Window):
         """
         self.usb_test_complete = False
         self.usb_refresh_button.config(state="normal", bootstyle="info")
+        self.usb_storage_button.config(state="normal")
         self.test_status_labels["USB"].config(text="테스트 중", bootstyle="warning")
+        # 장치를 꽂는 즉시 포트 상태가 갱신되도록 USB 장치 알림을 등록합니다. (새로고침은 보조 수단)
+        if self.usb_notifier is None:
+            try:
+                self.usb_notifier = UsbDeviceNotifier(int(self.wm_frame(), 16), self.on_usb_device_change,
+                                                      self.usb_latency.plug_signal)
+            except OSError as e:
+                logging.warning(f"USB 장치 알림을 등록할 수 없습니다: {e}")
         self.refresh_usb_check()
 
     def refresh_usb_check(self) -> None:
         """
-        USB 연결 상태를 확인하여 UI 업데이트 후 모든 포트 연결시 테스트 완료 처리
+        USB 연결 상태를 조회합니다.
+        Windows 는 WMI 작업 스레드에서 조회해 on_usb_device_ids 로, Linux 는 sysfs 를 바로 스캔합니다.
+        """
+        if sys.platform.startswith("linux"):
+            # sysfs 스캔은 디렉터리 목록 한 번만 읽으므로 메인 스레드에서 처리합니다.
+            try:
+                if self.usb_sysfs is None:
+                    self.usb_sysfs = SysfsUsbBackend.for_model()
+                self.on_usb_ports(self.usb_sysfs.connected_ports())
+            except OSError as e:
+                messagebox.showerror("USB Error", f"USB 포트 확인 중 오류 발생:\n{e}")
+            return
+        if self.wmi_worker is None:
+            self.wmi_worker = WmiWorker(self, timeout=self.wmi_timeout)
+        if self.wmi_worker.busy:
+            return
+        # 조회하는 동안 UI 는 그대로 동작하며, 새로고침 버튼만 잠시 비활성화합니다.
+        self.usb_refresh_button.config(state="disabled")
+        # WQL 필터로 USB 장치의 PNPDeviceID 만 조회합니다.
+        self.wmi_worker.submit(query_usb_device_ids, self.on_usb_device_ids, self.on_usb_query_error)
+
+    def on_usb_device_ids(self, device_ids) -> None:
+        """
+        WMI USB 장치 조회 결과(PNPDeviceID 목록) 처리
+        """
+        if not self.usb_test_complete:
+            self.usb_refresh_button.config(state="normal")
+        self.on_usb_ports(find_usb_ports(device_ids))
+
+    def on_usb_ports(self, port_numbers) -> None:
+        """
+        장치가 연결된 포트 번호들로 UI 업데이트 후 모든 포트 연결시 테스트 완료 처리
+        """
+        for port_number in port_numbers:
+            self.set_usb_port_connected(port_number)
+        self.check_usb_complete()
+
+    def on_usb_query_error(self, error: Exception) -> None:
+        if not self.usb_test_complete:
+            self.usb_refresh_button.config(state="normal")
+        messagebox.showerror("USB Error", f"USB 포트 확인 중 오류 발생:\n{error}")
+
+    def on_usb_device_change(self, port_number: int, arrived: bool, pnp_id: str, timestamp: float) -> None:
+        """
+        USB 장치 알림 처리. 새로 연결된 장치의 포트만 갱신하고 연결 -> 인식 지연 시간을 기록합니다.
+        윈도우 프로시저 안에서 호출되므로 UI 갱신은 Tk 이벤트 루프로 넘깁니다.
         """
+        if not arrived:
+            self.usb_latency.removed(timestamp)
+            return
+
+        def update():
+            # 포트 라벨에 반영되는 시점까지를 지연 시간으로 봅니다.
+            if f"port{port_number}" in self.usb_ports:
+                latency_ms = self.usb_latency.enumerated(port_number, time.perf_counter())
+                if latency_ms is not None:
+                    self.update_usb_latency_table(port_number, latency_ms)
+            if not self.usb_test_complete and self.set_usb_port_connected(port_number):
+                self.check_usb_complete()
+
+        self.after(0, update)
+
+    def update_usb_latency_table(self, port_number: int, latency_ms: float) -> None:
+        """
+        포트별 인식 지연 시간 표를 갱신하고, 기준을 넘으면 경고합니다.
+        """
+        table = self.usb_latency.table()
+        self.usb_latency_label.config(
+            text="  ".join(f"port{port}: {row['last_ms']:.0f}ms" for port, row in table.items()),
+            bootstyle="warning" if any(row["slow"] for row in table.values()) else "secondary"
+        )
+        if latency_ms > self.usb_latency.warn_ms:
+            logging.warning(f"port{port_number} 인식 지연 {latency_ms:.0f}ms (기준 {self.usb_latency.warn_ms:.0f}ms)")
+
+    def set_usb_port_connected(self, port_number: int) -> bool:
+        """
+        포트를 연결됨으로 표시합니다. 새로 확인된 포트면 True 를 반환합니다.
+        """
+        key = f"port{port_number}"
+        if key not in self.usb_ports or self.usb_ports[key]:
+            return False
+        self.usb_ports[key] = True
+        self.usb_port[port_number-1].config(text=key, bootstyle="info")
+        return True
+
+    def find_usb_storage_targets(self) -> dict:
+        """
+        저장장치 테스트 대상을 {이름: (디렉터리, 버스, 협상 속도 Mbps)} 로 반환합니다.
+        Linux 는 포트별 마운트 위치와 협상 속도를 찾고, Windows 는 이동식 드라이브를 드라이브 문자로 표시합니다.
+        (Windows 는 드라이브와 포트의 대응과 협상 속도를 알 수 없어 같은 그룹으로 두고 순서대로 테스트하며,
+        USB 2.0 여부는 읽기 속도로 추정합니다.)
+        """
+        if sys.platform.startswith("linux"):
+            if self.usb_sysfs is None:
+                self.usb_sysfs = SysfsUsbBackend.for_model()
+            return {f"port{port}": target for port, target in find_usb_mounts(self.usb_sysfs).items()}
+        return {
+            partition.device.rstrip("\\"): (partition.mountpoint, "removable", None)
+            for partition in psutil.disk_partitions()
+            if "removable" in partition.opts
+        }
+
+    def start_usb_storage_test(self) -> None:
+        """
+        USB 저장장치 속도/무결성 테스트를 작업 스레드에서 실행합니다.
+        """
+        if self._usb_storage_thread is not None:
+            return
         try:
-            wmi_obj = win32com.client.GetObject("winmgmts:")
-            pnp_entities = wmi_obj.InstancesOf("Win32_PnPEntity")
-            for entity in pnp_entities:
-                if hasattr(entity, 'PNPDeviceID') and entity.PNPDeviceID:
-                    device_path = entity.PNPDeviceID.upper()
-                    if not device_path.startswith("USB\\"):
-                        continue
-                    match = re.search(r'&0&(\d)$', device_path)
-                    if match:
-                        port_number = match.group(1)
-                        if port_number in ['1', '2', '3']:
-                            key = f"port{port_number}"
-                            self.usb_ports[key] = True
-                            self.usb_port[int(port_number)-1].config(text=key, bootstyle="info")
-            if all(self.usb_ports.values()):
-                self.usb_test_complete = True
-                self.usb_refresh_button.config(state="disabled")
-                self.mark_test_complete("USB")
-                messagebox.showinfo("USB Test", "모든 USB 포트 테스트 완료!")
-                self.test_status_labels["USB"].config(text="테스트 완료", bootstyle="info")
-        except Exception as e:
-            messagebox.showerror("USB Error", f"USB 포트 확인 중 오류 발생:\n{e}")
+            targets = self.find_usb_storage_targets()
+        except OSError as e:
+            messagebox.showerror("USB 저장장치", f"저장장치를 찾는 중 오류 발생:\n{e}")
+            return
+        if not targets:
+            messagebox.showinfo("USB 저장장치", "테스트할 USB 저장장치가 없습니다.\n포트에 USB 메모리를 꽂은 후 다시 시도하세요.")
+            return
+
+        results = {}
+
+        def run():
+            results.update(run_port_tests(targets))
+
+        self.usb_storage_button.config(state="disabled", text="저장장치 테스트 중...")
+        self._usb_storage_thread = threading.Thread(target=run, name="kkomdae-usb-storage", daemon=True)
+        self._usb_storage_thread.start()
+        self.after(200, self._poll_usb_storage_test, results)
+
+    def _poll_usb_storage_test(self, results: dict) -> None:
+        if self._usb_storage_thread.is_alive():
+            self.after(200, self._poll_usb_storage_test, results)
+            return
+        self._usb_storage_thread = None
+        self.usb_storage_results = results
+        self.usb_storage_button.config(state="normal", text="저장장치 속도 테스트")
+        lines = []
+        for name, result in sorted(results.items()):
+            if "error" in result:
+                lines.append(f"{name}: 오류 ({result['error']})")
+                continue
+            line = f"{name}: 쓰기 {result['write_mb_s']} MB/s, 읽기 {result['read_mb_s']} MB/s"
+            if result["ok"] is None:
+                line += " - 검증 불가 (캐시 우회 실패, 읽기 속도/무결성 미확인)"
+            elif not result["ok"]:
+                line += " - 데이터 불일치!"
+            elif result["usb2_suspect"]:
+                if result["usb2_by"] == "link":
+                    line += f" - USB 2.0 으로 연결됨 ({result['link_mbps']:g} Mbps)"
+                else:
+                    line += " - USB 2.0 속도 의심 (읽기 속도로 추정)"
+            lines.append(line)
+        if not sys.platform.startswith("linux"):
+            lines.append("\n※ 드라이브 문자별 결과입니다. 어느 USB 포트에 꽂힌 장치인지는 확인하지 않으며,\n"
+                         "  USB 2.0 여부는 읽기 속도로 추정한 값이라 느린 USB 메모리도 의심으로 표시됩니다.")
+        messagebox.showinfo("USB 저장장치 테스트 결과", "\n".join(lines))
+
+    def check_usb_complete(self) -> None:
+        """
+        모든 포트가 확인되면 USB 테스트를 완료 처리합니다.
+        """
+        if not self.usb_test_complete and all(self.usb_ports.values()):
+            self.usb_test_complete = True
+            self.usb_refresh_button.config(state="disabled")
+            self.mark_test_complete("USB")
+            messagebox.showinfo("USB Test", "모든 USB 포트 테스트 완료!")
+            self.test_status_labels["USB"].config(text="테스트 완료", bootstyle="info")
 
     # -------------------------------
     # 카메라 테스트 관련 메서드
@@ -816,42 +1065,189 @@ class TestApp(ttkb.Window):
             messagebox.showinfo("정보", "카메라 테스트가 이미 실행 중입니다.")
             return
         self.camera_test_running = True
-        self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+        index = camera_index(self.camera_source)
+        if index is not None and not self.camera_config_checked:
+            self.camera_config_checked = True
+            self.camera_model = machine_model()
+            cached = self.camera_config_cache.get(self.camera_model, index)
+            if cached is None:
+                self.start_camera_probe(index)
+                return
+            # FALLBACK: 최근 측정에서 쓸 수 있는 설정이 없었으므로 다시 측정하지 않고 기본 설정으로 엽니다.
+            self.camera_config = None if cached == FALLBACK else cached
+            logging.info(f"캐시된 카메라 설정 사용: {cached}")
+        self.start_camera_capture()
+
+    def start_camera_probe(self, index: int) -> None:
+        """
+        이 모델의 캐시된 카메라 설정이 없으면 후보 설정을 작업 스레드에서 한 번 측정해 저장합니다.
+        """
+        results = {}
+
+        def run():
+            try:
+                results["best"], _ = probe_and_cache(index, self.camera_config_cache, self.camera_model)
+            except Exception as e:
+                results["error"] = e
+
+        self.test_status_labels["카메라"].config(text="카메라 설정 확인 중", bootstyle="warning")
+        self._camera_probe_thread = threading.Thread(target=run, name="kkomdae-camera-probe", daemon=True)
+        self._camera_probe_thread.start()
+        self.after(200, self._poll_camera_probe, results)
+
+    def _poll_camera_probe(self, results: dict) -> None:
+        if self._camera_probe_thread.is_alive():
+            self.after(200, self._poll_camera_probe, results)
+            return
+        self._camera_probe_thread = None
+        if "error" in results:
+            logging.error(f"카메라 설정 측정 실패: {results['error']}")
+        self.camera_config = results.get("best")
+        logging.info(f"측정한 카메라 설정: {self.camera_config}")
+        self.test_status_labels["카메라"].config(text=self.test_status_ing["카메라"], bootstyle="warning")
+        self.start_camera_capture()
+
+    def start_camera_capture(self) -> None:
+        """
+        카메라를 열고 캡처 스레드와 미리보기를 시작합니다.
+        """
+        # 열기 시간과 프레임 시각은 벤치마크 모드가 아니어도 기록합니다. (고정 크기 배열, 로그용)
+        self.camera_bench = CameraBenchmark(self.camera_source)
+        self.camera_bench_result = None
+        self.cap = self.camera_bench.open(config=self.camera_config)
+        if not self.cap.isOpened() and self.camera_config is not None:
+            # 캐시된 설정으로 열리지 않으면 (드라이버 변경 등) 캐시를 지우고 기본 설정으로 엽니다.
+            logging.warning(f"카메라 설정 {self.camera_config} 로 열 수 없어 기본 설정으로 엽니다.")
+            self.camera_config_cache.forget(self.camera_model, camera_index(self.camera_source))
+            self.camera_config = None
+            self.camera_bench = CameraBenchmark(self.camera_source)
+            self.cap = self.camera_bench.open()
         if not self.cap.isOpened():
             messagebox.showerror("카메라 오류", "카메라를 열 수 없습니다. 장치를 확인해주세요.")
             self.camera_test_running = False
             return
-        self.window_name = "Camera Test - X to exit"
-        cv2.namedWindow(self.window_name)
+        # 캡처는 별도 스레드에서 미리 할당한 프레임 링에 읽어 넣습니다.
+        self.camera_capture = self.camera_bench.start()
+        self.camera_quality = CameraQualityAnalyzer()
+        self.camera_defects = DefectScanner(fourcc=self.camera_bench.format["fourcc"])
+        if self.camera_preview_mode == "highgui":
+            self.camera_presenter = HighGuiPresenter("Camera Test - X to exit")
+        else:
+            self.camera_presenter = TkFramePresenter(self._build_camera_window())
         self.update_camera_frame()
 
+    def _build_camera_window(self) -> ttkb.Label:
+        """
+        카메라 미리보기 창(Toplevel)을 만들고 프레임을 표시할 Label 을 반환합니다.
+        """
+        cam_window = ttkb.Toplevel(self)
+        cam_window.title("카메라 테스트")
+        info_label = ttkb.Label(cam_window, text="카메라 화면을 확인한 후 창을 닫아주세요.")
+        info_label.pack(pady=5)
+        preview_label = ttkb.Label(cam_window)
+        preview_label.pack(padx=10, pady=(0, 10))
+        cam_window.protocol("WM_DELETE_WINDOW", self.close_camera_test)
+        cam_window.bind("<Escape>", lambda e: self.close_camera_test())
+        self.camera_window = cam_window
+        return preview_label
+
     def update_camera_frame(self) -> None:
         """
-        Tkinter after()를 이용하여 주기적으로 카메라 프레임을 업데이트합니다.
+        Tkinter after()를 이용하여 화면 갱신 주기마다 가장 최근 프레임을 표시합니다.
         """
         if not self.camera_test_running:
             return
-        ret, frame = self.cap.read()
-        if not ret:
-            messagebox.showerror("카메라 오류", "카메라 프레임을 읽을 수 없습니다.")
+        capture = self.camera_capture
+        if capture.error:
+            messagebox.showerror("카메라 오류", capture.error)
             self.close_camera_test()
             return
-        cv2.imshow(self.window_name, frame)
-        key = cv2.waitKey(1) & 0xFF
-        if key == 27 or cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) < 1:
+        latest = capture.latest()
+        if latest is not None:
+            _, frame, timestamp = latest
+            self.camera_presenter.show(frame)
+            self.camera_quality.offer(frame, timestamp)
+            if not self.camera_defects.done:
+                self.camera_defects.offer(frame)
+        if self.camera_bench_result is None and self.camera_bench.window_elapsed:
+            self.finish_camera_benchmark()
+        if not self.camera_presenter.pump():
             self.close_camera_test()
             return
-        self.after(10, self.update_camera_frame)
+        self.after(self.camera_frame_interval_ms, self.update_camera_frame)
 
     def close_camera_test(self) -> None:
         """
         카메라 테스트 종료 후 자원 해제 및 상태 복원.
         """
-        self.cap.release()
-        cv2.destroyAllWindows()
-        self.mark_test_complete("카메라")
+        if not self.camera_test_running:
+            return
+        if self.camera_bench_result is None and self.camera_capture is not None:
+            # 측정 구간이 끝나기 전에 닫은 경우 (complete: false)
+            self.finish_camera_benchmark()
+        if self.camera_capture is not None:
+            # cap 해제는 캡처 스레드가 cap.read() 에서 빠져나온 뒤 스레드 안에서 합니다.
+            if not self.camera_capture.close():
+                logging.warning("카메라 캡처 스레드가 아직 종료되지 않아 종료 후 해제합니다.")
+            self.camera_stats = self.camera_capture.stats()
+            logging.info(f"카메라 캡처 통계: {self.camera_stats}")
+            self.camera_capture = None
+        if self.camera_presenter is not None:
+            self.camera_preview_stats = dict(self.camera_presenter.stats.as_dict(), mode=self.camera_presenter.name)
+            logging.info(f"카메라 미리보기 통계: {self.camera_preview_stats}")
+            self.camera_presenter.close()
+            self.camera_presenter = None
+        if self.camera_window is not None:
+            self.camera_window.destroy()
+            self.camera_window = None
         self.camera_test_running = False
-        self.test_status_labels["카메라"].config(text="테스트 완료", bootstyle="info")
+        self.camera_quality_result = self.camera_quality.verdict()
+        self.camera_quality = None
+        self.camera_defects_result = self.camera_defects.stop()
+        if self.camera_defects.error:
+            logging.error(f"불량 화소 검사 오류: {self.camera_defects.error}")
+        self.camera_defects = None
+        defects = self.camera_defects_result
+        if defects is not None and not defects["pass"]:
+            self.camera_quality_result["pass"] = False
+            self.camera_quality_result["reasons"].append(
+                f"불량 화소 {defects['defects']}개 (hot {defects['hot']}, dead {defects['dead']}, stuck {defects['stuck']})"
+            )
+        if defects is not None and not defects["verified"]:
+            logging.warning(f"압축 형식({self.camera_bench.format['fourcc']})으로 받은 프레임이라 불량 화소를 확인할 수 없습니다.")
+        logging.info(f"카메라 불량 화소 검사: {defects}")
+        logging.info(f"카메라 화질 판정: {self.camera_quality_result}")
+        if self.camera_quality_result["pass"]:
+            self.mark_test_complete("카메라")
+            self.test_status_labels["카메라"].config(text="테스트 완료", bootstyle="info")
+            return
+        self.test_status_labels["카메라"].config(text="화질 불량", bootstyle="danger")
+        # 자동 판정이 틀릴 수 있으므로(장면, 조명 등) 화면을 직접 확인한 검사자가 통과시킬 수 있게 합니다.
+        override = messagebox.askyesno(
+            "카메라 화질",
+            "카메라 화질 판정 실패:\n" + "\n".join(self.camera_quality_result["reasons"]) +
+            "\n\n미리보기 화면이 정상이었다면 '예'를 눌러 수동 통과 처리합니다.\n"
+            "'아니오'를 누르면 카메라 테스트를 다시 실행할 수 있습니다."
+        )
+        if override:
+            self.camera_quality_result["override"] = True
+            logging.warning(f"카메라 화질 수동 통과: {self.camera_quality_result['reasons']}")
+            self.mark_test_complete("카메라")
+            self.test_status_labels["카메라"].config(text="수동 통과", bootstyle="warning")
+
+    def finish_camera_benchmark(self) -> None:
+        """
+        카메라 벤치마크 결과를 기록하고, 벤치마크 모드이면 JSON 파일로 저장합니다.
+        """
+        self.camera_bench_result = self.camera_bench.report()
+        logging.info(f"카메라 벤치마크: open {self.camera_bench_result['open_ms']}ms, "
+                     f"첫 프레임 {self.camera_bench_result['first_frame_ms']}ms, "
+                     f"{self.camera_bench_result.get('fps')} FPS")
+        if self.camera_benchmark_path:
+            try:
+                write_report(self.camera_bench_result, self.camera_benchmark_path)
+            except OSError as e:
+                logging.error(f"카메라 벤치마크 결과 저장 실패: {e}")
 
     # -------------------------------
     # 충전 테스트 관련 메서드
@@ -930,26 +1326,39 @@ class TestApp(ttkb.Window):
     def generate_qr_code(self) -> None:
         """
         테스트 결과를 JSON 형식으로 구성 후 QR 코드를 생성하여 표시합니다.
+        QR 에는 통과 여부와 핵심 수치만 넣고, 상세 결과는 로그에 남깁니다.
         """
-        import json
         results = {
             "keyboard": {
                 "status": "pass" if self.test_done.get("키보드") else "fail",
-                "failed_keys": sorted(self.failed_keys) if not self.test_done.get("키보드") else []
+                "failed_keys": sorted(self.failed_keys) if not self.test_done.get("키보드") else [],
+                "rollover": rollover_summary(self.rollover_result),
+                "timing": key_timing_summary(self.key_timing_result)
             },
             "usb": {
                 "status": "pass" if self.test_done.get("USB") else "fail",
-                "failed_ports": [port for port, connected in self.usb_ports.items() if not connected]
+                "failed_ports": [port for port, connected in self.usb_ports.items() if not connected],
+                "storage": usb_storage_summary(self.usb_storage_results,
+                                               by_drive=not sys.platform.startswith("linux")),
+                "enumeration_ms": enumeration_summary(
+                    {f"port{port}": row for port, row in self.usb_latency.table().items()}
+                )
             },
             "camera": {
-                "status": "pass" if self.test_done.get("카메라") else "fail"
+                # 수동 통과는 요약(통과 여부만) QR 에서도 구분되도록 status 에 표시합니다.
+                "status": ("override" if (self.camera_quality_result or {}).get("override") else "pass")
+                if self.test_done.get("카메라") else "fail",
+                "quality": camera_quality_summary(self.camera_quality_result),
+                "defects": camera_defects_summary(self.camera_defects_result)
             },
             "charger": {
                 "status": "pass" if self.test_done.get("충전") else "fail"
             },
             "battery_report": "생성됨" if self.report_path and os.path.exists(self.report_path) else "생성되지 않음"
         }
-        qr_data = json.dumps(results, ensure_ascii=False, indent=2)
+        qr_data, summarized = encode_results(results)
+        if summarized:
+            logging.warning(f"QR 데이터가 너무 커서 통과 여부만 넣습니다: {results}")
         try:
             qr = qrcode.QRCode(
                 version=None,
@@ -974,6 +1383,55 @@ class TestApp(ttkb.Window):
 # ===============================
 # 애플리케이션 실행
 # ===============================
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KkomDae Diagnostics")
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="-", default=None, metavar="PATH",
+        help="시작 단계별 소요 시간을 JSON 으로 출력합니다. (PATH 생략 시 표준 출력)"
+    )
+    parser.add_argument(
+        "--eager-imports", action="store_true",
+        help="지연 로딩 이전처럼 cv2/psutil/win32com/qrcode 를 창보다 먼저 불러옵니다. (--profile-startup 비교용)"
+    )
+    parser.add_argument(
+        "--key-latency", action="store_true",
+        help="키보드 테스트에서 키 입력 -> 화면 반영 단계별 지연 시간(p50/p95/p99)을 출력합니다."
+    )
+    parser.add_argument(
+        "--record-keys", default=None, metavar="PATH",
+        help="키보드 테스트의 Raw Input 레코드를 PATH 에 녹화합니다. (python -m kkomdae.key_recording 으로 재생)"
+    )
+    parser.add_argument(
+        "--wmi-timeout", type=float, default=DEFAULT_TIMEOUT_S, metavar="SECONDS",
+        help=f"WMI 질의 제한 시간(초). 기본값 {DEFAULT_TIMEOUT_S}"
+    )
+    parser.add_argument(
+        "--camera-preview", choices=("tk", "highgui"), default="tk",
+        help="카메라 미리보기 방식 (tk: 앱 창 안에 표시, highgui: OpenCV 창). 종료 시 FPS/CPU 통계를 기록합니다."
+    )
+    parser.add_argument(
+        "--camera-source", default="0", metavar="SOURCE",
+        help="카메라 테스트의 프레임 공급원: 카메라 번호, 영상 파일 경로 또는 synthetic:WxH@FPS (기본: 0)"
+    )
+    parser.add_argument(
+        "--camera-benchmark", default=None, metavar="PATH",
+        help="카메라 열기 시간, 첫 프레임 시간, FPS, 프레임 간격 분포, 누락 수를 PATH 에 JSON 으로 저장합니다."
+    )
+    parser.add_argument(
+        "--camera-cache", default=None, metavar="PATH",
+        help="모델별 카메라 설정 캐시 파일 (기본: KKOMDAE_CAMERA_CACHE 환경 변수 > 실행 파일 옆 > 사용자 캐시)"
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    app = TestApp()
+    args = parse_args()
+    STARTUP_PROFILER.output = args.profile_startup
+    if args.eager_imports:
+        with STARTUP_PROFILER.phase("eager imports"):
+            load_all()
+    app = TestApp(warm_up_modules=not args.eager_imports, key_latency=args.key_latency, record_keys=args.record_keys,
+                  wmi_timeout=args.wmi_timeout, camera_preview=args.camera_preview,
+                  camera_source=args.camera_source, camera_benchmark=args.camera_benchmark,
+                  camera_cache=args.camera_cache)
     app.mainloop()